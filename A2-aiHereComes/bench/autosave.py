@@ -0,0 +1,71 @@
+"""Autosave benchmark: frame cost of a synchronous save vs the background writer.
+
+Runs a bench scenario at 60 frames per second (one tick of work per frame,
+then sleeping out the frame like the game loop does) and saves every
+``--every`` frames, either on the game thread or through SaveWriter.
+Reports the game-thread cost per frame (average and worst) and the
+longest time a save call held up the game thread.
+Run from the project root:  python -m bench.autosave [--scenario catapults] [--frames 600]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from bench.scenarios import SCENARIOS  # noqa: E402
+from constants import FPS  # noqa: E402
+from core.simulation import Simulation  # noqa: E402
+from save import snapshot  # noqa: E402
+from save.autosave import SaveWriter  # noqa: E402
+from save.save_manager import SaveManager  # noqa: E402
+
+
+def run(mode: str, args):
+    sim = Simulation(seed=args.seed)
+    SCENARIOS[args.scenario](sim)
+    for _ in range(args.warmup):
+        sim.step()
+    writer = SaveWriter(slots=3)
+    frame_time = 1.0 / FPS
+    costs = []
+    save_cost = 0.0
+    for frame in range(args.frames):
+        start = time.perf_counter()
+        sim.step()
+        if mode != "none" and frame % args.every == 0:
+            save_start = time.perf_counter()
+            if mode == "sync":
+                SaveManager.save_game(snapshot.capture(sim), "bench.sav")
+            else:
+                writer.autosave(snapshot.freeze(sim))
+            save_cost = max(save_cost, time.perf_counter() - save_start)
+        writer.poll()
+        cost = time.perf_counter() - start
+        costs.append(cost)
+        time.sleep(max(0.0, frame_time - cost))
+    writer.flush()
+    return costs, save_cost
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="catapults")
+    parser.add_argument("--warmup", type=int, default=900, help="ticks before measuring")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--every", type=int, default=60, help="frames between saves")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    SaveManager.SAVE_DIR = tempfile.mkdtemp(prefix="zc-saves-")
+    print(f"{args.scenario}: {args.frames} frames, a save every {args.every} frames")
+    print(f"  {'':<16} {'avg ms':>7} {'worst ms':>9} {'save call ms':>13}")
+    for mode, label in (("none", "no saves"), ("sync", "save on frame"), ("writer", "SaveWriter")):
+        costs, save_cost = run(mode, args)
+        print(f"  {label:<16} {sum(costs) * 1000.0 / len(costs):7.2f} "
+              f"{max(costs) * 1000.0:9.2f} {save_cost * 1000.0:13.2f}")
+
+
+if __name__ == "__main__":
+    main()
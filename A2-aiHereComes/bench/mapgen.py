@@ -0,0 +1,47 @@
+"""Map generation benchmark: tile-by-tile random walks vs the NumPy generator.
+
+Times both generators at several map sizes and prints the share of each
+terrain type, so the two can be checked for producing the same mix.
+Run from the project root:  python -m bench.mapgen [--sizes 200 1000 2000] [--seed 1]
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from world.map import TERRAIN_TYPES  # noqa: E402
+from world.map_generator import MapGenerator  # noqa: E402
+
+
+def terrain_mix(game_map) -> str:
+    counts = [game_map.terrain.count(tid) for tid in range(len(TERRAIN_TYPES))]
+    total = len(game_map.terrain)
+    return " ".join(f"{t.name.lower()} {100.0 * c / total:4.1f}%"
+                    for t, c in zip(TERRAIN_TYPES, counts) if c)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 1000, 2000])
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--max-tiles", type=int, default=2000 * 2000,
+                        help="skip the tile-by-tile generator above this many tiles")
+    args = parser.parse_args()
+    if not MapGenerator.available():
+        raise SystemExit("numpy is required for the vectorized generator")
+
+    for size in args.sizes:
+        print(f"{size}x{size}")
+        for name, vectorized in (("random walks", False), ("NumPy", True)):
+            if not vectorized and size * size > args.max_tiles:
+                print(f"  {name:<13} skipped")
+                continue
+            start = time.perf_counter()
+            game_map = MapGenerator(args.seed, vectorized=vectorized).generate(size, size)
+            elapsed = time.perf_counter() - start
+            print(f"  {name:<13} {elapsed * 1000.0:9.1f} ms   {terrain_mix(game_map)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Particle benchmark: Particle objects vs the NumPy ParticleBatch during a mass kill.
+
+Emits death bursts (6 particles each) every frame for one second, then lets
+them fade for another, timing update and draw per frame.
+Run from the project root:  python -m bench.particles [--deaths 300] [--budget 2000]
+"""
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, PARTICLE_BUDGET  # noqa: E402
+from core.camera import Camera  # noqa: E402
+from systems.particle_system import ParticleBatch, ParticleSystem  # noqa: E402
+
+
+def run(particles, screen, camera, deaths: int, seed: int):
+    rng = random.Random(seed)
+    dt = 1.0 / FPS
+    update = draw = worst = 0.0
+    peak = 0
+    for frame in range(FPS * 2):
+        if frame < FPS:
+            for _ in range(deaths):
+                particles.emit(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT),
+                               count=6, color=(180, 0, 0))
+        peak = max(peak, len(particles))
+        start = time.perf_counter()
+        particles.update(dt)
+        mid = time.perf_counter()
+        particles.draw(screen, camera)
+        end = time.perf_counter()
+        update += mid - start
+        draw += end - mid
+        worst = max(worst, end - start)
+    frames = FPS * 2
+    return update * 1000.0 / frames, draw * 1000.0 / frames, worst * 1000.0, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--deaths", type=int, default=300, help="zombie deaths per frame")
+    parser.add_argument("--budget", type=int, default=PARTICLE_BUDGET)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    if not ParticleBatch.available():
+        raise SystemExit("numpy is required for the ParticleBatch backend")
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    camera = Camera()
+    variants = [
+        ("Particle objects, no budget", ParticleSystem(random.Random(args.seed), budget=10 ** 9)),
+        ("Particle objects", ParticleSystem(random.Random(args.seed), budget=args.budget)),
+        ("ParticleBatch", ParticleBatch(random.Random(args.seed), budget=args.budget)),
+    ]
+
+    print(f"{args.deaths} deaths/frame for {FPS} frames, budget {args.budget}")
+    print(f"  {'':<28} {'update ms':>9} {'draw ms':>8} {'worst ms':>9} {'peak':>7}")
+    for name, particles in variants:
+        update_ms, draw_ms, worst_ms, peak = run(particles, screen, camera,
+                                                 args.deaths, args.seed)
+        print(f"  {name:<28} {update_ms:9.2f} {draw_ms:8.2f} {worst_ms:9.2f} {peak:7d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Flow field benchmark: full rebuild vs incremental repair, and cached fields.
+
+Uses the weighted cost field unless --bfs is given.
+Run from the project root:  python -m bench.pathfinding [--sizes 200 1000] [--bfs]
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from entities.buildings.wall import Wall
+from systems.pathfinding import Pathfinder
+from world.map_generator import MapGenerator
+
+
+def _time_ms(func) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000.0
+
+
+def bench_map(size: int, changes: int, seed: int, weighted: bool = True) -> dict:
+    game_map = MapGenerator(seed).generate(size, size)
+    goal = size // 2
+    pathfinder = Pathfinder(game_map, weighted=weighted)
+    # Goal on an open tile (no Town Center) so the BFS covers the whole map
+    pathfinder.set_goal(goal, goal)
+
+    full_ms = _time_ms(lambda: pathfinder.get_direction(0, 0))
+
+    # Walls dropped around the start area, like mid-wave wall spam
+    rng = random.Random(seed)
+    walls: List[Wall] = []
+    place_ms = []
+    while len(walls) < changes:
+        tx = goal + rng.randint(-20, 20)
+        ty = goal + rng.randint(-20, 20)
+        tile = game_map.get_tile(tx, ty)
+        if (tx, ty) == (goal, goal) or tile is None or not tile.buildable:
+            continue
+        wall = Wall(tx, ty)
+        wall.place_on_map(game_map)
+        walls.append(wall)
+        pathfinder.invalidate(wall.get_occupied_tiles())
+        place_ms.append(_time_ms(lambda: pathfinder.get_direction(0, 0)))
+
+    remove_ms = []
+    for wall in walls:
+        wall.remove_from_map(game_map)
+        pathfinder.invalidate(wall.get_occupied_tiles())
+        remove_ms.append(_time_ms(lambda: pathfinder.get_direction(0, 0)))
+
+    # A second goal set (a few scattered "towers"): the first query builds its
+    # field, later ones after a wall change only repair the cached field
+    goals = [(rng.randrange(size), rng.randrange(size)) for _ in range(8)]
+    goal_new_ms = _time_ms(lambda: pathfinder.field(goals).get_direction(0, 0))
+    wall = walls[0]
+    wall.place_on_map(game_map)
+    pathfinder.invalidate(wall.get_occupied_tiles())
+    pathfinder.get_direction(0, 0)
+    goal_cached_ms = _time_ms(lambda: pathfinder.field(goals).get_direction(0, 0))
+
+    return {
+        "size": size,
+        "full_ms": full_ms,
+        "place_avg_ms": sum(place_ms) / len(place_ms),
+        "place_max_ms": max(place_ms),
+        "remove_avg_ms": sum(remove_ms) / len(remove_ms),
+        "remove_max_ms": max(remove_ms),
+        "goal_new_ms": goal_new_ms,
+        "goal_cached_ms": goal_cached_ms,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 1000])
+    parser.add_argument("--changes", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--bfs", action="store_true", help="unweighted BFS fields")
+    args = parser.parse_args()
+
+    print(f"{'map':>10} {'full':>10} {'place avg':>10} {'place max':>10} "
+          f"{'remove avg':>11} {'remove max':>11} {'goals new':>10} {'cached':>8}   (ms)")
+    for size in args.sizes:
+        r = bench_map(size, args.changes, args.seed, weighted=not args.bfs)
+        print(f"{size:>4}x{size:<5} {r['full_ms']:>10.2f} {r['place_avg_ms']:>10.3f} "
+              f"{r['place_max_ms']:>10.3f} {r['remove_avg_ms']:>11.3f} {r['remove_max_ms']:>11.3f} "
+              f"{r['goal_new_ms']:>10.2f} {r['goal_cached_ms']:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
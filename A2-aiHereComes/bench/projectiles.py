@@ -0,0 +1,164 @@
+"""Projectile benchmark: Projectile objects vs the pooled store, per hit mode.
+
+Fires a steady stream of shots from towers at a static horde and reports
+the cost per tick and the shots per second that would fit in a 60 FPS frame.
+With --splash, every shot is a catapult shell; the object version then finds
+the zombies in the blast by scanning the whole horde, as a naive AoE would.
+Run from the project root:  python -m bench.projectiles [--rate 2000] [--splash 1.5]
+"""
+import argparse
+import functools
+import math
+import random
+import time
+
+from constants import TILE_SIZE, MAP_WIDTH, MAP_HEIGHT, FPS
+from entities.entity import Entity
+from entities.zombie import Zombie
+from systems.combat_system import PROJECTILE_SPEED
+from systems.projectile_pool import ProjectilePool, HIT_RADIUS
+from systems.spatial_grid import SpatialGrid
+
+
+class ObjectProjectile(Entity):
+    """One Entity per shot, as CombatSystem did it before the pool."""
+
+    def __init__(self, x, y, target_x, target_y, speed, damage):
+        super().__init__(x, y, 6, 6, 1)
+        self.target_x = target_x
+        self.target_y = target_y
+        self.damage = damage
+        dx = target_x - x
+        dy = target_y - y
+        dist = math.sqrt(dx * dx + dy * dy)
+        if dist > 0:
+            self.vx = dx / dist * speed
+            self.vy = dy / dist * speed
+        else:
+            self.vx = self.vy = 0
+            self.alive = False
+
+    def update(self, dt):
+        if not self.alive:
+            return
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        dx = self.target_x - self.center[0]
+        dy = self.target_y - self.center[1]
+        if dx * dx + dy * dy < 100:
+            self.alive = False
+
+
+def object_tick(projectiles, shots, dt, grid, zombies, splash):
+    for sx, sy, target in shots:
+        tx, ty = target.center
+        projectiles.append(ObjectProjectile(sx, sy, tx, ty, PROJECTILE_SPEED, 10))
+    for proj in projectiles:
+        proj.update(dt)
+        if not proj.alive:
+            continue
+        px, py = proj.center
+        zombie = grid.first_within(px, py, HIT_RADIUS)
+        if zombie:
+            if splash > 0:
+                for other in zombies:
+                    dx = other.center[0] - px
+                    dy = other.center[1] - py
+                    if other.alive and dx * dx + dy * dy < splash * splash:
+                        other.take_damage(proj.damage)
+            else:
+                zombie.take_damage(proj.damage)
+            proj.alive = False
+    return [p for p in projectiles if p.alive]
+
+
+def pool_tick(pool, shots, dt, grid, splash):
+    for sx, sy, target in shots:
+        pool.fire(sx, sy, target, PROJECTILE_SPEED, 10, splash)
+    pool.update(dt, grid)
+    return pool
+
+
+def build_scene(num_zombies: int, num_towers: int, seed: int):
+    rng = random.Random(seed)
+    cx = MAP_WIDTH * TILE_SIZE / 2
+    cy = MAP_HEIGHT * TILE_SIZE / 2
+    spread = 30 * TILE_SIZE
+    zombies = []
+    for _ in range(num_zombies):
+        z = Zombie(cx + rng.uniform(-spread, spread), cy + rng.uniform(-spread, spread),
+                   rng.choice(["basic", "runner", "tank"]), rng)
+        z.hp = z.max_hp = 10 ** 9  # Nobody dies, so every tick sees the same horde
+        zombies.append(z)
+    grid = SpatialGrid()
+    grid.rebuild(zombies)
+
+    # Each tower shoots at the nearest zombie in a stone tower's range
+    sources = []
+    while len(sources) < num_towers:
+        sx = cx + rng.uniform(-spread, spread)
+        sy = cy + rng.uniform(-spread, spread)
+        target = grid.nearest(sx, sy, 7 * TILE_SIZE)
+        if target is not None:
+            sources.append((sx, sy, target))
+    return zombies, grid, sources
+
+
+def run(tick, state, grid, sources, rate: float, warmup: int, ticks: int):
+    """Average ms per tick once the number of shots in flight has levelled off."""
+    dt = 1.0 / FPS
+    per_tick = rate / FPS
+    owed = 0.0
+    next_source = 0
+    elapsed = 0.0
+    in_flight = 0
+    for i in range(warmup + ticks):
+        owed += per_tick
+        count = int(owed)
+        owed -= count
+        shots = [sources[(next_source + k) % len(sources)] for k in range(count)]
+        next_source = (next_source + count) % len(sources)
+
+        start = time.perf_counter()
+        state = tick(state, shots, dt, grid)
+        if i >= warmup:
+            elapsed += time.perf_counter() - start
+            in_flight += len(state)
+    return elapsed * 1000.0 / ticks, in_flight / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=float, default=2000, help="shots fired per second")
+    parser.add_argument("--zombies", type=int, default=2000)
+    parser.add_argument("--towers", type=int, default=200)
+    parser.add_argument("--splash", type=float, default=0.0, help="splash radius in tiles")
+    parser.add_argument("--ticks", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    zombies, grid, sources = build_scene(args.zombies, args.towers, args.seed)
+    splash = args.splash * TILE_SIZE
+    warmup = FPS  # Longer than any flight
+    budget = 1000.0 / FPS
+    pooled = functools.partial(pool_tick, splash=splash)
+    variants = [
+        ("Projectile objects", functools.partial(object_tick, zombies=zombies, splash=splash),
+         lambda: []),
+        ("pool, collision", pooled, lambda: ProjectilePool()),
+        ("pool, analytic", pooled, lambda: ProjectilePool(analytic=True)),
+    ]
+
+    kind = f"catapult shells ({args.splash} tile splash)" if splash else "shots"
+    print(f"{args.rate:.0f} {kind}/s from {args.towers} towers into {args.zombies} zombies")
+    print(f"  {'':<20} {'ms/tick':>8} {'in flight':>10} {'shots/s at 60 FPS':>18}")
+    for name, tick, make in variants:
+        ms, in_flight = run(tick, make(), grid, sources, args.rate, warmup, args.ticks)
+        # Cost grows linearly with the fire rate, so scale up to a whole frame
+        supported = args.rate * budget / ms if ms > 0 else float('inf')
+        print(f"  {name:<20} {ms:8.2f} {in_flight:10.0f} {supported:18,.0f}")
+    print("(shots/s at 60 FPS: fire rate that would use the whole frame budget)")
+
+
+if __name__ == "__main__":
+    main()
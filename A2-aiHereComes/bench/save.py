@@ -0,0 +1,68 @@
+"""Save benchmark: snapshot, encode, decode and restore times and file sizes.
+
+Uses a late-game state: a bench scenario (default: 50 catapults against
+the 2,000-zombie late_wave horde) run for a while so shots are in flight.
+Run from the project root:  python -m bench.save [--scenario catapults] [--ticks 900]
+"""
+import argparse
+import json
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from bench.scenarios import SCENARIOS  # noqa: E402
+from core.simulation import Simulation  # noqa: E402
+from save import codec, snapshot  # noqa: E402
+
+
+def encode_pretty_json(state) -> bytes:
+    """The old save style: indented JSON."""
+    return json.dumps(state, indent=2, default=codec._encode_bytes).encode("utf-8")
+
+
+def timed(fn, *args, repeat: int = 5):
+    """Best of ``repeat`` runs, in ms, and the last result."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000.0, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="catapults")
+    parser.add_argument("--ticks", type=int, default=900, help="ticks to run before saving")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    sim = Simulation(seed=args.seed)
+    SCENARIOS[args.scenario](sim)
+    for _ in range(args.ticks):
+        sim.step()
+
+    capture_ms, state = timed(snapshot.capture, sim)
+    restore_ms, _ = timed(snapshot.restore, state, repeat=3)
+    print(f"{args.scenario} after {sim.tick} ticks: {len(sim.zombies)} zombies, "
+          f"{len(sim.build_system.buildings)} buildings, "
+          f"{len(sim.combat_system.projectiles)} projectiles in flight")
+    print(f"  snapshot {capture_ms:7.2f} ms   restore {restore_ms:7.2f} ms")
+
+    formats = [
+        ("JSON, indented", encode_pretty_json, codec.decode_json),
+        ("JSON, compact", codec.encode_json, codec.decode_json),
+        ("binary", codec.encode_binary, codec.decode_binary),
+    ]
+    print(f"  {'format':<16} {'size KB':>8} {'encode ms':>10} {'decode ms':>10}")
+    for name, encode, decode in formats:
+        encode_ms, data = timed(encode, state)
+        decode_ms, decoded = timed(decode, data)
+        assert decoded == state
+        print(f"  {name:<16} {len(data) / 1024.0:8.1f} {encode_ms:10.2f} {decode_ms:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
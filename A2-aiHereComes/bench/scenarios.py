@@ -0,0 +1,141 @@
+"""Seeded game setups shared by the simulation benchmark and the headless runner.
+
+Each scenario takes a fresh Simulation and builds its starting position
+using only the ``sim.rngs["scenario"]`` stream, so the same seed always
+gives the same game.
+"""
+import math
+
+from constants import TILE_SIZE
+from core.simulation import Simulation
+from entities.buildings.tower import Tower
+from systems.wave_manager import WaveState
+
+
+def unlimited_resources(sim: Simulation):
+    rm = sim.resource_manager
+    for res in rm.resources:
+        rm.resource_caps[res] = 10 ** 9
+        rm.resources[res] = 10 ** 9
+
+
+def _place_finished(sim: Simulation, tile_x: int, tile_y: int, building_type: str) -> bool:
+    """Place a building that is already fully constructed."""
+    building = sim.place_building(tile_x, tile_y, building_type)
+    if building is None:
+        return False
+    if not building.is_complete:
+        building.construction_progress = 1.0
+        building.is_complete = True
+        building.on_complete()
+        sim.build_system._apply_bonuses(building)
+    return True
+
+
+def fortify(sim: Simulation, towers: int, building_type: str = "stone_tower") -> int:
+    """Stand-in for a player: ring the Town Center with towers. Returns the count placed."""
+    unlimited_resources(sim)
+    tc = sim.town_center
+    cx, cy = tc.tile_x + 1, tc.tile_y + 1
+    placed = 0
+    radius = 3
+    while placed < towers and radius < min(sim.game_map.width, sim.game_map.height) // 2:
+        for dx in range(-radius, radius + 1, 2):
+            for dy in range(-radius, radius + 1, 2):
+                if max(abs(dx), abs(dy)) != radius or placed == towers:
+                    continue
+                if _place_finished(sim, cx + dx, cy + dy, building_type):
+                    placed += 1
+        radius += 2
+    return placed
+
+
+def upgrade_towers(sim: Simulation):
+    """Take every tower to its top level; stone towers become catapults."""
+    for building in sim.build_system.buildings:
+        if isinstance(building, Tower):
+            while building.can_upgrade():
+                building.upgrade()
+
+
+def wall_maze(sim: Simulation, rings: int = 4, spacing: int = 4) -> int:
+    """Square wall rings around the Town Center, each with a gap on alternating sides."""
+    unlimited_resources(sim)
+    tc = sim.town_center
+    cx, cy = tc.tile_x + 1, tc.tile_y + 1
+    placed = 0
+    for ring in range(1, rings + 1):
+        r = ring * spacing
+        gap = (cx + r, cy) if ring % 2 else (cx - r, cy)
+        for d in range(-r, r + 1):
+            for tx, ty in ((cx + d, cy - r), (cx + d, cy + r), (cx - r, cy + d), (cx + r, cy + d)):
+                if (tx, ty) != gap and _place_finished(sim, tx, ty, "wall"):
+                    placed += 1
+    return placed
+
+
+def spawn_ring(sim: Simulation, count: int, radius_tiles: float, zombie_type: str = "basic"):
+    """Spawn zombies spread over a circle around the Town Center, at wave strength."""
+    hp_mult, dmg_mult = sim.wave_manager.get_difficulty_multiplier()
+    cx, cy = sim.town_center.center
+    radius = radius_tiles * TILE_SIZE
+    rng = sim.rngs["scenario"]
+    for _ in range(count):
+        angle = rng.uniform(0, 2 * math.pi)
+        r = radius * rng.uniform(0.9, 1.1)
+        sim.spawn_zombie(zombie_type, cx + math.cos(angle) * r, cy + math.sin(angle) * r,
+                         hp_mult, dmg_mult)
+
+
+def _start_wave(sim: Simulation, wave: int):
+    """Jump straight into an active wave whose zombies the scenario spawns itself."""
+    waves = sim.wave_manager
+    waves.current_wave = wave
+    waves.state = WaveState.ACTIVE
+    waves.spawn_queue = []
+
+
+def empty(sim: Simulation):
+    """Town Center only, waiting for the first wave."""
+
+
+def fortress(sim: Simulation):
+    """50 stone towers holding off a mid-game wave."""
+    fortify(sim, 50)
+    _start_wave(sim, 6)
+    spawn_ring(sim, 200, 18)
+
+
+def maze(sim: Simulation):
+    """Nested wall rings that zombies have to chew through."""
+    wall_maze(sim)
+    _start_wave(sim, 5)
+    spawn_ring(sim, 200, 22)
+
+
+def late_wave(sim: Simulation):
+    """2,000 zombies of wave 25 closing in on 50 towers."""
+    fortify(sim, 50)
+    _start_wave(sim, 25)
+    spawn_ring(sim, 1500, 30)
+    spawn_ring(sim, 400, 40, "runner")
+    spawn_ring(sim, 100, 26, "tank")
+
+
+def catapults(sim: Simulation):
+    """The late_wave horde against 50 fully upgraded towers, all catapults."""
+    fortify(sim, 50)
+    upgrade_towers(sim)
+    _start_wave(sim, 25)
+    spawn_ring(sim, 1500, 30)
+    spawn_ring(sim, 400, 40, "runner")
+    spawn_ring(sim, 100, 26, "tank")
+
+
+SCENARIOS = {
+    "empty": empty,
+    "fortress": fortress,
+    "maze": maze,
+    "late_wave": late_wave,
+    "catapults": catapults,
+}
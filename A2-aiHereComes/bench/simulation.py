@@ -0,0 +1,125 @@
+"""Simulation benchmark: seeded scenarios, ticks/s, per-system time and peak memory.
+
+Run from the project root:
+    python -m bench.simulation [--scenario fortress late_wave] [--ticks 600]
+                               [--json results.json] [--compare baseline.json]
+"""
+import argparse
+import json
+import os
+import platform
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from bench.scenarios import SCENARIOS  # noqa: E402
+from core.simulation import Simulation  # noqa: E402
+
+
+def _setup(name: str, seed: int) -> Simulation:
+    sim = Simulation(seed=seed)
+    SCENARIOS[name](sim)
+    return sim
+
+
+def run_scenario(name: str, ticks: int, seed: int, memory_ticks: int) -> dict:
+    sim = _setup(name, seed)
+    zombies_start = len(sim.zombies)
+    sim.stage_times = {}
+    start = time.perf_counter()
+    while sim.tick < ticks and not sim.finished:
+        sim.step()
+    elapsed = time.perf_counter() - start
+    ran = max(1, sim.tick)
+
+    result = {
+        "ticks": sim.tick,
+        "ticks_per_sec": sim.tick / elapsed,
+        "ms_per_tick": elapsed * 1000.0 / ran,
+        "stage_ms_per_tick": {stage: total * 1000.0 / ran
+                              for stage, total in sim.stage_times.items()},
+        "zombies_start": zombies_start,
+        "zombies_end": len(sim.zombies),
+        "buildings_end": len(sim.build_system.buildings),
+        "zombies_killed": sim.wave_manager.total_zombies_killed,
+        "outcome": "defeat" if sim.defeat else "victory" if sim.victory else "running",
+    }
+
+    # Separate pass: tracemalloc slows everything down, so it must not skew the timing
+    if memory_ticks:
+        tracemalloc.start()
+        sim = _setup(name, seed)
+        while sim.tick < memory_ticks and not sim.finished:
+            sim.step()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result["peak_memory_kb"] = peak / 1024.0
+    return result
+
+
+def _print_table(results: dict, baseline: dict):
+    stages = []
+    for r in results.values():
+        for stage in r["stage_ms_per_tick"]:
+            if stage not in stages:
+                stages.append(stage)
+
+    header = f"{'scenario':<10} {'ticks/s':>9} {'ms/tick':>8}"
+    header += "".join(f" {s[:11]:>11}" for s in stages) + f" {'peak MB':>8}"
+    print(header)
+    for name, r in results.items():
+        line = f"{name:<10} {r['ticks_per_sec']:9.0f} {r['ms_per_tick']:8.2f}"
+        line += "".join(f" {r['stage_ms_per_tick'].get(s, 0.0):11.3f}" for s in stages)
+        mem = r.get("peak_memory_kb")
+        line += f" {mem / 1024.0:8.1f}" if mem is not None else f" {'-':>8}"
+        old = baseline.get(name)
+        if old:
+            change = (r["ticks_per_sec"] / old["ticks_per_sec"] - 1.0) * 100.0
+            line += f"   {change:+.1f}% ticks/s vs baseline"
+        if r["outcome"] != "running":
+            line += f"   ({r['outcome']} at tick {r['ticks']})"
+        print(line)
+    print("(stage columns are ms per tick)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", nargs="+", choices=sorted(SCENARIOS),
+                        default=list(SCENARIOS))
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--memory-ticks", type=int, default=60,
+                        help="ticks traced for peak memory (0 to skip)")
+    parser.add_argument("--json", help="write results to this file ('-' for stdout)")
+    parser.add_argument("--compare", help="earlier --json output to compare ticks/s against")
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.scenario:
+        results[name] = run_scenario(name, args.ticks, args.seed, args.memory_ticks)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f).get("scenarios", {})
+    _print_table(results, baseline)
+
+    if args.json:
+        report = {
+            "seed": args.seed,
+            "ticks": args.ticks,
+            "memory_ticks": args.memory_ticks,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scenarios": results,
+        }
+        if args.json == "-":
+            print(json.dumps(report, indent=2))
+        else:
+            with open(args.json, 'w') as f:
+                json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
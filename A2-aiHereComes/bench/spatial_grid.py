@@ -0,0 +1,107 @@
+"""Zombie spatial grid benchmark: brute-force scans vs SpatialGrid queries.
+
+Times one tick of tower targeting and projectile hit tests.
+Run from the project root:  python -m bench.spatial_grid [--zombies 2000 --towers 200]
+"""
+import argparse
+import math
+import random
+import time
+
+from constants import TILE_SIZE, MAP_WIDTH, MAP_HEIGHT
+from entities.buildings.tower import Tower
+from entities.zombie import Zombie
+from systems.projectile_pool import HIT_RADIUS
+from systems.spatial_grid import SpatialGrid
+
+
+def brute_nearest(tower, zombies):
+    """Tower targeting as CombatSystem did it before the grid."""
+    best = None
+    best_dist = float('inf')
+    range_px = tower.attack_range * TILE_SIZE
+    tx, ty = tower.center
+    for zombie in zombies:
+        if not zombie.alive:
+            continue
+        zx, zy = zombie.center
+        dist = math.sqrt((tx - zx) ** 2 + (ty - zy) ** 2)
+        if dist < range_px and dist < best_dist:
+            best = zombie
+            best_dist = dist
+    return best
+
+
+def brute_hit(px, py, zombies):
+    """Projectile collision as CombatSystem did it before the grid."""
+    for zombie in zombies:
+        if not zombie.alive:
+            continue
+        dx = px - zombie.center[0]
+        dy = py - zombie.center[1]
+        if dx * dx + dy * dy < 200:
+            return zombie
+    return None
+
+
+def build_scene(num_zombies: int, num_towers: int, num_projectiles: int, seed: int):
+    rng = random.Random(seed)
+    cx = MAP_WIDTH * TILE_SIZE / 2
+    cy = MAP_HEIGHT * TILE_SIZE / 2
+    spread = 40 * TILE_SIZE  # horde converging on the base
+    zombies = [Zombie(cx + rng.uniform(-spread, spread), cy + rng.uniform(-spread, spread),
+                      rng.choice(["basic", "runner", "tank"]))
+               for _ in range(num_zombies)]
+    towers = [Tower(MAP_WIDTH // 2 + rng.randint(-20, 20), MAP_HEIGHT // 2 + rng.randint(-20, 20),
+                    rng.choice(["wood", "stone"]))
+              for _ in range(num_towers)]
+    projectiles = [(cx + rng.uniform(-spread, spread), cy + rng.uniform(-spread, spread))
+                   for _ in range(num_projectiles)]
+    return zombies, towers, projectiles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--zombies", type=int, default=2000)
+    parser.add_argument("--towers", type=int, default=200)
+    parser.add_argument("--projectiles", type=int, default=400)
+    parser.add_argument("--ticks", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    zombies, towers, projectiles = build_scene(args.zombies, args.towers,
+                                               args.projectiles, args.seed)
+    grid = SpatialGrid()
+
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        for tower in towers:
+            brute_nearest(tower, zombies)
+        for px, py in projectiles:
+            brute_hit(px, py, zombies)
+    brute_ms = (time.perf_counter() - start) * 1000.0 / args.ticks
+
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        grid.rebuild(zombies)
+    rebuild_ms = (time.perf_counter() - start) * 1000.0 / args.ticks
+
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        for tower in towers:
+            tx, ty = tower.center
+            grid.nearest(tx, ty, tower.attack_range * TILE_SIZE)
+        for px, py in projectiles:
+            grid.first_within(px, py, HIT_RADIUS)
+    query_ms = (time.perf_counter() - start) * 1000.0 / args.ticks
+
+    print(f"{args.zombies} zombies, {args.towers} towers, {args.projectiles} projectiles")
+    print(f"  brute force      {brute_ms:9.2f} ms/tick")
+    print(f"  grid rebuild     {rebuild_ms:9.2f} ms/tick")
+    print(f"  grid queries     {query_ms:9.2f} ms/tick")
+    print(f"  grid total       {rebuild_ms + query_ms:9.2f} ms/tick "
+          f"({brute_ms / (rebuild_ms + query_ms):.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Zombie spawn throughput: per-spawn JSON loading vs the data registry.
+
+Run from the project root:  python -m bench.spawn [--count 20000]
+"""
+import argparse
+import json
+import os
+import time
+
+from entities.zombie import Zombie
+from systems.data_registry import DATA_DIR
+
+TYPES = ["basic", "runner", "tank", "boss"]
+
+
+def legacy_spawn(x: float, y: float, zombie_type: str) -> Zombie:
+    """What Zombie.__init__ did before the registry: read zombies.json per spawn."""
+    with open(os.path.join(DATA_DIR, 'zombies.json'), 'r') as f:
+        all_data = json.load(f)
+    data = all_data.get(zombie_type, all_data["basic"])
+    zombie = Zombie(x, y, zombie_type)
+    zombie.speed = data["speed"]  # Keep the loaded data live like the old path did
+    return zombie
+
+
+def _rate(spawn, count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        spawn(float(i), float(i), TYPES[i % len(TYPES)])
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20000)
+    args = parser.parse_args()
+
+    Zombie(0, 0)  # Warm the registry so the timing covers spawns only
+    legacy = _rate(legacy_spawn, args.count)
+    current = _rate(Zombie, args.count)
+    print(f"{args.count} spawns")
+    print(f"  json per spawn   {legacy:12,.0f} spawns/s")
+    print(f"  data registry    {current:12,.0f} spawns/s ({current / legacy:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
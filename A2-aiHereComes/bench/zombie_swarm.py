@@ -0,0 +1,80 @@
+"""Zombie movement benchmark: Zombie objects vs the NumPy ZombieSwarm.
+
+Run from the project root:  python -m bench.zombie_swarm [--zombies 10000]
+"""
+import argparse
+import random
+import time
+
+from constants import TILE_SIZE, MAP_WIDTH, MAP_HEIGHT, FPS
+from entities.buildings.wall import Wall
+from entities.zombie import Zombie
+from systems.pathfinding import Pathfinder
+from systems.zombie_swarm import ZombieSwarm
+from world.map_generator import MapGenerator
+
+
+def build_scene(num_zombies: int, seed: int):
+    game_map = MapGenerator(seed).generate()
+    cx, cy = MAP_WIDTH // 2, MAP_HEIGHT // 2
+
+    # Partial wall ring around the start area so some zombies are attacking
+    buildings = []
+    for d in range(-6, 7):
+        for tx, ty in ((cx + d, cy - 6), (cx + d, cy + 6), (cx - 6, cy + d), (cx + 6, cy + d)):
+            tile = game_map.get_tile(tx, ty)
+            if abs(d) > 1 and tile.building is None:
+                wall = Wall(tx, ty)
+                wall.place_on_map(game_map)
+                buildings.append(wall)
+
+    pathfinder = Pathfinder(game_map)
+    pathfinder.set_goal(cx, cy)
+
+    rng = random.Random(seed)
+    zombies = []
+    for _ in range(num_zombies):
+        z = Zombie(rng.uniform(0, MAP_WIDTH * TILE_SIZE), rng.uniform(0, MAP_HEIGHT * TILE_SIZE),
+                   rng.choice(["basic", "runner", "tank"]))
+        z.goal_x = (cx + 0.5) * TILE_SIZE
+        z.goal_y = (cy + 0.5) * TILE_SIZE
+        zombies.append(z)
+    return game_map, pathfinder, buildings, zombies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--zombies", type=int, default=10000)
+    parser.add_argument("--ticks", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    if not ZombieSwarm.available():
+        raise SystemExit("numpy is required for the ZombieSwarm backend")
+
+    dt = 1.0 / FPS
+    game_map, pathfinder, buildings, zombies = build_scene(args.zombies, args.seed)
+    pathfinder.direction_codes()  # Build the flow field outside the timings
+
+    swarm = ZombieSwarm(game_map, seed=args.seed)
+    for z in zombies:
+        swarm.append(z)
+
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        for z in zombies:
+            z.update(dt, pathfinder, game_map, buildings)
+    objects_ms = (time.perf_counter() - start) * 1000.0 / args.ticks
+
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        swarm.update(dt, pathfinder, game_map, buildings)
+    swarm_ms = (time.perf_counter() - start) * 1000.0 / args.ticks
+
+    budget = 1000.0 / FPS
+    print(f"{args.zombies} zombies, {len(buildings)} walls, {args.ticks} ticks")
+    print(f"  Zombie objects  {objects_ms:8.2f} ms/tick ({objects_ms / budget:5.0%} of a frame)")
+    print(f"  ZombieSwarm     {swarm_ms:8.2f} ms/tick ({swarm_ms / budget:5.0%} of a frame)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,91 @@
 from enum import Enum, auto
 
-# Font
-import pygame
-def get_font(size):
-    """Get a font that supports Chinese characters."""
-    for name in ["simhei", "microsoftyahei", "simsun", "dengxian", "fangsong"]:
-        f = pygame.font.SysFont(name, size)
-        # Test if font can render Chinese
-        if f.render("测试", True, (0, 0, 0)).get_width() > 10:
-            return f
-    return pygame.font.SysFont(None, size)
+# Fonts and text (rendering/text.py): remember the resolved Chinese font in
+# cache/font.json for faster startup, and how many rendered labels to keep
+FONT_CACHE = True
+TEXT_CACHE_SIZE = 512
 
 # Screen
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
 
+# Simulation: fixed ticks per second, and the most ticks run per frame
+# (a longer stall is dropped instead of being caught up)
+SIM_TICK_RATE = 60
+SIM_MAX_STEPS = 8
+
+# Profiler: frames kept in the timing ring buffer (F3 shows, F4 dumps)
+PROFILER_FRAMES = 300
+
+# Autosave: seconds of play between autosaves, and how many autosave files
+# are rotated (the oldest is overwritten)
+AUTOSAVE_INTERVAL = 120.0
+AUTOSAVE_SLOTS = 3
+
+# Replays: record every game's commands to replays/ (headless.py --replay
+# plays one back), with a state checksum every this many ticks; only the
+# newest REPLAY_KEEP recordings are kept
+REPLAY_RECORD = True
+REPLAY_CHECK_INTERVAL = 60
+REPLAY_KEEP = 10
+
 # Tile / Map
 TILE_SIZE = 32
 MAP_WIDTH = 200
 MAP_HEIGHT = 200
 
+# Map generation: paint terrain clusters with NumPy array operations
+# (world/map_generator.py). Much faster on large maps, but a seed gives a
+# different map than the default generator. Ignored without numpy.
+USE_NUMPY_MAP_GENERATOR = False
+
 # Camera
 CAMERA_SPEED = 400  # pixels per second
 CAMERA_EDGE_SCROLL_ZONE = 20  # pixels from screen edge
 
+# Terrain rendering: the map is pre-rendered in square chunks of this many
+# tiles; at most TERRAIN_CHUNK_CACHE chunk surfaces are kept (LRU)
+TERRAIN_CHUNK_TILES = 16
+TERRAIN_CHUNK_CACHE = 32
+
+# Data: re-read data/*.json when the files change (for balancing sessions)
+DATA_HOT_RELOAD = False
+
+# Pathfinding: flow fields kept for goals other than the Town Center
+# (least recently used dropped first)
+FLOW_FIELD_CACHE = 4
+
+# Pathfinding: weighted cost fields (Dijkstra) instead of plain BFS. Tiles
+# cost TERRAIN_PATH_COST to step onto, and a building can be broken through
+# for PATH_BREAK_COST per HP, so zombies weigh going around a wall against
+# chewing through it (2.5 per HP: a basic zombie chews about as long as it
+# would take to walk that far)
+USE_COST_FIELD = True
+PATH_BREAK_COST = 2.5
+
+# Pathfinding on large maps: coarse paths between PATH_SECTOR_SIZE-tile
+# sectors, with fine flow fields only for sectors that hold zombies
+# (systems/sector_pathfinding.py). Pays off from about 500x500 tiles.
+USE_HIERARCHICAL_PATHFINDING = False
+PATH_SECTOR_SIZE = 32
+
+# Zombies: keep the horde in NumPy arrays (systems/zombie_swarm.py).
+# Ignored when numpy is not installed.
+USE_ZOMBIE_SWARM = False
+
+# Projectiles: slots preallocated by the pool (it doubles when full), and
+# whether hits are scheduled at fire time instead of collision-tested per tick
+PROJECTILE_POOL_SIZE = 256
+PROJECTILE_ANALYTIC_IMPACT = False
+
+# Particles: most kept alive at once; new ones recycle the oldest past this
+PARTICLE_BUDGET = 2000
+
 # Minimap
 MINIMAP_SIZE = 180
 MINIMAP_MARGIN = 10
+MINIMAP_ZOMBIE_HZ = 10  # Refresh rate of the zombie dots
 
 # Colors
 class Color:
@@ -89,6 +147,14 @@ TERRAIN_WALKABLE = {
     TerrainType.STONE: False,
 }
 
+# Cost of stepping onto a walkable tile in a weighted path (10 = grass)
+TERRAIN_PATH_COST = {
+    TerrainType.GRASS: 10,
+    TerrainType.GRASS_DARK: 10,
+    TerrainType.DIRT: 10,
+    TerrainType.FOREST: 20,
+}
+
 TERRAIN_BUILDABLE = {
     TerrainType.GRASS: True,
     TerrainType.GRASS_DARK: True,
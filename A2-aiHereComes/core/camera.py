@@ -3,9 +3,24 @@ from constants import SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, MAP_WIDTH, MAP_HEI
 
 
 class Camera:
+    """The view onto the map. ``x``/``y`` is the position the player scrolls;
+    ``shake`` is a render-time offset (screen shake) added on top of it by
+    everything that draws the world, so the UI stays still and nothing has
+    to move the finished frame."""
+
     def __init__(self):
         self.x = 0.0  # top-left corner in world pixels
         self.y = 0.0
+        self.shake: Tuple[int, int] = (0, 0)  # Screen pixels; not part of the position
+
+    @property
+    def view_x(self) -> float:
+        """World x drawn at the left edge of the screen, shake included."""
+        return self.x - self.shake[0]
+
+    @property
+    def view_y(self) -> float:
+        return self.y - self.shake[1]
 
     def move(self, dx: float, dy: float):
         self.x += dx
@@ -19,20 +34,21 @@ class Camera:
         self.y = max(0, min(self.y, max_y))
 
     def world_to_screen(self, wx: float, wy: float) -> Tuple[float, float]:
-        return wx - self.x, wy - self.y
+        return wx - self.view_x, wy - self.view_y
 
     def screen_to_world(self, sx: float, sy: float) -> Tuple[float, float]:
-        return sx + self.x, sy + self.y
+        return sx + self.view_x, sy + self.view_y
 
     def screen_to_tile(self, sx: float, sy: float) -> Tuple[int, int]:
         wx, wy = self.screen_to_world(sx, sy)
         return int(wx // TILE_SIZE), int(wy // TILE_SIZE)
 
     def get_visible_tile_range(self) -> Tuple[int, int, int, int]:
-        start_col = max(0, int(self.x // TILE_SIZE))
-        start_row = max(0, int(self.y // TILE_SIZE))
-        end_col = min(MAP_WIDTH, int((self.x + SCREEN_WIDTH) // TILE_SIZE) + 2)
-        end_row = min(MAP_HEIGHT, int((self.y + SCREEN_HEIGHT) // TILE_SIZE) + 2)
+        view_x, view_y = self.view_x, self.view_y
+        start_col = max(0, int(view_x // TILE_SIZE))
+        start_row = max(0, int(view_y // TILE_SIZE))
+        end_col = min(MAP_WIDTH, int((view_x + SCREEN_WIDTH) // TILE_SIZE) + 2)
+        end_row = min(MAP_HEIGHT, int((view_y + SCREEN_HEIGHT) // TILE_SIZE) + 2)
         return start_col, start_row, end_col, end_row
 
     def center_on(self, wx: float, wy: float):
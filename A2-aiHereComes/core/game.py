@@ -1,27 +1,27 @@
 import random
 import pygame
 from enum import Enum, auto
-from constants import (SCREEN_WIDTH, SCREEN_HEIGHT, FPS, MAP_WIDTH, MAP_HEIGHT,
-                       TILE_SIZE, Color, get_font)
+from typing import Any, Dict, Optional
+from constants import (SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TILE_SIZE, REPLAY_RECORD,
+                       Color)
 from core.camera import Camera
 from core.input import InputHandler
-from world.map_generator import MapGenerator
+from core.profiler import FrameProfiler
+from core.replay import SPEED, ReplayRecorder
+from core.simulation import Simulation
 from rendering.renderer import Renderer
 from rendering.effects import ScreenEffects
-from systems.resource_manager import ResourceManager
-from systems.build_system import BuildSystem
-from systems.pathfinding import Pathfinder
-from systems.combat_system import CombatSystem
-from systems.particle_system import ParticleSystem
-from systems.wave_manager import WaveManager, WaveState
+from rendering.layers import layers
+from rendering.text import get_font, render_text, text_cache
+from systems.wave_manager import WaveState
+from save.autosave import SaveWriter
 from save.save_manager import SaveManager
-from entities.buildings.town_center import TownCenter
 from entities.building import Building
-from entities.zombie import Zombie
 from ui.hud import HUD
 from ui.build_panel import BuildPanel
 from ui.notification import NotificationManager
 from ui.info_panel import InfoPanel
+from ui.profiler_overlay import ProfilerOverlay
 
 
 class GamePhase(Enum):
@@ -42,33 +42,47 @@ class Game:
         self.phase = GamePhase.MENU
 
         # Systems (initialized in _start_new_game)
+        self.sim = None
         self.camera = None
         self.input = None
         self.renderer = None
-        self.game_map = None
-        self.resource_manager = None
-        self.build_system = None
-        self.pathfinder = None
-        self.combat_system = None
-        self.particle_system = None
-        self.zombies = None
-        self.wave_manager = None
         self.hud = None
         self.build_panel = None
         self.notification = None
-        self.town_center = None
         self.game_speed = 1.0
         self.screen_effects = ScreenEffects()
         self.info_panel = InfoPanel()
         self._notified_prep_times = set()
+        self.profiler = FrameProfiler()
+        self.profiler.track("ui surfaces", lambda: layers.allocations)
+        self.profiler.track("ui repaints", lambda: layers.repaints)
+        self.profiler.track("text renders", lambda: text_cache.misses)
+        self.save_writer = SaveWriter()
+        self.recorder: Optional[ReplayRecorder] = None
 
         # Fonts
         self.title_font = get_font(64)
         self.menu_font = get_font(36)
         self.small_font = get_font(22)
-
-    def _start_new_game(self):
-        """Initialize all game systems for a new game."""
+        self.profiler_overlay = ProfilerOverlay(self.profiler)
+
+    # The simulation owns the game state; these keep the old attribute names
+    game_map = property(lambda self: self.sim.game_map if self.sim else None)
+    resource_manager = property(lambda self: self.sim.resource_manager if self.sim else None)
+    build_system = property(lambda self: self.sim.build_system if self.sim else None)
+    town_center = property(lambda self: self.sim.town_center if self.sim else None)
+    pathfinder = property(lambda self: self.sim.pathfinder if self.sim else None)
+    combat_system = property(lambda self: self.sim.combat_system if self.sim else None)
+    particle_system = property(lambda self: self.sim.particle_system if self.sim else None)
+    zombies = property(lambda self: self.sim.zombies if self.sim else None)
+    zombie_grid = property(lambda self: self.sim.zombie_grid if self.sim else None)
+    wave_manager = property(lambda self: self.sim.wave_manager if self.sim else None)
+
+    def _start_new_game(self, sim: Optional[Simulation] = None,
+                        start_state: Optional[Dict[str, Any]] = None):
+        """Initialize all game systems for a new game, or around a restored
+        simulation (``start_state`` is the save it came from, for the replay)."""
+        self._save_replay()
         self.phase = GamePhase.PLAYING
         self.game_speed = 1.0
 
@@ -76,29 +90,14 @@ class Game:
         self.camera = Camera()
         self.input = InputHandler()
         self.renderer = Renderer(self.screen)
-        self.game_map = MapGenerator().generate()
-
-        # Economy
-        self.resource_manager = ResourceManager()
-        self.build_system = BuildSystem(self.game_map, self.resource_manager)
-
-        # Town Center
-        tc_x = MAP_WIDTH // 2 - 1
-        tc_y = MAP_HEIGHT // 2 - 1
-        self.town_center = TownCenter(tc_x, tc_y)
-        self.town_center.place_on_map(self.game_map)
-        self.build_system.buildings.append(self.town_center)
-        self.build_system._apply_bonuses(self.town_center)
-
-        # Combat
-        self.pathfinder = Pathfinder(self.game_map)
-        self.pathfinder.set_goal(tc_x + 1, tc_y + 1)
-        self.combat_system = CombatSystem()
-        self.particle_system = ParticleSystem()
-        self.zombies = []
-
-        # Waves
-        self.wave_manager = WaveManager()
+
+        # Simulation (map, economy, buildings, combat, waves)
+        self.sim = sim or Simulation()
+        self.sim.on_building_destroyed = self._on_building_destroyed
+        self.sim.on_wave_cleared = self._on_wave_cleared
+        self.save_writer.timer = self.save_writer.interval
+        if REPLAY_RECORD:
+            self.recorder = ReplayRecorder(self.sim, start_state)
 
         # UI
         self.hud = HUD(self.resource_manager)
@@ -107,14 +106,61 @@ class Game:
         self.notification = NotificationManager()
         self.info_panel = InfoPanel()
         self.info_panel.on_upgrade = self._on_upgrade_building
-        self.screen_effects = ScreenEffects()
+        self.screen_effects = ScreenEffects(random.Random(self.sim.seed))
 
         # Center camera
-        tc_center_x = (tc_x + 1.5) * TILE_SIZE
-        tc_center_y = (tc_y + 1.5) * TILE_SIZE
-        self.camera.center_on(tc_center_x, tc_center_y)
+        self.camera.center_on(*self.town_center.center)
+
+        if sim is None:
+            self.notification.show("欢迎！在第一波僵尸到来之前建造防御工事！", 5.0)
+
+    def _save_game(self):
+        # Only the freeze happens here; the writer thread does the rest
+        self.save_writer.submit(SaveManager.freeze_game(self))
+
+    def _check_saves(self):
+        for filename, error in self.save_writer.poll():
+            if error is not None:
+                self.notification.show("保存失败！", 2.0, (200, 100, 100))
+            elif filename == SaveManager.DEFAULT_SAVE:
+                self.notification.show("游戏已保存！", 2.0, (100, 200, 100))
+            else:
+                self.notification.show("已自动保存", 1.5, (150, 180, 150))
+
+    def _load_game(self):
+        """Load the most recent save, manual or autosave."""
+        self.save_writer.flush()
+        self._check_saves()
+        filename = SaveManager.latest_save()
+        try:
+            state = SaveManager.load_game(filename) if filename else None
+            if state is None:
+                self.notification.show("未找到存档", 2.0, (200, 100, 100))
+                return
+            sim = SaveManager.restore_simulation(state)
+        except (OSError, ValueError):
+            self.notification.show("存档无法读取", 2.0, (200, 100, 100))
+            return
 
-        self.notification.show("欢迎！在第一波僵尸到来之前建造防御工事！", 5.0)
+        self._start_new_game(sim, state)
+        meta = state["meta"]
+        if "camera" in meta:
+            self.camera.x = meta["camera"]["x"]
+            self.camera.y = meta["camera"]["y"]
+            self.camera.move(0, 0)  # Clamp to the map
+        self.game_speed = meta.get("game_speed", 1.0)
+        self.notification.show("存档已加载", 2.0, (100, 200, 100))
+
+    def _save_replay(self):
+        if self.recorder is None:
+            return
+        recorder, self.recorder = self.recorder, None
+        try:
+            recorder.save(self.sim)
+        except OSError:
+            self.notification.show("回放保存失败", 2.0, (200, 100, 100))
+            return
+        self.notification.show("回放已保存", 1.5, (150, 180, 150))
 
     def _on_building_selected(self, building_type):
         if building_type:
@@ -123,7 +169,7 @@ class Game:
             self.build_system.deselect()
 
     def _on_repair_all(self):
-        count, hp = self.build_system.repair_all()
+        count, hp = self.sim.repair_all()
         if count > 0:
             self.notification.show(f"已修复 {count} 个建筑！恢复 {hp} 生命值",
                                    2.0, (100, 200, 100))
@@ -139,8 +185,8 @@ class Game:
         if not self.resource_manager.can_afford(cost):
             self.notification.show("资源不足，无法升级！", 2.0, (200, 100, 100))
             return
-        self.resource_manager.spend(cost)
-        entity.upgrade()
+        if not self.sim.upgrade_building(entity.tile_x, entity.tile_y):
+            return
         self.notification.show(
             f"{entity.name} 升级到 Lv{entity.level}！", 2.0, (255, 220, 50))
         self.screen_effects.shake(amount=2.0, duration=0.1)
@@ -149,13 +195,18 @@ class Game:
         while self.running:
             dt = self.clock.tick(FPS) / 1000.0
             dt = min(dt, 0.05)
+            self.profiler.begin_frame()
 
             if not self._handle_events():
                 break
+            self.profiler.lap("events")
 
             self._update(dt)
             self._render()
+            self.profiler.end_frame()
 
+        self._save_replay()
+        self.save_writer.flush()
         pygame.quit()
 
     def _handle_events(self) -> bool:
@@ -209,10 +260,10 @@ class Game:
                 if event.button == 1 and self.build_system.selected_building_type:
                     if event.pos[1] < SCREEN_HEIGHT - self.build_panel.panel_height:
                         tx, ty = self.input.mouse_tile
-                        placed = self.build_system.place_building(
+                        placed = self.sim.place_building(
                             tx, ty, self.build_system.selected_building_type)
                         if placed:
-                            self.pathfinder.invalidate()
+                            self.renderer.invalidate_minimap()
                 elif event.button == 1 and not self.build_system.selected_building_type:
                     # Click to select entity
                     if event.pos[1] < SCREEN_HEIGHT - self.build_panel.panel_height:
@@ -241,24 +292,30 @@ class Game:
 
                 # Debug: Z to spawn test zombies
                 if event.key == pygame.K_z:
-                    self._spawn_test_zombies()
+                    self.sim.spawn_test_zombies()
 
                 # Speed control
                 if event.key == pygame.K_f:
                     self.game_speed = 2.0 if self.game_speed == 1.0 else 1.0
+                    if self.recorder:
+                        self.recorder.record(self.sim.tick, SPEED, (self.game_speed,))
                     self.notification.show(
                         f"速度: {self.game_speed}x", 1.0)
 
+                # Profiler: F3 toggles the overlay, F4 dumps the timing buffer
+                if event.key == pygame.K_F3:
+                    if not self.profiler.toggle():
+                        self.sim.stage_times = None
+                if event.key == pygame.K_F4 and self.profiler.count:
+                    json_path, _ = self.profiler.dump()
+                    self.notification.show(f"性能数据已导出: {json_path}", 2.0, (100, 200, 100))
+
                 # Save/Load
                 if event.key == pygame.K_F5:
-                    SaveManager.save_game(SaveManager.build_save_state(self))
-                    self.notification.show("游戏已保存！", 2.0, (100, 200, 100))
+                    self._save_game()
                 if event.key == pygame.K_F9:
-                    state = SaveManager.load_game()
-                    if state:
-                        self.notification.show("存档已加载（需重启）", 2.0, (200, 200, 100))
-                    else:
-                        self.notification.show("未找到存档", 2.0, (200, 100, 100))
+                    self._load_game()
+                    return True
 
         return True
 
@@ -298,82 +355,50 @@ class Game:
                     self.phase = GamePhase.MENU
         return True
 
-    def _spawn_test_zombies(self):
-        side = random.choice(["top", "bottom", "left", "right"])
-        if side == "top":
-            x, y = random.uniform(0, MAP_WIDTH * TILE_SIZE), 0
-        elif side == "bottom":
-            x, y = random.uniform(0, MAP_WIDTH * TILE_SIZE), (MAP_HEIGHT - 1) * TILE_SIZE
-        elif side == "left":
-            x, y = 0, random.uniform(0, MAP_HEIGHT * TILE_SIZE)
-        else:
-            x, y = (MAP_WIDTH - 1) * TILE_SIZE, random.uniform(0, MAP_HEIGHT * TILE_SIZE)
-        for _ in range(5):
-            z = Zombie(
-                x + random.uniform(-50, 50),
-                y + random.uniform(-50, 50), "basic")
-            z.goal_x = self.town_center.center[0]
-            z.goal_y = self.town_center.center[1]
-            self.zombies.append(z)
-
     def _try_select_entity(self):
         """Try to select a building or zombie at the mouse position."""
         wx, wy = self.input.mouse_world
         mx, my = int(wx), int(wy)
 
         # Check buildings
-        for building in self.build_system.buildings:
-            if building.rect.collidepoint(mx, my):
-                self.info_panel.select(building)
-                return
+        building = self.game_map.building_at(mx // TILE_SIZE, my // TILE_SIZE)
+        if building:
+            self.info_panel.select(building)
+            return
 
         # Check zombies
-        for zombie in self.zombies:
-            if zombie.rect.collidepoint(mx, my):
-                self.info_panel.select(zombie)
-                return
+        zombie = self.zombie_grid.query_point(mx, my)
+        if zombie:
+            self.info_panel.select(zombie)
+            return
 
         # Nothing found
         self.info_panel.deselect()
 
     def _update(self, dt: float):
         if self.phase == GamePhase.PLAYING:
-            self._update_game(dt * self.game_speed)
+            self._update_game(dt)
         self.screen_effects.update(dt)
         if self.notification:
+            self._check_saves()
             self.notification.update(dt)
 
     def _update_game(self, dt: float):
-        # Camera
-        dx, dy = self.input.get_camera_movement(dt / self.game_speed)
+        # Camera (real time, unaffected by game speed)
+        dx, dy = self.input.get_camera_movement(dt)
         self.camera.move(dx, dy)
 
         # Ghost
         self.build_system.update_ghost(*self.input.mouse_tile)
+        self.profiler.lap("input")
 
-        # Buildings
-        self.build_system.update(dt)
-
-        # Wave management
-        spawns = self.wave_manager.update(dt)
-        hp_mult, dmg_mult = self.wave_manager.get_difficulty_multiplier()
-        for zombie_type, sx, sy in spawns:
-            z = Zombie(sx, sy, zombie_type)
-            z.max_hp = int(z.max_hp * hp_mult)
-            z.hp = z.max_hp
-            z.damage = int(z.damage * dmg_mult)
-            z.goal_x = self.town_center.center[0]
-            z.goal_y = self.town_center.center[1]
-            self.zombies.append(z)
-
-        # Check wave complete
-        if self.wave_manager.state == WaveState.ACTIVE:
-            if len(self.wave_manager.spawn_queue) == 0 and len(self.zombies) == 0:
-                self.wave_manager.check_wave_complete(0)
-                if self.wave_manager.state == WaveState.PREP:
-                    self.notification.show(
-                        f"第 {self.wave_manager.current_wave} 波已清除！", 3.0,
-                        (0, 255, 100))
+        # Fixed-timestep simulation; it times its own stages into the profiler frame
+        if self.profiler.enabled:
+            self.sim.stage_times = self.profiler.frame
+        self.sim.advance(dt * self.game_speed)
+        if self.recorder:
+            self.recorder.observe(self.sim)
+        self.profiler.reset_lap()
 
         # Prep timer notification (only once per countdown milestone)
         if self.wave_manager.state == WaveState.PREP:
@@ -387,49 +412,31 @@ class Game:
         else:
             self._notified_prep_times.clear()
 
-        # Zombies
-        buildings = self.build_system.buildings
-        for zombie in self.zombies:
-            zombie.update(dt, self.pathfinder, self.game_map, buildings)
-
-        # Combat
-        self.combat_system.update(dt, buildings, self.zombies)
-
-        # Handle zombie deaths
-        for zombie in self.zombies:
-            if not zombie.alive:
-                self.particle_system.emit(zombie.center[0], zombie.center[1],
-                                          count=6, color=(180, 0, 0))
-                self.wave_manager.on_zombie_killed()
-        self.zombies = [z for z in self.zombies if z.alive]
-
-        # Handle building deaths
-        for building in self.build_system.buildings[:]:
-            if not building.alive:
-                self.particle_system.emit(building.center[0], building.center[1],
-                                          count=10, color=(150, 100, 50))
-                self.build_system.remove_building(building)
-                self.pathfinder.invalidate()
-                self.screen_effects.shake(amount=4.0, duration=0.2)
-
-                # Check town center destruction
-                if isinstance(building, TownCenter):
-                    self.screen_effects.shake(amount=10.0, duration=0.5)
-                    self.phase = GamePhase.GAME_OVER
-                    self.notification.show("城镇中心被摧毁！游戏结束！", 5.0,
-                                           (255, 50, 50))
-
-        # Particles
-        self.particle_system.update(dt)
-
         # HUD
         self.hud.zombie_count = len(self.zombies)
 
-        # Victory check
-        if self.wave_manager.is_victory():
+        if self.save_writer.update(dt):
+            self.save_writer.autosave(SaveManager.freeze_game(self))
+
+        if self.sim.defeat:
+            self.screen_effects.shake(amount=10.0, duration=0.5)
+            self.phase = GamePhase.GAME_OVER
+            self.notification.show("城镇中心被摧毁！游戏结束！", 5.0,
+                                   (255, 50, 50))
+        elif self.sim.victory:
             self.phase = GamePhase.VICTORY
             self.notification.show("胜利！你存活了所有波次！", 5.0,
                                    (0, 255, 100))
+        if self.sim.finished:
+            self._save_replay()
+        self.profiler.lap("game state")
+
+    def _on_building_destroyed(self, building: Building):
+        self.renderer.invalidate_minimap()
+        self.screen_effects.shake(amount=4.0, duration=0.2)
+
+    def _on_wave_cleared(self, wave: int):
+        self.notification.show(f"第 {wave} 波已清除！", 3.0, (0, 255, 100))
 
     def _render(self):
         self.screen.fill(Color.BLACK)
@@ -448,12 +455,24 @@ class Game:
         # Notifications (always on top)
         if self.notification and self.phase != GamePhase.MENU:
             self.notification.draw(self.screen, SCREEN_WIDTH)
+        self.profiler.lap("notifications")
+
+        self.profiler_overlay.draw(self.screen)
+        self.profiler.lap("profiler")
 
         pygame.display.flip()
+        self.profiler.lap("flip")
 
     def _render_game(self):
+        profiler = self.profiler
+        profiler.lap("clear")
+
+        # Shake moves the world layers through the camera; the UI stays put
+        self.camera.shake = self.screen_effects.shake_offset
+
         # Terrain
         self.renderer._render_terrain(self.game_map, self.camera)
+        profiler.lap("draw terrain")
 
         # Buildings
         for building in self.build_system.buildings:
@@ -462,20 +481,24 @@ class Game:
         # Ghost
         if self.phase == GamePhase.PLAYING:
             self.build_system.draw_ghost(self.screen, self.camera)
+        profiler.lap("draw buildings")
 
         # Zombies
         for zombie in self.zombies:
             zombie.draw(self.screen, self.camera)
+        profiler.lap("draw zombies")
 
         # Projectiles
         self.combat_system.draw(self.screen, self.camera)
 
         # Particles
         self.particle_system.draw(self.screen, self.camera)
+        profiler.lap("draw effects")
 
         # Minimap
         self.renderer._render_minimap(self.game_map, self.camera,
                                       self.build_system.buildings, self.zombies)
+        profiler.lap("minimap")
 
         # HUD
         self.hud.draw(self.screen)
@@ -483,30 +506,30 @@ class Game:
         # Wave info
         wave_text = self.wave_manager.get_prep_time_str()
         if wave_text:
-            wave_surf = self.small_font.render(wave_text, True, Color.UI_TEXT)
+            wave_surf = render_text(self.small_font, wave_text, Color.UI_TEXT)
             self.screen.blit(wave_surf, (SCREEN_WIDTH // 2 - wave_surf.get_width() // 2, 35))
 
+        profiler.lap("hud")
+
         # Build panel
         self.build_panel.draw(self.screen, SCREEN_HEIGHT)
 
         # FPS & controls
         info = f"FPS:{int(self.clock.get_fps())} Speed:{self.game_speed}x  Wave:{self.wave_manager.current_wave}"
-        info_surf = self.small_font.render(info, True, Color.WHITE)
+        info_surf = render_text(self.small_font, info, Color.WHITE)
         self.screen.blit(info_surf, (SCREEN_WIDTH - info_surf.get_width() - 10, SCREEN_HEIGHT - 75))
 
         # Info panel (selected entity)
         self.info_panel.draw(self.screen, self.camera)
-
-        # Screen effects (shake)
-        self.screen_effects.apply(self.screen)
+        profiler.lap("panels")
 
     def _render_menu(self):
         # Title
-        title = self.title_font.render("僵尸来了", True, (200, 50, 50))
+        title = render_text(self.title_font, "僵尸来了", (200, 50, 50))
         self.screen.blit(title,
                          (SCREEN_WIDTH // 2 - title.get_width() // 2, 150))
 
-        subtitle = self.menu_font.render("塔防生存建造", True, Color.UI_TEXT)
+        subtitle = render_text(self.menu_font, "塔防生存建造", Color.UI_TEXT)
         self.screen.blit(subtitle,
                          (SCREEN_WIDTH // 2 - subtitle.get_width() // 2, 230))
 
@@ -514,7 +537,7 @@ class Game:
         btn_rect = pygame.Rect(SCREEN_WIDTH // 2 - 100, 400, 200, 50)
         pygame.draw.rect(self.screen, Color.UI_BUTTON, btn_rect)
         pygame.draw.rect(self.screen, Color.UI_BORDER, btn_rect, 2)
-        btn_text = self.menu_font.render("开始游戏", True, Color.UI_TEXT)
+        btn_text = render_text(self.menu_font, "开始游戏", Color.UI_TEXT)
         self.screen.blit(btn_text,
                          (btn_rect.centerx - btn_text.get_width() // 2,
                           btn_rect.centery - btn_text.get_height() // 2))
@@ -524,47 +547,54 @@ class Game:
             "WASD / 方向键: 滚动地图  |  鼠标边缘: 滚动地图",
             "1-9: 选择建筑  |  左键: 放置  |  右键: 取消",
             "F: 切换速度  |  ESC: 暂停  |  Z: 生成僵尸(调试)",
+            "F3: 性能面板  |  F4: 导出性能数据",
         ]
         y = 500
         for line in controls:
-            surf = self.small_font.render(line, True, Color.GRAY)
+            surf = render_text(self.small_font, line, Color.GRAY)
             self.screen.blit(surf, (SCREEN_WIDTH // 2 - surf.get_width() // 2, y))
             y += 25
 
     def _render_pause_overlay(self):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
+        overlay = layers.get("pause", (SCREEN_WIDTH, SCREEN_HEIGHT), self._paint_pause_overlay)
         self.screen.blit(overlay, (0, 0))
 
-        title = self.title_font.render("暂停", True, Color.UI_TEXT)
-        self.screen.blit(title,
-                         (SCREEN_WIDTH // 2 - title.get_width() // 2, 250))
+    def _paint_pause_overlay(self, overlay: pygame.Surface):
+        overlay.fill((0, 0, 0, 150))
+
+        title = render_text(self.title_font, "暂停", Color.UI_TEXT)
+        overlay.blit(title,
+                     (SCREEN_WIDTH // 2 - title.get_width() // 2, 250))
 
         # Resume button
         btn = pygame.Rect(SCREEN_WIDTH // 2 - 100, 320, 200, 45)
-        pygame.draw.rect(self.screen, Color.UI_BUTTON, btn)
-        pygame.draw.rect(self.screen, Color.UI_BORDER, btn, 2)
-        txt = self.menu_font.render("继续", True, Color.UI_TEXT)
-        self.screen.blit(txt, (btn.centerx - txt.get_width() // 2, btn.centery - txt.get_height() // 2))
+        pygame.draw.rect(overlay, Color.UI_BUTTON, btn)
+        pygame.draw.rect(overlay, Color.UI_BORDER, btn, 2)
+        txt = render_text(self.menu_font, "继续", Color.UI_TEXT)
+        overlay.blit(txt, (btn.centerx - txt.get_width() // 2, btn.centery - txt.get_height() // 2))
 
         # Quit button
         btn2 = pygame.Rect(SCREEN_WIDTH // 2 - 100, 380, 200, 45)
-        pygame.draw.rect(self.screen, Color.UI_BUTTON, btn2)
-        pygame.draw.rect(self.screen, Color.UI_BORDER, btn2, 2)
-        txt2 = self.menu_font.render("退出", True, Color.UI_TEXT)
-        self.screen.blit(txt2, (btn2.centerx - txt2.get_width() // 2, btn2.centery - txt2.get_height() // 2))
+        pygame.draw.rect(overlay, Color.UI_BUTTON, btn2)
+        pygame.draw.rect(overlay, Color.UI_BORDER, btn2, 2)
+        txt2 = render_text(self.menu_font, "退出", Color.UI_TEXT)
+        overlay.blit(txt2, (btn2.centerx - txt2.get_width() // 2, btn2.centery - txt2.get_height() // 2))
 
     def _render_end_overlay(self):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
+        wave = self.wave_manager
+        version = (self.phase, wave.current_wave, wave.total_zombies_killed) if wave else self.phase
+        overlay = layers.get("end", (SCREEN_WIDTH, SCREEN_HEIGHT), self._paint_end_overlay, version)
         self.screen.blit(overlay, (0, 0))
 
+    def _paint_end_overlay(self, overlay: pygame.Surface):
+        overlay.fill((0, 0, 0, 180))
+
         if self.phase == GamePhase.VICTORY:
-            title = self.title_font.render("胜利!", True, (0, 255, 100))
+            title = render_text(self.title_font, "胜利!", (0, 255, 100))
         else:
-            title = self.title_font.render("游戏结束", True, (255, 50, 50))
-        self.screen.blit(title,
-                         (SCREEN_WIDTH // 2 - title.get_width() // 2, 200))
+            title = render_text(self.title_font, "游戏结束", (255, 50, 50))
+        overlay.blit(title,
+                     (SCREEN_WIDTH // 2 - title.get_width() // 2, 200))
 
         # Stats
         if self.wave_manager:
@@ -574,14 +604,14 @@ class Game:
             ]
             y = 300
             for stat in stats:
-                surf = self.menu_font.render(stat, True, Color.UI_TEXT)
-                self.screen.blit(surf, (SCREEN_WIDTH // 2 - surf.get_width() // 2, y))
+                surf = render_text(self.menu_font, stat, Color.UI_TEXT)
+                overlay.blit(surf, (SCREEN_WIDTH // 2 - surf.get_width() // 2, y))
                 y += 40
 
         # Buttons
         for i, (label, y) in enumerate([("重新开始", 400), ("主菜单", 460)]):
             btn = pygame.Rect(SCREEN_WIDTH // 2 - 100, y, 200, 45)
-            pygame.draw.rect(self.screen, Color.UI_BUTTON, btn)
-            pygame.draw.rect(self.screen, Color.UI_BORDER, btn, 2)
-            txt = self.menu_font.render(label, True, Color.UI_TEXT)
-            self.screen.blit(txt, (btn.centerx - txt.get_width() // 2, btn.centery - txt.get_height() // 2))
+            pygame.draw.rect(overlay, Color.UI_BUTTON, btn)
+            pygame.draw.rect(overlay, Color.UI_BORDER, btn, 2)
+            txt = render_text(self.menu_font, label, Color.UI_TEXT)
+            overlay.blit(txt, (btn.centerx - txt.get_width() // 2, btn.centery - txt.get_height() // 2))
@@ -0,0 +1,135 @@
+import csv
+import json
+import os
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from constants import PROFILER_FRAMES
+
+
+class FrameProfiler:
+    """Per-stage frame timings kept in a fixed-size ring buffer.
+
+    Each frame is timed as a sequence of laps: ``lap(name)`` charges the
+    time since the previous lap to ``name``. Code that times itself (the
+    simulation's ``stage_times``) writes into ``frame`` directly and then
+    calls ``reset_lap``. Counters registered with ``track`` (such as surface
+    allocations) are recorded per frame alongside the timings, in their
+    own buffer. Nothing is recorded while disabled."""
+
+    DUMP_DIR = os.path.join(os.path.dirname(__file__), '..', 'profiles')
+
+    def __init__(self, capacity: int = PROFILER_FRAMES):
+        self.enabled = False
+        self.capacity = capacity
+        self.stages: List[str] = []  # Every stage seen, in first-seen order
+        self.frames: List[Optional[Dict[str, float]]] = [None] * capacity  # ms per stage
+        self.next = 0
+        self.count = 0
+        self.recorded = 0  # Frames recorded since creation, including overwritten ones
+        self.frame: Dict[str, float] = {}  # Seconds per stage for the frame in progress
+        self._last = 0.0
+        self.counters: Dict[str, Callable[[], int]] = {}
+        self.counts: List[Optional[Dict[str, int]]] = [None] * capacity  # Per counter
+        self._totals: Dict[str, int] = {}  # Counter totals at the start of the frame
+
+    def toggle(self) -> bool:
+        self.enabled = not self.enabled
+        return self.enabled
+
+    def track(self, name: str, total: Callable[[], int]):
+        """Record how much ``total()``, a running count, grows in each frame."""
+        self.counters[name] = total
+
+    def clear(self):
+        self.frames = [None] * self.capacity
+        self.counts = [None] * self.capacity
+        self.next = 0
+        self.count = 0
+
+    # --- Recording ---
+
+    def begin_frame(self):
+        self.frame = {}
+        self._totals = {name: total() for name, total in self.counters.items()}
+        self._last = time.perf_counter()
+
+    def lap(self, stage: str):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.frame[stage] = self.frame.get(stage, 0.0) + now - self._last
+        self._last = now
+
+    def reset_lap(self):
+        self._last = time.perf_counter()
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        record = {}
+        for stage, seconds in self.frame.items():
+            if stage not in self.stages:
+                self.stages.append(stage)
+            record[stage] = seconds * 1000.0
+        self.frames[self.next] = record
+        self.counts[self.next] = {name: total() - self._totals.get(name, 0)
+                                  for name, total in self.counters.items()}
+        self.next = (self.next + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.recorded += 1
+
+    # --- Reading ---
+
+    def recent(self) -> List[Dict[str, float]]:
+        """Recorded frames, oldest first."""
+        start = (self.next - self.count) % self.capacity
+        return [self.frames[(start + i) % self.capacity] for i in range(self.count)]
+
+    def recent_counts(self) -> List[Dict[str, int]]:
+        """Counter values for the recorded frames, oldest first."""
+        start = (self.next - self.count) % self.capacity
+        return [self.counts[(start + i) % self.capacity] for i in range(self.count)]
+
+    def latest(self) -> Optional[Dict[str, float]]:
+        if self.count == 0:
+            return None
+        return self.frames[(self.next - 1) % self.capacity]
+
+    def averages(self) -> Dict[str, float]:
+        """Mean ms per stage over the buffered frames."""
+        frames = self.recent()
+        if not frames:
+            return {}
+        return {stage: sum(f.get(stage, 0.0) for f in frames) / len(frames)
+                for stage in self.stages}
+
+    def count_averages(self) -> Dict[str, float]:
+        """Mean per frame of each counter over the buffered frames."""
+        counts = self.recent_counts()
+        if not counts:
+            return {}
+        return {name: sum(c.get(name, 0) for c in counts) / len(counts)
+                for name in self.counters}
+
+    def dump(self, basename: Optional[str] = None) -> Tuple[str, str]:
+        """Write the buffer as JSON and CSV (one row per frame). Returns both paths."""
+        os.makedirs(self.DUMP_DIR, exist_ok=True)
+        basename = basename or time.strftime("profile_%Y%m%d_%H%M%S")
+        frames = self.recent()
+        counts = self.recent_counts()
+        counters = list(self.counters)
+
+        json_path = os.path.join(self.DUMP_DIR, basename + ".json")
+        with open(json_path, 'w') as f:
+            json.dump({"stages": self.stages, "unit": "ms", "frames": frames,
+                       "counters": counters, "counts": counts}, f, indent=1)
+
+        csv_path = os.path.join(self.DUMP_DIR, basename + ".csv")
+        with open(csv_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame"] + self.stages + ["total"] + counters)
+            for i, (frame, count) in enumerate(zip(frames, counts)):
+                row = [round(frame.get(stage, 0.0), 4) for stage in self.stages]
+                writer.writerow([i] + row + [round(sum(frame.values()), 4)]
+                                + [count.get(name, 0) for name in counters])
+        return json_path, csv_path
@@ -0,0 +1,36 @@
+import random
+from typing import Dict, Iterator, List
+
+
+class RandomStreams:
+    """Named, independently seeded random.Random streams.
+
+    Each subsystem draws from its own stream (``streams["waves"]``), so how
+    much one of them consumes (particles, say, which depend on the budget
+    and the backend) cannot shift another's sequence. Every stream is
+    derived from the one master seed."""
+
+    def __init__(self, seed: int):
+        self.seed = seed
+        self._streams: Dict[str, random.Random] = {}
+
+    def __getitem__(self, name: str) -> random.Random:
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = self._streams[name] = random.Random(f"{self.seed}/{name}")
+        return stream
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._streams)
+
+    def getstate(self) -> Dict[str, List]:
+        """JSON-friendly state of every stream used so far."""
+        states = {}
+        for name, stream in self._streams.items():
+            version, internal, gauss = stream.getstate()
+            states[name] = [version, list(internal), gauss]
+        return states
+
+    def setstate(self, states: Dict[str, List]):
+        for name, (version, internal, gauss) in states.items():
+            self[name].setstate((version, tuple(internal), gauss))
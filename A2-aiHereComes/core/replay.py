@@ -0,0 +1,210 @@
+"""Record a game's player commands and play them back.
+
+A replay is the simulation seed (or a snapshot, for games continued from a
+save) plus every command with the tick it was issued on, and a state
+checksum every REPLAY_CHECK_INTERVAL ticks. Playing it back runs the same
+ticks headlessly, issues the same commands at the same ticks, and
+compares the checksums, so a divergence is caught at the first check.
+
+File format: MAGIC, a version, then one zlib stream holding the u32
+length of a JSON header, the header, and the start snapshot in the binary
+save format (empty for games started from a seed). Event ticks are stored
+as deltas.
+"""
+import json
+import os
+import struct
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+from constants import REPLAY_CHECK_INTERVAL, REPLAY_KEEP
+from core.simulation import Simulation
+from save import codec, snapshot
+
+MAGIC = b"ZREP"
+REPLAY_VERSION = 1
+_HEADER = struct.Struct("<4sH")
+_U32 = struct.Struct("<I")
+
+# Replay event name -> Simulation command method
+COMMANDS = {
+    "place": "place_building",
+    "upgrade": "upgrade_building",
+    "repair": "repair_all",
+    "spawn_test": "spawn_test_zombies",
+}
+# Events that are not simulation commands
+CHECK = "check"  # (checksum,) the state must match
+SPEED = "speed"  # (game speed,) only matters for real-time playback
+
+
+class Replay:
+    def __init__(self, seed: int, events: List[List], end_tick: int,
+                 start_state: Optional[Dict[str, Any]] = None):
+        self.seed = seed
+        self.events = events  # [tick, name, *args], in the order they happened
+        self.end_tick = end_tick
+        self.start_state = start_state
+
+    def start(self) -> Simulation:
+        """A fresh Simulation in the state the recording started from."""
+        if self.start_state is not None:
+            return snapshot.restore(self.start_state)
+        return Simulation(seed=self.seed)
+
+    # --- File ---
+
+    def encode(self) -> bytes:
+        events = []
+        last = 0
+        for tick, *rest in self.events:
+            events.append([tick - last] + rest)
+            last = tick
+        head = json.dumps({"seed": self.seed, "end_tick": self.end_tick, "events": events},
+                          separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        start = codec.encode_binary(self.start_state) if self.start_state is not None else b""
+        return _HEADER.pack(MAGIC, REPLAY_VERSION) + zlib.compress(
+            _U32.pack(len(head)) + head + start)
+
+    @classmethod
+    def decode(cls, data: bytes) -> "Replay":
+        if len(data) < _HEADER.size:
+            raise ValueError("replay file is truncated")
+        magic, version = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("not a replay file")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"unsupported replay version {version}")
+        try:
+            body = zlib.decompress(data[_HEADER.size:])
+        except zlib.error as e:
+            raise ValueError(f"replay file is corrupt: {e}")
+        (head_len,) = _U32.unpack_from(body)
+        head = json.loads(body[_U32.size:_U32.size + head_len].decode("utf-8"))
+        start = body[_U32.size + head_len:]
+
+        events = []
+        tick = 0
+        for delta, *rest in head["events"]:
+            tick += delta
+            events.append([tick] + rest)
+        return cls(head["seed"], events, head["end_tick"],
+                   codec.decode_binary(start) if start else None)
+
+    def save(self, path: str):
+        with open(path, 'wb') as f:
+            f.write(self.encode())
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, 'rb') as f:
+            return cls.decode(f.read())
+
+
+class ReplayRecorder:
+    """Collects a running game's commands and checksums.
+
+    Hooks ``sim.on_command``; the game calls ``observe`` after advancing the
+    simulation (for the checksums) and ``record`` for the speed toggle."""
+
+    REPLAY_DIR = os.path.join(os.path.dirname(__file__), '..', 'replays')
+
+    def __init__(self, sim: Simulation, start_state: Optional[Dict[str, Any]] = None,
+                 check_interval: int = REPLAY_CHECK_INTERVAL):
+        self.replay = Replay(sim.seed, [], sim.tick, start_state)
+        self.check_interval = check_interval
+        self.next_check = sim.tick + check_interval
+        sim.on_command = self.record
+
+    def record(self, tick: int, name: str, args: Tuple = ()):
+        self.replay.events.append([tick, name, *args])
+
+    def observe(self, sim: Simulation):
+        if sim.tick >= self.next_check:
+            self.record(sim.tick, CHECK, (sim.checksum(),))
+            self.next_check = sim.tick + self.check_interval
+
+    def finish(self, sim: Simulation) -> Replay:
+        """Close the recording at the current tick, with a final checksum."""
+        if not self.replay.events or self.replay.events[-1][:2] != [sim.tick, CHECK]:
+            self.record(sim.tick, CHECK, (sim.checksum(),))
+        self.replay.end_tick = sim.tick
+        return self.replay
+
+    def save(self, sim: Simulation, filename: Optional[str] = None) -> str:
+        """Write the replay to REPLAY_DIR. Without a ``filename`` it gets a
+        fresh ``replay_*`` name, and only the newest REPLAY_KEEP of those are
+        kept."""
+        replay = self.finish(sim)
+        os.makedirs(self.REPLAY_DIR, exist_ok=True)
+        if filename is None:
+            filename = self._unique_name(sim)
+        path = os.path.join(self.REPLAY_DIR, filename)
+        replay.save(path)
+        self._prune(keep=path)
+        return path
+
+    def _unique_name(self, sim: Simulation) -> str:
+        base = time.strftime("replay_%Y%m%d_%H%M%S") + f"_{sim.seed:08x}_{sim.tick}"
+        filename, n = base + ".zrp", 1
+        while os.path.exists(os.path.join(self.REPLAY_DIR, filename)):
+            n += 1
+            filename = f"{base}_{n}.zrp"
+        return filename
+
+    def _prune(self, keep: str):
+        """Delete the oldest recordings past REPLAY_KEEP (never ``keep``)."""
+        paths = [os.path.join(self.REPLAY_DIR, name) for name in os.listdir(self.REPLAY_DIR)
+                 if name.startswith("replay_") and name.endswith(".zrp")]
+        paths.sort(key=os.path.getmtime, reverse=True)
+        for path in paths[REPLAY_KEEP:]:
+            if not os.path.samefile(path, keep):
+                os.remove(path)
+
+
+class ReplayPlayer:
+    """Steps a replay's simulation one tick at a time, issuing its commands.
+
+    ``desync`` is set to (tick, recorded checksum, replayed checksum) at the
+    first checksum that does not match; playback carries on regardless."""
+
+    def __init__(self, replay: Replay):
+        self.replay = replay
+        self.sim = replay.start()
+        self.speed = 1.0
+        self.desync: Optional[Tuple[int, int, int]] = None
+        self.checks = 0
+        self._next = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.sim.tick >= self.replay.end_tick or self.sim.finished
+
+    def _apply_due(self):
+        events = self.replay.events
+        sim = self.sim
+        while self._next < len(events) and events[self._next][0] <= sim.tick:
+            _, name, *args = events[self._next]
+            self._next += 1
+            if name == CHECK:
+                self.checks += 1
+                actual = sim.checksum()
+                if actual != args[0] and self.desync is None:
+                    self.desync = (sim.tick, args[0], actual)
+            elif name == SPEED:
+                self.speed = args[0]
+            else:
+                getattr(sim, COMMANDS[name])(*args)
+
+    def step(self):
+        """Issue the commands due at this tick, then run the tick."""
+        self._apply_due()
+        if not self.finished:
+            self.sim.step()
+            if self.finished:
+                self._apply_due()
+
+    def run(self) -> Simulation:
+        while not self.finished:
+            self.step()
+        return self.sim
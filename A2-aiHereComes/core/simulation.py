@@ -0,0 +1,281 @@
+import random
+import time
+from typing import Callable, Dict, Optional, Tuple
+import zlib
+from constants import (SIM_TICK_RATE, SIM_MAX_STEPS, TILE_SIZE, USE_ZOMBIE_SWARM,
+                       USE_HIERARCHICAL_PATHFINDING)
+from core.random_streams import RandomStreams
+from world.map import GameMap
+from world.map_generator import MapGenerator
+from systems.resource_manager import ResourceManager
+from systems.build_system import BuildSystem
+from systems.pathfinding import Pathfinder
+from systems.sector_pathfinding import SectorPathfinder
+from systems.combat_system import CombatSystem
+from systems.particle_system import ParticleBatch, ParticleSystem
+from systems.spatial_grid import SpatialGrid
+from systems.wave_manager import WaveManager, WaveState
+from systems.zombie_swarm import ZombieSwarm
+from entities.buildings.town_center import TownCenter
+from entities.building import Building
+from entities.zombie import Zombie
+
+
+class Simulation:
+    """Game state and rules, independent of the window, input and rendering.
+
+    Owns the map, economy, buildings, pathfinding, combat, waves and
+    zombies. ``advance`` runs whole fixed ``dt`` ticks for the real time
+    passed in, so results do not depend on the frame rate; ``step`` runs
+    exactly one tick. Display code hooks in through the ``on_*`` callbacks.
+
+    All randomness comes from the per-subsystem streams in ``rngs`` (waves,
+    zombies, particles, commands), derived from ``seed``; without a seed
+    one is picked at random and kept, so every game can be replayed.
+    Player actions go through the command methods, which report to
+    ``on_command``; replaying those at the same ticks reproduces a game."""
+
+    def __init__(self, seed: Optional[int] = None, game_map: Optional[GameMap] = None):
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rngs = RandomStreams(self.seed)
+        self.dt = 1.0 / SIM_TICK_RATE
+        self.tick = 0
+        self.time = 0.0
+        self.accumulator = 0.0
+        self.defeat = False
+        self.victory = False
+
+        # Called with the destroyed building / the number of the cleared wave
+        self.on_building_destroyed: Optional[Callable[[Building], None]] = None
+        self.on_wave_cleared: Optional[Callable[[int], None]] = None
+        # Called with (tick, command name, arguments) for every player command
+        self.on_command: Optional[Callable[[int, str, tuple], None]] = None
+
+        # Set to a dict to accumulate seconds spent per stage of step()
+        self.stage_times: Optional[Dict[str, float]] = None
+        self._stages = [
+            ("buildings", self._update_buildings),
+            ("waves", self._update_waves),
+            ("pathfinding", self._update_pathfinding),
+            ("zombies", self._update_zombies),
+            ("combat", self._update_combat),
+            ("deaths", self._handle_deaths),
+            ("particles", self._update_particles),
+        ]
+
+        # World
+        self.game_map = game_map or MapGenerator(self.seed).generate()
+
+        # Economy
+        self.resource_manager = ResourceManager()
+        self.build_system = BuildSystem(self.game_map, self.resource_manager)
+
+        # Town Center
+        tc_x = self.game_map.width // 2 - 1
+        tc_y = self.game_map.height // 2 - 1
+        self.town_center = TownCenter(tc_x, tc_y)
+        self.town_center.place_on_map(self.game_map)
+        self.build_system.buildings.append(self.town_center)
+        self.build_system._apply_bonuses(self.town_center)
+
+        # Combat
+        if USE_HIERARCHICAL_PATHFINDING:
+            self.pathfinder = SectorPathfinder(self.game_map)
+        else:
+            self.pathfinder = Pathfinder(self.game_map)
+        self.pathfinder.set_goals(self.town_center.get_occupied_tiles())
+        self.combat_system = CombatSystem()
+        if ParticleBatch.available():
+            self.particle_system = ParticleBatch(self.rngs["particles"])
+        else:
+            self.particle_system = ParticleSystem(self.rngs["particles"])
+        self.combat_system.projectiles.on_splash = self._on_splash
+        if USE_ZOMBIE_SWARM and ZombieSwarm.available():
+            self.zombies = ZombieSwarm(self.game_map, seed=self.seed)
+        else:
+            self.zombies = []
+        self.zombie_grid = SpatialGrid()
+
+        # Waves
+        self.wave_manager = WaveManager(self.rngs["waves"])
+
+    @property
+    def finished(self) -> bool:
+        return self.defeat or self.victory
+
+    # --- Commands ---
+
+    def _command(self, name: str, *args):
+        if self.on_command:
+            self.on_command(self.tick, name, args)
+
+    def place_building(self, tile_x: int, tile_y: int, building_type: str) -> Optional[Building]:
+        self._command("place", tile_x, tile_y, building_type)
+        placed = self.build_system.place_building(tile_x, tile_y, building_type)
+        if placed:
+            self.pathfinder.invalidate(placed.get_occupied_tiles())
+        return placed
+
+    def upgrade_building(self, tile_x: int, tile_y: int) -> Optional[Building]:
+        """Upgrade the building on a tile if it can be upgraded and afforded."""
+        self._command("upgrade", tile_x, tile_y)
+        building = self.game_map.building_at(tile_x, tile_y)
+        if building is None or not building.can_upgrade():
+            return None
+        cost = building.get_upgrade_cost()
+        if not self.resource_manager.spend(cost):
+            return None
+        building.upgrade()
+        return building
+
+    def repair_all(self) -> Tuple[int, int]:
+        self._command("repair")
+        return self.build_system.repair_all()
+
+    def spawn_test_zombies(self, count: int = 5):
+        """Debug: a pack of basic zombies at a random point on the map edge."""
+        self._command("spawn_test", count)
+        x, y = self.wave_manager.get_spawn_point(self.rngs["commands"])
+        for _ in range(count):
+            self.spawn_zombie("basic",
+                              x + self.rngs["commands"].uniform(-50, 50),
+                              y + self.rngs["commands"].uniform(-50, 50))
+
+    def spawn_zombie(self, zombie_type: str, x: float, y: float,
+                     hp_mult: float = 1.0, dmg_mult: float = 1.0) -> Zombie:
+        z = Zombie(x, y, zombie_type, self.rngs["zombies"])
+        z.max_hp = int(z.max_hp * hp_mult)
+        z.hp = z.max_hp
+        z.damage = int(z.damage * dmg_mult)
+        z.goal_x = self.town_center.center[0]
+        z.goal_y = self.town_center.center[1]
+        if isinstance(self.zombies, ZombieSwarm):
+            return self.zombies.append(z)
+        self.zombies.append(z)
+        return z
+
+    # --- Replays ---
+
+    def checksum(self) -> int:
+        """CRC of the gameplay state. Two runs of the same replay with equal
+        checksums at a tick have not diverged (as far as this can tell)."""
+        zombies = list(self.zombies)
+        state = (self.tick, sorted(self.resource_manager.resources.items()),
+                 self.wave_manager.current_wave, len(zombies),
+                 sum(z.x for z in zombies), sum(z.y for z in zombies),
+                 sum(z.hp for z in zombies),
+                 [(b.tile_x, b.tile_y, b.level, b.hp) for b in self.build_system.buildings])
+        return zlib.crc32(repr(state).encode("utf-8"))
+
+    # --- Time ---
+
+    def advance(self, elapsed: float) -> int:
+        """Run the fixed ticks covered by ``elapsed`` seconds. Returns the count.
+        At most SIM_MAX_STEPS run per call; time beyond that is dropped."""
+        self.accumulator += elapsed
+        steps = 0
+        while self.accumulator >= self.dt and not self.finished:
+            if steps == SIM_MAX_STEPS:
+                self.accumulator = 0.0
+                break
+            self.step()
+            self.accumulator -= self.dt
+            steps += 1
+        return steps
+
+    def step(self):
+        """Advance the game by exactly one tick."""
+        if self.finished:
+            return
+        self.tick += 1
+        self.time += self.dt
+
+        times = self.stage_times
+        if times is None:
+            for _, stage in self._stages:
+                stage()
+        else:
+            clock = time.perf_counter
+            for name, stage in self._stages:
+                start = clock()
+                stage()
+                times[name] = times.get(name, 0.0) + clock() - start
+
+    # --- Stages of a tick ---
+
+    def _update_buildings(self):
+        self.build_system.update(self.dt)
+
+    def _update_waves(self):
+        spawns = self.wave_manager.update(self.dt)
+        hp_mult, dmg_mult = self.wave_manager.get_difficulty_multiplier()
+        for zombie_type, sx, sy in spawns:
+            self.spawn_zombie(zombie_type, sx, sy, hp_mult, dmg_mult)
+
+        # Check wave complete
+        if self.wave_manager.state == WaveState.ACTIVE:
+            if len(self.wave_manager.spawn_queue) == 0 and len(self.zombies) == 0:
+                self.wave_manager.check_wave_complete(0)
+                if self.wave_manager.state == WaveState.PREP and self.on_wave_cleared:
+                    self.on_wave_cleared(self.wave_manager.current_wave)
+
+    def _update_pathfinding(self):
+        # Brings the flow field up to date; zombies then only read it
+        if isinstance(self.pathfinder, SectorPathfinder):
+            self.pathfinder.prepare(self._zombie_tiles())
+        else:
+            self.pathfinder.direction_codes()
+
+    def _zombie_tiles(self):
+        if isinstance(self.zombies, ZombieSwarm):
+            return self.zombies.tiles()
+        return [(int(z.center[0] // TILE_SIZE), int(z.center[1] // TILE_SIZE))
+                for z in self.zombies if z.alive]
+
+    def _update_zombies(self):
+        buildings = self.build_system.buildings
+        if isinstance(self.zombies, ZombieSwarm):
+            self.zombies.update(self.dt, self.pathfinder, self.game_map, buildings)
+        else:
+            for zombie in self.zombies:
+                zombie.update(self.dt, self.pathfinder, self.game_map, buildings)
+        self.zombie_grid.rebuild(self.zombies)
+
+    def _update_combat(self):
+        self.combat_system.update(self.dt, self.build_system.buildings,
+                                  self.zombies, self.zombie_grid)
+
+    def _handle_deaths(self):
+        # Zombies
+        for zombie in self.zombies:
+            if not zombie.alive:
+                self.particle_system.emit(zombie.center[0], zombie.center[1],
+                                          count=6, color=(180, 0, 0))
+                self.wave_manager.on_zombie_killed()
+        if isinstance(self.zombies, ZombieSwarm):
+            self.zombies.remove_dead()
+        else:
+            self.zombies = [z for z in self.zombies if z.alive]
+
+        # Buildings
+        for building in self.build_system.buildings[:]:
+            if not building.alive:
+                self.particle_system.emit(building.center[0], building.center[1],
+                                          count=10, color=(150, 100, 50))
+                self.build_system.remove_building(building)
+                self.pathfinder.invalidate(building.get_occupied_tiles())
+                if isinstance(building, TownCenter):
+                    self.defeat = True
+                if self.on_building_destroyed:
+                    self.on_building_destroyed(building)
+
+        # Victory check
+        if not self.defeat and self.wave_manager.is_victory():
+            self.victory = True
+
+    def _on_splash(self, x: float, y: float, radius: float):
+        self.particle_system.emit(x, y, count=8, color=(120, 110, 90),
+                                  speed_range=(radius, radius * 2.5))
+
+    def _update_particles(self):
+        self.particle_system.update(self.dt)
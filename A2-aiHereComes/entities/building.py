@@ -2,6 +2,11 @@ from typing import List, Dict, Tuple, Optional
 import pygame
 from entities.entity import Entity
 from constants import TILE_SIZE
+from rendering.sprite_cache import sprite_cache
+from rendering.text import get_font, render_text
+
+# Room around the sprite for details that overhang the footprint
+SPRITE_PAD = 4
 
 
 class Building(Entity):
@@ -37,16 +42,10 @@ class Building(Entity):
         return tiles
 
     def place_on_map(self, game_map):
-        for tx, ty in self.get_occupied_tiles():
-            tile = game_map.get_tile(tx, ty)
-            if tile:
-                tile.building = self
+        game_map.place_building(self)
 
     def remove_from_map(self, game_map):
-        for tx, ty in self.get_occupied_tiles():
-            tile = game_map.get_tile(tx, ty)
-            if tile and tile.building is self:
-                tile.building = None
+        game_map.remove_building(self)
 
     def update(self, dt: float):
         if not self.is_complete:
@@ -63,35 +62,18 @@ class Building(Entity):
     def get_color(self) -> Tuple[int, int, int]:
         return (150, 150, 150)
 
+    def sprite_key(self) -> tuple:
+        """Everything the cached body sprite depends on."""
+        return (type(self), self.width, self.height, self.level, self.is_complete,
+                self.get_color())
+
     def draw(self, surface: pygame.Surface, camera):
         sx, sy = camera.world_to_screen(self.x, self.y)
 
-        # Building body
-        color = self.get_color()
-        if not self.is_complete:
-            color = tuple(c // 2 for c in color)
-
-        # Draw main body
-        pygame.draw.rect(surface, color,
-                         (int(sx), int(sy), self.width, self.height))
-        pygame.draw.rect(surface, (0, 0, 0),
-                         (int(sx), int(sy), self.width, self.height), 2)
-
-        # Draw inner detail border
-        inner_color = tuple(min(255, c + 30) for c in color)
-        pygame.draw.rect(surface, inner_color,
-                         (int(sx) + 3, int(sy) + 3, self.width - 6, self.height - 6), 1)
-
-        # Draw building-specific detail/icon
-        if self.is_complete:
-            self._draw_detail(surface, int(sx), int(sy))
-            # Draw level indicator (stars in top-right)
-            if self.level > 1:
-                star_font = pygame.font.SysFont(None, 16)
-                star_text = "★" * (self.level - 1)
-                star_surf = star_font.render(star_text, True, (255, 220, 50))
-                surface.blit(star_surf, (int(sx) + self.width - star_surf.get_width() - 2,
-                                         int(sy) + 2))
+        # Body, borders, details and level stars come from the sprite cache
+        sprite = sprite_cache.get(self.sprite_key(), (self.width, self.height),
+                                  self._draw_body, SPRITE_PAD)
+        surface.blit(sprite, (int(sx) - SPRITE_PAD, int(sy) - SPRITE_PAD))
 
         # Construction progress bar
         if not self.is_complete:
@@ -112,6 +94,30 @@ class Building(Entity):
             hp_color = (0, 200, 0) if hp_ratio > 0.5 else (200, 200, 0) if hp_ratio > 0.25 else (200, 0, 0)
             pygame.draw.rect(surface, hp_color, (int(sx), bar_y, int(bar_w * hp_ratio), bar_h))
 
+    def _draw_body(self, surface: pygame.Surface, sx: int, sy: int):
+        # Building body
+        color = self.get_color()
+        if not self.is_complete:
+            color = tuple(c // 2 for c in color)
+
+        # Draw main body
+        pygame.draw.rect(surface, color, (sx, sy, self.width, self.height))
+        pygame.draw.rect(surface, (0, 0, 0), (sx, sy, self.width, self.height), 2)
+
+        # Draw inner detail border
+        inner_color = tuple(min(255, c + 30) for c in color)
+        pygame.draw.rect(surface, inner_color,
+                         (sx + 3, sy + 3, self.width - 6, self.height - 6), 1)
+
+        # Draw building-specific detail/icon
+        if self.is_complete:
+            self._draw_detail(surface, sx, sy)
+            # Draw level indicator (stars in top-right)
+            if self.level > 1:
+                star_text = "★" * (self.level - 1)
+                star_surf = render_text(get_font(16), star_text, (255, 220, 50))
+                surface.blit(star_surf, (sx + self.width - star_surf.get_width() - 2, sy + 2))
+
     def _draw_detail(self, surface: pygame.Surface, sx: int, sy: int):
         """Override in subclasses to draw building-specific details."""
         pass
@@ -1,19 +1,10 @@
 import pygame
-from typing import Dict
+from typing import Dict, Mapping, Sequence
 from entities.building import Building
+from systems.data_registry import registry
 
 
 class Tower(Building):
-    # Upgrade costs: level -> cost dict
-    WOOD_UPGRADE_COSTS = {
-        1: {"wood": 20, "gold": 15},
-        2: {"wood": 30, "gold": 25},
-    }
-    STONE_UPGRADE_COSTS = {
-        1: {"stone": 20, "gold": 20},
-        2: {"stone": 35, "gold": 35},
-    }
-
     def __init__(self, tile_x: int, tile_y: int, tower_type: str = "wood"):
         if tower_type == "stone":
             super().__init__(
@@ -44,24 +35,33 @@ class Tower(Building):
             self.tower_color = (160, 100, 50)
             self.tower_type = "wood"
 
+        self.splash_radius = 0.0  # Tiles; projectiles damage every zombie this close to the hit
         self.attack_timer = 0.0
         self.target = None
+        self.max_level = 1 + len(self._upgrades())
+
+    def _upgrades(self) -> Sequence[Mapping]:
+        """Upgrade steps from buildings.json; step i takes level i + 1 to i + 2."""
+        data = registry.building(f"{self.tower_type}_tower")
+        return data.extra.get("upgrades", ()) if data else ()
 
     def get_upgrade_cost(self) -> Dict[str, int]:
-        costs = self.STONE_UPGRADE_COSTS if self.tower_type == "stone" else self.WOOD_UPGRADE_COSTS
-        return costs.get(self.level, {})
+        upgrades = self._upgrades()
+        if self.level > len(upgrades):
+            return {}
+        return dict(upgrades[self.level - 1]["cost"])
 
     def upgrade(self):
-        if self.tower_type == "stone":
-            self.max_hp += 80
-            self.hp = self.max_hp
-            self.attack_damage += 8
-            self.attack_range += 1
-        else:
-            self.max_hp += 50
-            self.hp = self.max_hp
-            self.attack_damage += 5
-            self.attack_range += 1
+        step = self._upgrades()[self.level - 1]
+        self.max_hp += step.get("hp", 0)
+        self.hp = self.max_hp
+        self.attack_damage += step.get("damage", 0)
+        self.attack_range += step.get("range", 0)
+        self.attack_speed = round(self.attack_speed + step.get("attack_speed", 0), 2)
+        if step.get("splash_radius"):
+            # The stone tower's last upgrade turns it into a catapult
+            self.splash_radius = step["splash_radius"]
+            self.name = "投石塔"
         self.level += 1
 
     def get_color(self):
@@ -81,6 +81,11 @@ class Tower(Building):
         for cx in [sx + 6, sx + 14, sx + 22]:
             pygame.draw.rect(surface, crenel_color, (cx, sy + 4, 4, 6))
 
-        # Arrow slit (center)
-        pygame.draw.rect(surface, (40, 40, 40), (sx + 14, sy + 12, 4, 8))
-        pygame.draw.rect(surface, (40, 40, 40), (sx + 12, sy + 14, 8, 4))
+        if self.splash_radius > 0:
+            # Loaded boulder
+            pygame.draw.circle(surface, (70, 65, 60), (sx + 16, sy + 17), 5)
+            pygame.draw.circle(surface, (40, 40, 40), (sx + 16, sy + 17), 5, 1)
+        else:
+            # Arrow slit (center)
+            pygame.draw.rect(surface, (40, 40, 40), (sx + 14, sy + 12, 4, 8))
+            pygame.draw.rect(surface, (40, 40, 40), (sx + 12, sy + 14, 8, 4))
@@ -1,30 +1,31 @@
-import json
-import os
 import math
 import random
 from typing import Tuple, Optional
 import pygame
 from entities.entity import Entity
+from rendering.sprite_cache import sprite_cache
+from systems.data_registry import registry
 from constants import TILE_SIZE, MAP_WIDTH, MAP_HEIGHT
 
 
-class Zombie(Entity):
-    def __init__(self, x: float, y: float, zombie_type: str = "basic"):
-        data_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'zombies.json')
-        with open(data_path, 'r') as f:
-            all_data = json.load(f)
+# Room around the sprite for the arms and the shadow
+SPRITE_PAD = 6
+
 
-        data = all_data.get(zombie_type, all_data["basic"])
-        size = 24 if zombie_type != "boss" else 40
-        super().__init__(x, y, size, size, data["hp"])
+class Zombie(Entity):
+    def __init__(self, x: float, y: float, zombie_type: str = "basic",
+                 rng: Optional[random.Random] = None):
+        data = registry.zombie(zombie_type)
+        super().__init__(x, y, data.size, data.size, data.hp)
 
         self.zombie_type = zombie_type
-        self.speed = data["speed"]
-        self.damage = data["damage"]
-        self.attack_rate = data["attack_rate"]
-        self.color = tuple(data["color"])
+        self.speed = data.speed
+        self.damage = data.damage
+        self.attack_rate = data.attack_rate
+        self.color = data.color
         self.attack_timer = 0.0
         self.target_building = None
+        self.rng = rng or random  # Movement jitter; the simulation passes its seeded stream
         # Town center goal position (set by game)
         self.goal_x = 0.0
         self.goal_y = 0.0
@@ -36,9 +37,12 @@ class Zombie(Entity):
         self.attack_timer -= dt
 
         # Check for nearby buildings to attack
-        if buildings:
+        best_building = None
+        if game_map is not None:
+            cx, cy = self.center
+            best_building = game_map.nearest_building(cx, cy, TILE_SIZE * 1.5)
+        elif buildings:
             best_dist = TILE_SIZE * 1.5
-            best_building = None
             for building in buildings:
                 if not building.alive:
                     continue
@@ -47,9 +51,9 @@ class Zombie(Entity):
                     best_dist = dist
                     best_building = building
 
-            if best_building and best_dist < TILE_SIZE * 1.2:
-                self._attack_building(best_building, dt)
-                return
+        if best_building and self._distance_to(best_building.center) < TILE_SIZE * 1.2:
+            self._attack_building(best_building, dt)
+            return
 
         # Move toward goal using flow field or direct movement
         moved = False
@@ -76,8 +80,8 @@ class Zombie(Entity):
                 self.y += (dy / dist) * self.speed * dt
 
         # Small random jitter to avoid stacking
-        self.x += random.uniform(-3, 3) * dt
-        self.y += random.uniform(-3, 3) * dt
+        self.x += self.rng.uniform(-3, 3) * dt
+        self.y += self.rng.uniform(-3, 3) * dt
 
     def _distance_to(self, pos: Tuple[float, float]) -> float:
         cx, cy = self.center
@@ -95,6 +99,22 @@ class Zombie(Entity):
         sx, sy = camera.world_to_screen(self.x, self.y)
         ix, iy = int(sx), int(sy)
 
+        sprite = sprite_cache.get(("zombie", self.zombie_type, self.width, self.height,
+                                   self.color),
+                                  (self.width, self.height), self._draw_body, SPRITE_PAD)
+        surface.blit(sprite, (ix - SPRITE_PAD, iy - SPRITE_PAD))
+
+        # HP bar
+        if self.hp < self.max_hp:
+            bar_w = self.width
+            bar_h = 3
+            bar_y = iy - 5
+            pygame.draw.rect(surface, (60, 0, 0), (ix, bar_y, bar_w, bar_h))
+            hp_ratio = self.hp / self.max_hp
+            pygame.draw.rect(surface, (200, 0, 0),
+                             (ix, bar_y, int(bar_w * hp_ratio), bar_h))
+
+    def _draw_body(self, surface: pygame.Surface, ix: int, iy: int):
         # Shadow
         pygame.draw.ellipse(surface, (0, 0, 0, 80),
                             (ix + 2, iy + self.height - 4, self.width - 4, 6))
@@ -122,13 +142,3 @@ class Zombie(Entity):
         pygame.draw.line(surface, arm_color,
                          (ix + self.width - 2, iy + self.height // 2),
                          (ix + self.width + 4, iy + self.height // 2 + 4), 2)
-
-        # HP bar
-        if self.hp < self.max_hp:
-            bar_w = self.width
-            bar_h = 3
-            bar_y = iy - 5
-            pygame.draw.rect(surface, (60, 0, 0), (ix, bar_y, bar_w, bar_h))
-            hp_ratio = self.hp / self.max_hp
-            pygame.draw.rect(surface, (200, 0, 0),
-                             (ix, bar_y, int(bar_w * hp_ratio), bar_h))
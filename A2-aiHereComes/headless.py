@@ -0,0 +1,94 @@
+"""Run the game simulation without a window, as fast as the CPU allows.
+
+Run from the project root:  python headless.py [--waves 30] [--seed 1] [--towers 60]
+Play back a recorded game:  python headless.py --replay replays/<file>.zrp [--spikes 5]
+"""
+import argparse
+import heapq
+import os
+import time
+
+# Entities import pygame; make sure nothing can open a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from bench.scenarios import fortify  # noqa: E402
+from constants import SIM_TICK_RATE  # noqa: E402
+from core.replay import Replay, ReplayPlayer  # noqa: E402
+from core.simulation import Simulation  # noqa: E402
+
+
+def play_replay(path: str, spikes: int):
+    """Replay a recorded game, check its checksums and list the slowest ticks."""
+    replay = Replay.load(path)
+    player = ReplayPlayer(replay)
+    sim = player.sim
+    first_tick = sim.tick
+    slowest = []  # Min-heap of (seconds, tick, stage seconds)
+
+    start = time.perf_counter()
+    while not player.finished:
+        stages = {}
+        sim.stage_times = stages
+        tick_start = time.perf_counter()
+        player.step()
+        tick_time = time.perf_counter() - tick_start
+        if len(slowest) < spikes:
+            heapq.heappush(slowest, (tick_time, sim.tick, stages))
+        elif spikes and tick_time > slowest[0][0]:
+            heapq.heapreplace(slowest, (tick_time, sim.tick, stages))
+    elapsed = time.perf_counter() - start
+
+    ticks = sim.tick - first_tick
+    print(f"{path}: seed {replay.seed}, ticks {first_tick}-{sim.tick}, "
+          f"{len(replay.events)} events")
+    print(f"{ticks} ticks in {elapsed:.2f}s = {ticks / SIM_TICK_RATE / max(elapsed, 1e-9):.1f}x real time")
+    for tick_time, tick, stages in sorted(slowest, reverse=True):
+        breakdown = "  ".join(f"{name} {seconds * 1000.0:.2f}"
+                              for name, seconds in sorted(stages.items(), key=lambda kv: -kv[1]))
+        print(f"  tick {tick:8d}  {tick_time * 1000.0:7.2f} ms   {breakdown}")
+    if player.desync is not None:
+        tick, expected, actual = player.desync
+        print(f"DESYNC at tick {tick}: recorded checksum {expected:08x}, replayed {actual:08x}")
+        raise SystemExit(1)
+    print(f"in sync: {player.checks} checksums matched")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--waves", type=int, default=30, help="stop after this many waves")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--towers", type=int, default=60, help="stone towers around the Town Center")
+    parser.add_argument("--max-ticks", type=int, default=10 ** 7)
+    parser.add_argument("--replay", help="play back a replay file instead")
+    parser.add_argument("--spikes", type=int, default=5, help="slowest replay ticks to list")
+    args = parser.parse_args()
+    if args.replay:
+        play_replay(args.replay, args.spikes)
+        return
+
+    sim = Simulation(seed=args.seed)
+    towers = fortify(sim, args.towers)
+    waves = sim.wave_manager
+
+    start = time.perf_counter()
+    last_wave = 0
+    while not sim.finished and sim.tick < args.max_ticks:
+        sim.step()
+        if waves.current_wave != last_wave:
+            last_wave = waves.current_wave
+            print(f"  tick {sim.tick:8d}  wave {last_wave:3d}  zombies {len(sim.zombies):5d}  "
+                  f"buildings {len(sim.build_system.buildings):4d}")
+        if waves.current_wave >= args.waves and len(waves.spawn_queue) == 0 \
+                and len(sim.zombies) == 0:
+            break
+    elapsed = time.perf_counter() - start
+
+    outcome = "defeat" if sim.defeat else "victory" if sim.victory else "stopped"
+    print(f"{outcome} at wave {waves.current_wave} with {towers} towers, "
+          f"{waves.total_zombies_killed} zombies killed")
+    print(f"{sim.tick} ticks ({sim.time / 60:.1f} game minutes) in {elapsed:.2f}s "
+          f"= {sim.tick / elapsed:,.0f} ticks/s")
+
+
+if __name__ == "__main__":
+    main()
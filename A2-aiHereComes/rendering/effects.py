@@ -1,11 +1,13 @@
 import random
-from typing import Tuple
-import pygame
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from typing import Optional, Tuple
 
 
 class ScreenEffects:
-    def __init__(self):
+    """Screen shake. ``shake_offset`` is fed to the camera each frame
+    (``Camera.shake``), so only the world layer moves."""
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng or random.Random()  # Cosmetic; kept off the simulation's streams
         self.shake_amount = 0.0
         self.shake_duration = 0.0
         self.shake_offset: Tuple[int, int] = (0, 0)
@@ -18,15 +20,8 @@ class ScreenEffects:
         if self.shake_duration > 0:
             self.shake_duration -= dt
             self.shake_offset = (
-                random.randint(int(-self.shake_amount), int(self.shake_amount)),
-                random.randint(int(-self.shake_amount), int(self.shake_amount))
+                self.rng.randint(int(-self.shake_amount), int(self.shake_amount)),
+                self.rng.randint(int(-self.shake_amount), int(self.shake_amount))
             )
         else:
             self.shake_offset = (0, 0)
-
-    def apply(self, surface: pygame.Surface):
-        if self.shake_offset != (0, 0):
-            # Create a copy and shift it
-            temp = surface.copy()
-            surface.fill((0, 0, 0))
-            surface.blit(temp, self.shake_offset)
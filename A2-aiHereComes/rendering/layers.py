@@ -0,0 +1,67 @@
+from typing import Callable, Dict, Hashable, Optional, Tuple
+import pygame
+
+
+class LayerCache:
+    """Pre-built surfaces for the UI: translucent fills, full-screen overlays
+    and panels that are repainted only when what they show changes.
+
+    Draw code asks for a layer each frame and blits it; nothing is allocated
+    unless the layer is new or changed size. Every Surface made here is
+    counted in ``allocations`` so the profiler can show the UI's surface
+    allocations per frame; new draw paths should get their surfaces from
+    ``new`` (or a layer) for the same reason."""
+
+    def __init__(self):
+        self.fills: Dict[Hashable, pygame.Surface] = {}
+        self.layers: Dict[Hashable, Tuple[pygame.Surface, Hashable]] = {}
+        self.allocations = 0  # Surfaces created since start
+        self.repaints = 0  # Layer repaints since start
+
+    def new(self, size: Tuple[int, int], flags: int = pygame.SRCALPHA) -> pygame.Surface:
+        self.allocations += 1
+        return pygame.Surface(size, flags)
+
+    def fill(self, size: Tuple[int, int], color: Tuple[int, ...],
+             alpha: int = 255) -> pygame.Surface:
+        """A surface of ``size`` filled with ``color`` (RGBA). ``alpha`` fades
+        the whole surface on top of the color's own alpha; it is set on the
+        shared surface on every call, so blit the result straight away."""
+        key = (size, color)
+        surf = self.fills.get(key)
+        if surf is None:
+            surf = self.new(size)
+            surf.fill(color)
+            self.fills[key] = surf
+        surf.set_alpha(alpha)
+        return surf
+
+    def get(self, key: Hashable, size: Tuple[int, int],
+            painter: Callable[[pygame.Surface], None],
+            version: Optional[Hashable] = None) -> pygame.Surface:
+        """The layer ``key``, painted by ``painter`` onto a cleared surface
+        when first made and again whenever ``version`` differs from the
+        version it was last painted at."""
+        entry = self.layers.get(key)
+        if entry is not None and entry[1] == version:
+            return entry[0]
+        if entry is None or entry[0].get_size() != tuple(size):
+            surf = self.new(size)
+        else:
+            surf = entry[0]
+            surf.fill((0, 0, 0, 0))
+        painter(surf)
+        self.repaints += 1
+        self.layers[key] = (surf, version)
+        return surf
+
+    def clear(self):
+        self.fills.clear()
+        self.layers.clear()
+
+    def __len__(self) -> int:
+        return len(self.fills) + len(self.layers)
+
+
+# Shared process-wide cache
+layers = LayerCache()
@@ -1,8 +1,19 @@
+import math
+from collections import OrderedDict
+from typing import Optional, Tuple
 import pygame
 from constants import (SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, MAP_WIDTH, MAP_HEIGHT,
-                       MINIMAP_SIZE, MINIMAP_MARGIN, TERRAIN_COLORS, Color, TerrainType)
+                       MINIMAP_SIZE, MINIMAP_MARGIN, MINIMAP_ZOMBIE_HZ, TERRAIN_COLORS,
+                       TERRAIN_CHUNK_TILES, TERRAIN_CHUNK_CACHE, Color, TerrainType)
 from core.camera import Camera
-from world.map import GameMap
+from world.map import GameMap, TERRAIN_TYPES
+
+try:
+    import numpy as np
+except ImportError:  # The minimap terrain is then baked with a PixelArray
+    np = None
+
+MINIMAP_KEY = (255, 0, 255)  # Transparent colorkey of the minimap overlays
 
 
 class Renderer:
@@ -10,29 +21,83 @@ class Renderer:
         self.screen = screen
         self.minimap_surface = pygame.Surface((MINIMAP_SIZE, MINIMAP_SIZE))
 
+        # Pre-rendered terrain chunks, (chunk_x, chunk_y) -> Surface, in LRU order
+        self.terrain_chunks: "OrderedDict[Tuple[int, int], pygame.Surface]" = OrderedDict()
+        self._terrain_map: Optional[GameMap] = None
+
+        # Minimap layers: terrain is baked once per map, buildings are redrawn
+        # when the building set changes, zombie dots at MINIMAP_ZOMBIE_HZ
+        self.minimap_terrain: Optional[pygame.Surface] = None
+        self.minimap_buildings = self._minimap_overlay()
+        self.minimap_zombies = self._minimap_overlay()
+        self._minimap_map: Optional[GameMap] = None
+        self._minimap_buildings_dirty = True
+        self._minimap_building_count = -1
+        self._next_zombie_refresh = 0
+
     def render(self, game_map: GameMap, camera: Camera):
         self.screen.fill(Color.BLACK)
         self._render_terrain(game_map, camera)
         self._render_minimap(game_map, camera)
 
     def _render_terrain(self, game_map: GameMap, camera: Camera):
+        """Blit the cached terrain chunks that overlap the screen."""
+        if game_map is not self._terrain_map:
+            self.invalidate_terrain()
+            self._terrain_map = game_map
+
         start_col, start_row, end_col, end_row = camera.get_visible_tile_range()
+        chunk_px = TERRAIN_CHUNK_TILES * TILE_SIZE
+        for chunk_y in range(start_row // TERRAIN_CHUNK_TILES,
+                             (end_row - 1) // TERRAIN_CHUNK_TILES + 1):
+            for chunk_x in range(start_col // TERRAIN_CHUNK_TILES,
+                                 (end_col - 1) // TERRAIN_CHUNK_TILES + 1):
+                surf = self._get_terrain_chunk(game_map, chunk_x, chunk_y)
+                sx, sy = camera.world_to_screen(chunk_x * chunk_px, chunk_y * chunk_px)
+                self.screen.blit(surf, (math.floor(sx), math.floor(sy)))
 
-        for row in range(start_row, end_row):
-            for col in range(start_col, end_col):
-                tile = game_map.get_tile(col, row)
-                if tile is None:
-                    continue
-                color = TERRAIN_COLORS.get(tile.terrain, Color.GRASS)
-                sx, sy = camera.world_to_screen(col * TILE_SIZE, row * TILE_SIZE)
-                ix, iy = int(sx), int(sy)
-                pygame.draw.rect(self.screen, color, (ix, iy, TILE_SIZE, TILE_SIZE))
+    def invalidate_terrain(self, tile_x: Optional[int] = None, tile_y: Optional[int] = None):
+        """Drop the cached chunk holding a tile whose terrain changed, or all chunks."""
+        if tile_x is None or tile_y is None:
+            self.terrain_chunks.clear()
+        else:
+            self.terrain_chunks.pop((tile_x // TERRAIN_CHUNK_TILES,
+                                     tile_y // TERRAIN_CHUNK_TILES), None)
+
+    def _get_terrain_chunk(self, game_map: GameMap, chunk_x: int, chunk_y: int) -> pygame.Surface:
+        key = (chunk_x, chunk_y)
+        surf = self.terrain_chunks.get(key)
+        if surf is not None:
+            self.terrain_chunks.move_to_end(key)
+            return surf
+
+        surf = self._build_terrain_chunk(game_map, chunk_x, chunk_y)
+        self.terrain_chunks[key] = surf
+        if len(self.terrain_chunks) > TERRAIN_CHUNK_CACHE:
+            self.terrain_chunks.popitem(last=False)
+        return surf
+
+    def _build_terrain_chunk(self, game_map: GameMap, chunk_x: int, chunk_y: int) -> pygame.Surface:
+        col0 = chunk_x * TERRAIN_CHUNK_TILES
+        row0 = chunk_y * TERRAIN_CHUNK_TILES
+        cols = min(TERRAIN_CHUNK_TILES, game_map.width - col0)
+        rows = min(TERRAIN_CHUNK_TILES, game_map.height - row0)
+        surf = pygame.Surface((cols * TILE_SIZE, rows * TILE_SIZE), 0, self.screen)
+
+        for row in range(rows):
+            base = (row0 + row) * game_map.width + col0
+            for col, tid in enumerate(game_map.terrain[base:base + cols]):
+                terrain = TERRAIN_TYPES[tid]
+                color = TERRAIN_COLORS.get(terrain, Color.GRASS)
+                ix, iy = col * TILE_SIZE, row * TILE_SIZE
+                pygame.draw.rect(surf, color, (ix, iy, TILE_SIZE, TILE_SIZE))
 
                 # Draw terrain decoration symbols
-                if tile.terrain == TerrainType.FOREST:
-                    self._draw_tree(self.screen, ix, iy)
-                elif tile.terrain == TerrainType.STONE:
-                    self._draw_rock(self.screen, ix, iy)
+                if terrain == TerrainType.FOREST:
+                    self._draw_tree(surf, ix, iy)
+                elif terrain == TerrainType.STONE:
+                    self._draw_rock(surf, ix, iy)
+        return surf
 
     def _draw_tree(self, surface: pygame.Surface, sx: int, sy: int):
         """Draw a small tree icon on forest tiles."""
@@ -66,44 +131,91 @@ class Renderer:
                             [(sx + 14, sy + 10), (sx + 12, sy + 8),
                              (sx + 16, sy + 6), (sx + 20, sy + 10), (sx + 18, sy + 12)])
 
+    @staticmethod
+    def _minimap_overlay() -> pygame.Surface:
+        surf = pygame.Surface((MINIMAP_SIZE, MINIMAP_SIZE))
+        surf.fill(MINIMAP_KEY)
+        surf.set_colorkey(MINIMAP_KEY)
+        return surf
+
+    def invalidate_minimap(self, terrain: bool = False):
+        """Redraw the minimap building layer (and terrain) on the next frame.
+        Call after buildings are placed or removed, or the terrain changed."""
+        self._minimap_buildings_dirty = True
+        if terrain:
+            self.minimap_terrain = None
+
+    def _bake_minimap_terrain(self, game_map: GameMap) -> pygame.Surface:
+        """One pixel per tile from the map's terrain ids, scaled to the minimap."""
+        colors = [TERRAIN_COLORS.get(t, Color.GRASS) for t in TERRAIN_TYPES]
+        width, height = game_map.width, game_map.height
+
+        if np is not None:
+            palette = np.array(colors, dtype=np.uint8)
+            ids = np.frombuffer(game_map.terrain, dtype=np.uint8).reshape(height, width)
+            # surfarray is indexed [x, y]
+            pixels = palette[ids.T]
+            full = pygame.surfarray.make_surface(pixels)
+        else:
+            full = pygame.Surface((width, height))
+            palette = [full.map_rgb(c) for c in colors]
+            pixels = pygame.PixelArray(full)
+            terrain = game_map.terrain
+            for y in range(height):
+                base = y * width
+                for x in range(width):
+                    pixels[x, y] = palette[terrain[base + x]]
+            pixels.close()
+        return pygame.transform.scale(full, (MINIMAP_SIZE, MINIMAP_SIZE))
+
+    def _draw_minimap_buildings(self, buildings, tile_w: float, tile_h: float):
+        layer = self.minimap_buildings
+        layer.fill(MINIMAP_KEY)
+        for b in buildings:
+            bx = int(b.tile_x * tile_w)
+            by = int(b.tile_y * tile_h)
+            bw = max(2, int(b.tile_width * tile_w))
+            bh = max(2, int(b.tile_height * tile_h))
+            color = b.get_color()
+            bright = tuple(min(255, c + 40) for c in color)
+            layer.fill(bright, (bx, by, bw, bh))
+
+    def _draw_minimap_zombies(self, zombies, tile_w: float, tile_h: float):
+        layer = self.minimap_zombies
+        layer.fill(MINIMAP_KEY)
+        dot = (max(2, int(tile_w)), max(2, int(tile_h)))
+        scale_x = tile_w / TILE_SIZE
+        scale_y = tile_h / TILE_SIZE
+        for z in zombies:
+            layer.fill((255, 50, 50), (int(z.x * scale_x), int(z.y * scale_y)) + dot)
+
     def _render_minimap(self, game_map: GameMap, camera: Camera,
                         buildings=None, zombies=None):
-        self.minimap_surface.fill(Color.BLACK)
-
         tile_w = MINIMAP_SIZE / game_map.width
         tile_h = MINIMAP_SIZE / game_map.height
 
-        # Draw terrain (sample every few tiles for performance)
-        step = max(1, game_map.width // MINIMAP_SIZE)
-        for y in range(0, game_map.height, step):
-            for x in range(0, game_map.width, step):
-                tile = game_map.get_tile(x, y)
-                if tile:
-                    color = TERRAIN_COLORS.get(tile.terrain, Color.GRASS)
-                    px = int(x * tile_w)
-                    py = int(y * tile_h)
-                    pw = max(1, int(step * tile_w))
-                    ph = max(1, int(step * tile_h))
-                    pygame.draw.rect(self.minimap_surface, color, (px, py, pw, ph))
-
-        # Draw buildings on minimap
-        if buildings:
-            for b in buildings:
-                bx = int(b.tile_x * tile_w)
-                by = int(b.tile_y * tile_h)
-                bw = max(2, int(b.tile_width * tile_w))
-                bh = max(2, int(b.tile_height * tile_h))
-                color = b.get_color()
-                bright = tuple(min(255, c + 40) for c in color)
-                pygame.draw.rect(self.minimap_surface, bright, (bx, by, bw, bh))
-
-        # Draw zombies on minimap
-        if zombies:
-            for z in zombies:
-                zx = int((z.x / TILE_SIZE) * tile_w)
-                zy = int((z.y / TILE_SIZE) * tile_h)
-                pygame.draw.rect(self.minimap_surface, (255, 50, 50),
-                                 (zx, zy, max(2, int(tile_w)), max(2, int(tile_h))))
+        if game_map is not self._minimap_map:
+            self._minimap_map = game_map
+            self.invalidate_minimap(terrain=True)
+        if self.minimap_terrain is None:
+            self.minimap_terrain = self._bake_minimap_terrain(game_map)
+
+        # Buildings: placement and removal change the count; callers can also
+        # force a redraw through invalidate_minimap
+        buildings = buildings or []
+        if self._minimap_buildings_dirty or len(buildings) != self._minimap_building_count:
+            self._draw_minimap_buildings(buildings, tile_w, tile_h)
+            self._minimap_buildings_dirty = False
+            self._minimap_building_count = len(buildings)
+
+        now = pygame.time.get_ticks()
+        if now >= self._next_zombie_refresh:
+            self._next_zombie_refresh = now + 1000 // MINIMAP_ZOMBIE_HZ
+            self._draw_minimap_zombies(zombies or (), tile_w, tile_h)
+
+        self.minimap_surface.blit(self.minimap_terrain, (0, 0))
+        self.minimap_surface.blit(self.minimap_buildings, (0, 0))
+        self.minimap_surface.blit(self.minimap_zombies, (0, 0))
 
         # Draw camera viewport rectangle
         cam_x = int(camera.x / (game_map.width * TILE_SIZE) * MINIMAP_SIZE)
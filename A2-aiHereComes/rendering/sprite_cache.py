@@ -0,0 +1,37 @@
+from typing import Callable, Dict, Hashable, Tuple
+import pygame
+
+
+class SpriteCache:
+    """Renders each distinct entity appearance once and reuses the surface.
+
+    Entities describe their look with a hashable key (e.g. class, level,
+    completion and color) and a painter that draws it at a given offset.
+    ``pad`` reserves room around the entity rect for parts that stick out,
+    such as zombie arms and shadows."""
+
+    def __init__(self):
+        self.sprites: Dict[Hashable, pygame.Surface] = {}
+
+    def get(self, key: Hashable, size: Tuple[int, int],
+            painter: Callable[[pygame.Surface, int, int], None],
+            pad: int = 0) -> pygame.Surface:
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            w, h = size
+            sprite = pygame.Surface((w + pad * 2, h + pad * 2), pygame.SRCALPHA)
+            painter(sprite, pad, pad)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self.sprites[key] = sprite
+        return sprite
+
+    def clear(self):
+        self.sprites.clear()
+
+    def __len__(self) -> int:
+        return len(self.sprites)
+
+
+# Shared process-wide cache
+sprite_cache = SpriteCache()
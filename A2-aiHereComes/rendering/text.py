@@ -0,0 +1,130 @@
+import json
+import os
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+import pygame
+from constants import FONT_CACHE, TEXT_CACHE_SIZE
+
+# CJK-capable system fonts, in order of preference
+FONT_CANDIDATES = ["simhei", "microsoftyahei", "simsun", "dengxian", "fangsong"]
+_FONT_TEST = "测试"
+
+
+class FontRegistry:
+    """Resolves the font that can render Chinese once per process and
+    hands out one shared Font object per size.
+
+    Finding the font means scanning the system fonts and test-rendering a
+    few candidates, so with FONT_CACHE the chosen file is also remembered in
+    ``cache_path`` and reused on the next start while it still exists."""
+
+    CACHE_FILE = os.path.join(os.path.dirname(__file__), '..', 'cache', 'font.json')
+
+    def __init__(self, cache_path: Optional[str] = CACHE_FILE if FONT_CACHE else None):
+        self.cache_path = cache_path
+        self.fonts: Dict[int, pygame.font.Font] = {}
+        self._resolved = False
+        self._path: Optional[str] = None  # None means pygame's default font
+
+    def get(self, size: int) -> pygame.font.Font:
+        font = self.fonts.get(size)
+        if font is None:
+            if not self._resolved:
+                self._resolve()
+            font = pygame.font.Font(self._path, size)
+            self.fonts[size] = font
+        return font
+
+    def _resolve(self):
+        self._resolved = True
+        cached = self._load_choice()
+        if cached is not None:
+            self._path = cached or None
+            return
+        self._path = self._discover()
+        self._save_choice()
+
+    @staticmethod
+    def _discover() -> Optional[str]:
+        for name in FONT_CANDIDATES:
+            path = pygame.font.match_font(name)
+            # Test if the font can render Chinese
+            if path and pygame.font.Font(path, 24).render(_FONT_TEST, True, (0, 0, 0)).get_width() > 10:
+                return path
+        return None
+
+    # --- Disk cache ---
+
+    def _load_choice(self) -> Optional[str]:
+        """The remembered font path ("" for the default font), or None to rediscover."""
+        if not self.cache_path:
+            return None
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("candidates") != FONT_CANDIDATES:
+            return None
+        path = data.get("path") or ""
+        if path and not os.path.exists(path):
+            return None
+        return path
+
+    def _save_choice(self):
+        if not self.cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump({"candidates": FONT_CANDIDATES, "path": self._path}, f)
+        except OSError:
+            pass  # Not remembered; the font is resolved again on the next start
+
+
+class TextCache:
+    """Rendered text surfaces keyed on (font, text, color), evicting the
+    least recently used past ``capacity``. Labels that do not change are
+    rendered once; callers must not draw onto the returned surfaces."""
+
+    def __init__(self, capacity: int = TEXT_CACHE_SIZE):
+        self.capacity = capacity
+        self.surfaces: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font: pygame.font.Font, text: str,
+               color: Tuple[int, ...]) -> pygame.Surface:
+        key = (font, text, color)
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = font.render(text, True, color)
+        self.surfaces[key] = surf
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self.surfaces.clear()
+
+    def __len__(self) -> int:
+        return len(self.surfaces)
+
+
+# Shared process-wide registry and cache
+fonts = FontRegistry()
+text_cache = TextCache()
+
+
+def get_font(size: int) -> pygame.font.Font:
+    """Get a font that supports Chinese characters."""
+    return fonts.get(size)
+
+
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, ...]) -> pygame.Surface:
+    """Antialiased text through the shared cache."""
+    return text_cache.render(font, text, tuple(color))
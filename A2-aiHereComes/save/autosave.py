@@ -0,0 +1,104 @@
+"""Writes saves on a background thread so saving never stalls a frame.
+
+The game thread only freezes the state (see ``snapshot.freeze``: about
+1 ms for 1,600 plain zombies, a few tenths of a millisecond for a
+ZombieSwarm of that size); building the snapshot, encoding it and writing
+the file happen on the writer thread. The writer still shares the GIL with
+the game, so frames that overlap a write can run a few milliseconds longer.
+Files are written atomically by SaveManager.
+"""
+import os
+import queue
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from constants import AUTOSAVE_INTERVAL, AUTOSAVE_SLOTS
+from save import snapshot
+from save.save_manager import SaveManager
+
+
+class SaveWriter:
+    """Background save queue plus the periodic autosave timer.
+
+    ``update`` counts down play time and reports when an autosave is due;
+    ``submit`` hands a frozen state to the writer thread. Finished writes are
+    collected with ``poll`` as (filename, error message or None)."""
+
+    AUTOSAVE_NAME = "autosave{}.sav"
+
+    def __init__(self, interval: float = AUTOSAVE_INTERVAL, slots: int = AUTOSAVE_SLOTS):
+        self.interval = interval
+        self.slots = slots
+        self.timer = interval
+        self._jobs: "queue.Queue[Tuple[Dict[str, Any], str]]" = queue.Queue()
+        self._results: "queue.Queue[Tuple[str, Optional[str]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self.pending = 0
+        self.next_slot = self._oldest_slot()
+
+    # --- Autosave ---
+
+    def slot_filename(self, slot: int) -> str:
+        return self.AUTOSAVE_NAME.format(slot + 1)
+
+    def _oldest_slot(self) -> int:
+        """First missing slot, else the one written longest ago."""
+        oldest, oldest_time = 0, None
+        for slot in range(self.slots):
+            path = os.path.join(SaveManager.SAVE_DIR, self.slot_filename(slot))
+            if not os.path.exists(path):
+                return slot
+            mtime = os.path.getmtime(path)
+            if oldest_time is None or mtime < oldest_time:
+                oldest, oldest_time = slot, mtime
+        return oldest
+
+    def update(self, dt: float) -> bool:
+        """Advance the autosave timer; True when an autosave is due.
+        Waits while an earlier save is still being written."""
+        self.timer -= dt
+        if self.timer > 0 or self.pending:
+            return False
+        self.timer = self.interval
+        return True
+
+    def autosave(self, frozen: Dict[str, Any]) -> str:
+        """Queue a frozen state for the next autosave slot."""
+        filename = self.slot_filename(self.next_slot)
+        self.next_slot = (self.next_slot + 1) % self.slots
+        self.submit(frozen, filename)
+        return filename
+
+    # --- Writer thread ---
+
+    def submit(self, frozen: Dict[str, Any], filename: str = SaveManager.DEFAULT_SAVE):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+            self._thread.start()
+        self.pending += 1
+        self._jobs.put((frozen, filename))
+
+    def poll(self) -> List[Tuple[str, Optional[str]]]:
+        done = []
+        while True:
+            try:
+                done.append(self._results.get_nowait())
+            except queue.Empty:
+                break
+        self.pending -= len(done)
+        return done
+
+    def flush(self):
+        """Wait until every queued save is on disk (call before quitting)."""
+        if self._thread is not None:
+            self._jobs.join()
+
+    def _run(self):
+        while True:
+            frozen, filename = self._jobs.get()
+            try:
+                SaveManager.save_game(snapshot.to_state(frozen), filename)
+                self._results.put((filename, None))
+            except Exception as e:  # Keep the thread alive; the game shows the error
+                self._results.put((filename, str(e)))
+            finally:
+                self._jobs.task_done()
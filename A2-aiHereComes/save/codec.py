@@ -0,0 +1,121 @@
+"""Encode snapshots (see save/snapshot.py) as JSON or as a compact binary.
+
+JSON keeps the tables as lists of rows and stores byte strings as base64
+of their zlib-compressed contents. The binary format is a short header
+followed by one zlib stream holding: the JSON-encoded meta, a string
+table, each table packed row by row with ``struct``, and the raw terrain.
+"""
+import base64
+import json
+import struct
+import zlib
+from typing import Any, Dict
+from save.snapshot import TABLES
+
+MAGIC = b"ZCOL"
+BINARY_VERSION = 1
+_HEADER = struct.Struct("<4sH")
+_U32 = struct.Struct("<I")
+
+
+# --- JSON ---
+
+def _encode_bytes(value):
+    if isinstance(value, (bytes, bytearray)):
+        return {"__zlib_b64__": base64.b64encode(zlib.compress(bytes(value))).decode("ascii")}
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _decode_bytes(obj: Dict):
+    if "__zlib_b64__" in obj:
+        return zlib.decompress(base64.b64decode(obj["__zlib_b64__"]))
+    return obj
+
+
+def encode_json(state: Dict[str, Any]) -> bytes:
+    return json.dumps(state, separators=(",", ":"), ensure_ascii=False,
+                      default=_encode_bytes).encode("utf-8")
+
+
+def decode_json(data: bytes) -> Dict[str, Any]:
+    return json.loads(data.decode("utf-8"), object_hook=_decode_bytes)
+
+
+# --- Binary ---
+
+def _row_struct(columns) -> struct.Struct:
+    return struct.Struct("<" + "".join("H" if code == "s" else code for _, code in columns))
+
+
+def encode_binary(state: Dict[str, Any]) -> bytes:
+    strings = []
+    string_index = {}
+    chunks = []
+    for name, columns in TABLES.items():
+        row_struct = _row_struct(columns)
+        text_columns = [i for i, (_, code) in enumerate(columns) if code == "s"]
+        rows = state[name]
+        packed = bytearray(_U32.pack(len(rows)))
+        for row in rows:
+            if text_columns:
+                row = list(row)
+                for i in text_columns:
+                    index = string_index.get(row[i])
+                    if index is None:
+                        index = string_index[row[i]] = len(strings)
+                        strings.append(row[i])
+                    row[i] = index
+            packed += row_struct.pack(*row)
+        chunks.append(bytes(packed))
+
+    head = json.dumps({"version": state["version"], "meta": state["meta"], "strings": strings},
+                      separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    terrain = state["terrain"]
+    body = b"".join([_U32.pack(len(head)), head] + chunks + [_U32.pack(len(terrain)), terrain])
+    return _HEADER.pack(MAGIC, BINARY_VERSION) + zlib.compress(body)
+
+
+def decode_binary(data: bytes) -> Dict[str, Any]:
+    if len(data) < _HEADER.size:
+        raise ValueError("save file is truncated")
+    magic, version = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not a binary save file")
+    if version != BINARY_VERSION:
+        raise ValueError(f"unsupported binary save version {version}")
+    try:
+        body = zlib.decompress(data[_HEADER.size:])
+    except zlib.error as e:
+        raise ValueError(f"save file is corrupt: {e}")
+
+    offset = 0
+
+    def take(size: int) -> bytes:
+        nonlocal offset
+        if offset + size > len(body):
+            raise ValueError("save file is truncated")
+        chunk = body[offset:offset + size]
+        offset += size
+        return chunk
+
+    (head_len,) = _U32.unpack(take(_U32.size))
+    head = json.loads(take(head_len).decode("utf-8"))
+    strings = head["strings"]
+    state = {"version": head["version"], "meta": head["meta"]}
+
+    for name, columns in TABLES.items():
+        row_struct = _row_struct(columns)
+        text_columns = [i for i, (_, code) in enumerate(columns) if code == "s"]
+        (count,) = _U32.unpack(take(_U32.size))
+        packed = take(count * row_struct.size)
+        rows = []
+        for values in row_struct.iter_unpack(packed):
+            row = list(values)
+            for i in text_columns:
+                row[i] = strings[row[i]]
+            rows.append(row)
+        state[name] = rows
+
+    (terrain_len,) = _U32.unpack(take(_U32.size))
+    state["terrain"] = take(terrain_len)
+    return state
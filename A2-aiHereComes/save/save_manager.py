@@ -1,84 +1,100 @@
-import json
 import os
 from typing import Dict, Any, Optional
+from save import codec, snapshot
+
+# File extension -> (encode, decode)
+FORMATS = {
+    ".json": (codec.encode_json, codec.decode_json),
+    ".sav": (codec.encode_binary, codec.decode_binary),
+}
 
 
 class SaveManager:
+    """Save files in the saves/ directory. The extension picks the format:
+    ``.sav`` is the compact binary one, ``.json`` the readable one."""
+
     SAVE_DIR = os.path.join(os.path.dirname(__file__), '..', 'saves')
+    DEFAULT_SAVE = "save1.sav"
 
     @classmethod
     def _ensure_dir(cls):
         os.makedirs(cls.SAVE_DIR, exist_ok=True)
 
+    @staticmethod
+    def _format(filename: str):
+        ext = os.path.splitext(filename)[1].lower()
+        if ext not in FORMATS:
+            raise ValueError(f"unknown save format '{ext}'")
+        return FORMATS[ext]
+
     @classmethod
-    def save_game(cls, game_state: Dict[str, Any], filename: str = "save1.json"):
+    def save_game(cls, game_state: Dict[str, Any], filename: str = DEFAULT_SAVE) -> str:
+        encode, _ = cls._format(filename)
+        data = encode(game_state)
         cls._ensure_dir()
         path = os.path.join(cls.SAVE_DIR, filename)
-        with open(path, 'w') as f:
-            json.dump(game_state, f, indent=2)
+        # Write next to the old save and swap, so a crash never leaves half a file
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        return path
 
     @classmethod
-    def load_game(cls, filename: str = "save1.json") -> Optional[Dict[str, Any]]:
+    def load_game(cls, filename: str = DEFAULT_SAVE) -> Optional[Dict[str, Any]]:
+        """The saved state, or None if there is no such save. Raises ValueError
+        for files that cannot be read as a save."""
+        _, decode = cls._format(filename)
         path = os.path.join(cls.SAVE_DIR, filename)
         if not os.path.exists(path):
             return None
-        with open(path, 'r') as f:
-            return json.load(f)
+        with open(path, 'rb') as f:
+            data = f.read()
+        try:
+            return decode(data)
+        except (KeyError, TypeError, UnicodeDecodeError) as e:
+            raise ValueError(f"{filename} is not a valid save: {e}")
 
     @classmethod
     def get_save_files(cls):
         cls._ensure_dir()
         saves = []
         for f in os.listdir(cls.SAVE_DIR):
-            if f.endswith('.json'):
+            if os.path.splitext(f)[1].lower() in FORMATS:
                 saves.append(f)
         return sorted(saves)
 
     @classmethod
-    def build_save_state(cls, game) -> Dict[str, Any]:
-        """Extract saveable state from a Game object."""
-        state = {
-            "camera": {"x": game.camera.x, "y": game.camera.y},
-            "resources": dict(game.resource_manager.resources),
-            "resource_caps": dict(game.resource_manager.resource_caps),
-            "population": game.resource_manager.population,
-            "max_population": game.resource_manager.max_population,
-            "wave": game.wave_manager.current_wave,
-            "wave_state": game.wave_manager.state.name,
-            "prep_timer": game.wave_manager.prep_timer,
-            "zombies_killed": game.wave_manager.total_zombies_killed,
-            "buildings": [],
-            "zombies": [],
-        }
+    def latest_save(cls) -> Optional[str]:
+        """The most recently written save file, manual or autosave."""
+        saves = cls.get_save_files()
+        if not saves:
+            return None
+        return max(saves, key=lambda f: os.path.getmtime(os.path.join(cls.SAVE_DIR, f)))
 
-        # Buildings
-        for b in game.build_system.buildings:
-            bdata = {
-                "type": b.name,
-                "tile_x": b.tile_x,
-                "tile_y": b.tile_y,
-                "tile_width": b.tile_width,
-                "tile_height": b.tile_height,
-                "hp": b.hp,
-                "max_hp": b.max_hp,
-                "construction_progress": b.construction_progress,
-                "is_complete": b.is_complete,
-            }
-            state["buildings"].append(bdata)
+    @classmethod
+    def freeze_game(cls, game) -> Dict[str, Any]:
+        """``snapshot.freeze`` of a running Game, plus the view."""
+        frozen = snapshot.freeze(game.sim)
+        frozen["meta"]["camera"] = {"x": game.camera.x, "y": game.camera.y}
+        frozen["meta"]["game_speed"] = game.game_speed
+        return frozen
 
-        # Zombies
-        for z in game.zombies:
-            zdata = {
-                "type": z.zombie_type,
-                "x": z.x, "y": z.y,
-                "hp": z.hp, "max_hp": z.max_hp,
-            }
-            state["zombies"].append(zdata)
+    @classmethod
+    def build_save_state(cls, game) -> Dict[str, Any]:
+        """Snapshot of a running Game: the whole simulation plus the view."""
+        return snapshot.to_state(cls.freeze_game(game))
 
-        return state
+    @classmethod
+    def restore_simulation(cls, state: Dict[str, Any]):
+        """Rebuild the Simulation a save state was taken from."""
+        try:
+            return snapshot.restore(state)
+        except (KeyError, IndexError, TypeError) as e:
+            raise ValueError(f"save state is incomplete: {e}")
 
     @classmethod
-    def delete_save(cls, filename: str = "save1.json"):
+    def delete_save(cls, filename: str = DEFAULT_SAVE):
         path = os.path.join(cls.SAVE_DIR, filename)
         if os.path.exists(path):
             os.remove(path)
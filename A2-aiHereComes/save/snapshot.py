@@ -0,0 +1,293 @@
+"""Capture a running Simulation as plain data and rebuild it from that data.
+
+A snapshot is a dict of JSON-friendly values plus ``terrain`` (the GameMap
+terrain ids, one byte per tile) and three tables (buildings, zombies,
+in-flight projectiles) stored as rows in the column order given below, so
+the codecs can pack them without knowing what they mean. Particles are cosmetic and are not
+saved; the pathfinder's flow field is rebuilt after a restore.
+"""
+from itertools import chain
+from operator import attrgetter
+from typing import Any, Dict, List, Optional
+from core.simulation import Simulation
+from entities.building import Building
+from entities.buildings.tower import Tower
+from entities.buildings.town_center import TownCenter
+from entities.zombie import Zombie
+from systems.build_system import BUILDING_CLASSES
+from systems.wave_manager import WaveState
+from systems.zombie_swarm import ZombieSwarm
+from world.map import GameMap
+
+SNAPSHOT_VERSION = 2
+
+# Table columns as (name, struct code). "s" columns are short strings, which
+# the binary codec stores as indexes into a string table.
+BUILDING_COLUMNS = (
+    ("type", "s"), ("tile_x", "i"), ("tile_y", "i"), ("level", "i"),
+    ("hp", "i"), ("max_hp", "i"), ("progress", "d"), ("complete", "?"),
+    ("timer", "d"),  # Tower attack timer or resource production timer
+)
+ZOMBIE_COLUMNS = (
+    ("type", "s"), ("x", "d"), ("y", "d"), ("hp", "i"), ("max_hp", "i"),
+    ("speed", "d"), ("damage", "i"), ("attack_rate", "d"), ("attack_timer", "d"),
+    ("goal_x", "d"), ("goal_y", "d"),
+)
+PROJECTILE_COLUMNS = (
+    ("x", "d"), ("y", "d"), ("vx", "d"), ("vy", "d"), ("aim_x", "d"), ("aim_y", "d"),
+    ("damage", "i"), ("splash", "d"), ("fired_at", "d"),
+    ("target", "i"),  # Row in the zombie table, -1 for none (analytic hits only)
+    ("impact_at", "d"), ("sequence", "i"),  # Scheduled impact, analytic hits only
+)
+TABLES = {
+    "buildings": BUILDING_COLUMNS,
+    "zombies": ZOMBIE_COLUMNS,
+    "projectiles": PROJECTILE_COLUMNS,
+}
+
+
+def building_key(building: Building) -> str:
+    """The BUILDING_CLASSES key a building was created from."""
+    if isinstance(building, Tower):
+        return f"{building.tower_type}_tower"
+    for key, cls in BUILDING_CLASSES.items():
+        if cls is type(building):
+            return key
+    raise ValueError(f"no building type for {type(building).__name__}")
+
+
+# --- Capture ---
+#
+# Capturing is split in two so a save can be written off the game thread:
+# ``freeze`` runs on the game thread and only copies attribute values into
+# tuples (the rows are immutable, nothing is converted), and ``to_state``
+# turns that into the snapshot dict and may run on any thread.
+#
+# Zombies, the only large table, are frozen as (type names, values): a
+# ZombieSwarm copies its arrays, and plain zombies' values go into one flat
+# tuple, so a big horde costs a couple of allocations instead of a tuple per
+# zombie that the garbage collector would then have to scan.
+
+# Zombie attributes in ZOMBIE_COLUMNS order, after "type" (zombie_type)
+_ZOMBIE_VALUES = tuple(name for name, _ in ZOMBIE_COLUMNS[1:])
+_zombie_type = attrgetter("zombie_type")
+_zombie_values = attrgetter(*_ZOMBIE_VALUES)
+
+def _row_lookup(zombies: List[Zombie]):
+    """Zombie -> its row in the zombie table, -1 if absent (ZombieSwarm.row
+    for plain zombies)."""
+    rows = dict(zip(map(id, zombies), range(len(zombies))))
+    return lambda zombie: rows.get(id(zombie), -1)
+
+
+def freeze(sim: Simulation) -> Dict[str, Any]:
+    """Copy everything a snapshot needs out of a running Simulation.
+    Cheap enough to call mid-frame; pass the result to ``to_state``."""
+    rm = sim.resource_manager
+    waves = sim.wave_manager
+    pool = sim.combat_system.projectiles
+    meta = {
+        "seed": sim.seed,
+        "tick": sim.tick,
+        "time": sim.time,
+        "accumulator": sim.accumulator,
+        "defeat": sim.defeat,
+        "victory": sim.victory,
+        "rng": sim.rngs.getstate(),
+        "map_size": [sim.game_map.width, sim.game_map.height],
+        "resources": dict(rm.resources),
+        "resource_caps": dict(rm.resource_caps),
+        "population": rm.population,
+        "max_population": rm.max_population,
+        "wave": {
+            "current": waves.current_wave,
+            "state": waves.state.name,
+            "prep_timer": waves.prep_timer,
+            "spawn_queue": list(waves.spawn_queue),
+            "spawn_timer": waves.spawn_timer,
+            "alive": waves.zombies_alive,
+            "killed": waves.total_zombies_killed,
+        },
+        "projectile_time": pool.time,
+    }
+    if isinstance(sim.zombies, ZombieSwarm):
+        meta["swarm_rng"] = sim.zombies.rng.bit_generator.state
+
+    buildings = [(building_key(b), b.tile_x, b.tile_y, b.level, b.hp, b.max_hp,
+                  b.construction_progress, b.is_complete,
+                  getattr(b, "attack_timer", getattr(b, "production_timer", 0.0)))
+                 for b in sim.build_system.buildings]
+
+    if isinstance(sim.zombies, ZombieSwarm):
+        swarm = sim.zombies
+        zombies = swarm.table(_ZOMBIE_VALUES)
+        zombie_row = swarm.row
+    else:
+        zombie_list = sim.zombies
+        zombies = (list(map(_zombie_type, zombie_list)),
+                   tuple(chain.from_iterable(map(_zombie_values, zombie_list))))
+        zombie_row = None
+
+    projectiles = []
+    if pool.active:
+        if zombie_row is None:
+            zombie_row = _row_lookup(zombie_list)
+        scheduled = pool.scheduled()
+        for slot in pool.active:
+            target = pool.target[slot]
+            impact_at, sequence = scheduled.get(slot, (-1.0, 0))
+            projectiles.append((pool.x[slot], pool.y[slot], pool.vx[slot], pool.vy[slot],
+                                pool.aim_x[slot], pool.aim_y[slot], pool.damage[slot],
+                                pool.splash[slot], pool.fired_at[slot],
+                                zombie_row(target) if target is not None else -1,
+                                impact_at, sequence))
+
+    return {
+        "meta": meta,
+        "terrain": bytes(sim.game_map.terrain),
+        "buildings": buildings,
+        "zombies": zombies,
+        "projectiles": projectiles,
+    }
+
+
+def _int_columns(columns) -> List[int]:
+    return [i for i, (_, code) in enumerate(columns) if code == "i"]
+
+
+def _zombie_table(types: List[str], values) -> List[List]:
+    """Rows of the zombie table from its frozen (type names, values)."""
+    if isinstance(values, tuple):
+        n = len(_ZOMBIE_VALUES)
+        rows = [values[i:i + n] for i in range(0, len(values), n)]
+    else:  # A swarm's array copy, already one row per zombie
+        rows = values.tolist()
+    return [[zombie_type, *row] for zombie_type, row in zip(types, rows)]
+
+
+def to_state(frozen: Dict[str, Any]) -> Dict[str, Any]:
+    """The snapshot dict for a ``freeze`` result."""
+    state = {"version": SNAPSHOT_VERSION, "meta": frozen["meta"], "terrain": frozen["terrain"]}
+    for name, columns in TABLES.items():
+        table = frozen[name]
+        if name == "zombies":
+            table = _zombie_table(*table)
+        # hp and damage are floats on some entities; the columns store ints
+        int_columns = _int_columns(columns)
+        rows = []
+        for values in table:
+            row = list(values)
+            for i in int_columns:
+                row[i] = int(row[i])
+            rows.append(row)
+        state[name] = rows
+    return state
+
+
+def capture(sim: Simulation) -> Dict[str, Any]:
+    return to_state(freeze(sim))
+
+
+# --- Restore ---
+
+def _restore_building(row: List) -> Building:
+    key, tile_x, tile_y, level, hp, max_hp, progress, complete, timer = row
+    building = BUILDING_CLASSES[key](tile_x, tile_y)
+    # Replaying the upgrades restores every stat they changed
+    for _ in range(level - 1):
+        building.upgrade()
+    building.level = level
+    building.max_hp = max_hp
+    building.hp = hp
+    building.construction_progress = progress
+    building.is_complete = bool(complete)
+    if isinstance(building, Tower):
+        building.attack_timer = timer
+    elif hasattr(building, "production_timer"):
+        building.production_timer = timer
+    return building
+
+
+def _restore_zombie(row: List, sim: Simulation) -> Zombie:
+    (zombie_type, x, y, hp, max_hp, speed, damage, attack_rate, attack_timer,
+     goal_x, goal_y) = row
+    z = Zombie(x, y, zombie_type, sim.rngs["zombies"])
+    z.hp = hp
+    z.max_hp = max_hp
+    z.speed = speed
+    z.damage = damage
+    z.attack_rate = attack_rate
+    z.attack_timer = attack_timer
+    z.goal_x = goal_x
+    z.goal_y = goal_y
+    if isinstance(sim.zombies, ZombieSwarm):
+        return sim.zombies.append(z)
+    sim.zombies.append(z)
+    return z
+
+
+def restore(state: Dict[str, Any]) -> Simulation:
+    """Build a Simulation that continues exactly where the captured one was."""
+    if state.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"unsupported save version {state.get('version')!r}")
+    meta = state["meta"]
+
+    width, height = meta["map_size"]
+    game_map = GameMap(width, height)
+    game_map.load_terrain(state["terrain"])
+
+    sim = Simulation(seed=meta["seed"], game_map=game_map)
+    sim.tick = meta["tick"]
+    sim.time = meta["time"]
+    sim.accumulator = meta["accumulator"]
+    sim.defeat = meta["defeat"]
+    sim.victory = meta["victory"]
+    sim.rngs.setstate(meta["rng"])
+    if "swarm_rng" in meta and isinstance(sim.zombies, ZombieSwarm):
+        sim.zombies.rng.bit_generator.state = meta["swarm_rng"]
+
+    # Economy: caps and population already include every building's bonus
+    rm = sim.resource_manager
+    rm.resources = dict(meta["resources"])
+    rm.resource_caps = dict(meta["resource_caps"])
+    rm.population = meta["population"]
+    rm.max_population = meta["max_population"]
+
+    # Buildings replace the fresh Town Center the constructor placed
+    build_system = sim.build_system
+    for b in build_system.buildings:
+        b.remove_from_map(game_map)
+    build_system.buildings = []
+    town_center: Optional[TownCenter] = None
+    for row in state["buildings"]:
+        building = _restore_building(row)
+        building.place_on_map(game_map)
+        build_system.buildings.append(building)
+        if isinstance(building, TownCenter):
+            town_center = building
+    if town_center is not None:
+        sim.town_center = town_center
+        sim.pathfinder.set_goals(town_center.get_occupied_tiles())
+    sim.pathfinder.invalidate()
+
+    waves = sim.wave_manager
+    wave = meta["wave"]
+    waves.current_wave = wave["current"]
+    waves.state = WaveState[wave["state"]]
+    waves.prep_timer = wave["prep_timer"]
+    waves.spawn_queue = list(wave["spawn_queue"])
+    waves.spawn_timer = wave["spawn_timer"]
+    waves.zombies_alive = wave["alive"]
+    waves.total_zombies_killed = wave["killed"]
+
+    zombies = [_restore_zombie(row, sim) for row in state["zombies"]]
+
+    pool = sim.combat_system.projectiles
+    pool.clear()
+    pool.time = meta["projectile_time"]
+    for (x, y, vx, vy, aim_x, aim_y, damage, splash, fired_at,
+         target, impact_at, sequence) in state["projectiles"]:
+        pool.insert(x, y, vx, vy, aim_x, aim_y, damage, splash, fired_at,
+                    zombies[target] if target >= 0 else None,
+                    impact_at if impact_at >= 0 else None, sequence)
+    return sim
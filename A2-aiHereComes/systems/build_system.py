@@ -1,5 +1,3 @@
-import json
-import os
 from typing import Optional, Dict, Tuple
 import pygame
 from constants import TILE_SIZE, Color
@@ -10,7 +8,9 @@ from entities.buildings.town_center import TownCenter
 from entities.buildings.housing import House
 from entities.buildings.resource_building import Farm, LumberMill, Quarry, GoldMine
 from entities.buildings.storage import Storage
+from rendering.layers import layers
 from systems.resource_manager import ResourceManager
+from systems.data_registry import registry
 
 
 # Mapping from building type key to class
@@ -36,11 +36,6 @@ class BuildSystem:
         self.selected_building_type: Optional[str] = None
         self.ghost_pos: Optional[Tuple[int, int]] = None
 
-        # Load building data
-        data_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'buildings.json')
-        with open(data_path, 'r') as f:
-            self.building_data: Dict = json.load(f)
-
     def select_building(self, building_type: str):
         self.selected_building_type = building_type
 
@@ -48,9 +43,12 @@ class BuildSystem:
         self.selected_building_type = None
 
     def get_building_size(self, building_type: str) -> Tuple[int, int]:
-        data = self.building_data.get(building_type, {})
-        size = data.get("tile_size", [1, 1])
-        return size[0], size[1]
+        data = registry.building(building_type)
+        return data.tile_size if data else (1, 1)
+
+    def get_building_cost(self, building_type: str) -> Dict[str, int]:
+        data = registry.building(building_type)
+        return dict(data.cost) if data else {}
 
     def can_place(self, tile_x: int, tile_y: int, building_type: str) -> bool:
         tw, th = self.get_building_size(building_type)
@@ -61,17 +59,16 @@ class BuildSystem:
         if tile_x + tw > self.game_map.width or tile_y + th > self.game_map.height:
             return False
 
-        # Check each tile
+        # Check each tile (buildable is also false under buildings)
+        buildable = self.game_map.buildable
+        width = self.game_map.width
         for dy in range(th):
-            for dx in range(tw):
-                tile = self.game_map.get_tile(tile_x + dx, tile_y + dy)
-                if tile is None or not tile.buildable:
-                    return False
-                if tile.building is not None:
-                    return False
+            row = (tile_y + dy) * width + tile_x
+            if not all(buildable[row:row + tw]):
+                return False
 
         # Check cost
-        cost = self.building_data.get(building_type, {}).get("cost", {})
+        cost = self.get_building_cost(building_type)
         if not self.resource_manager.can_afford(cost):
             return False
 
@@ -82,7 +79,7 @@ class BuildSystem:
             return None
 
         # Deduct cost
-        cost = self.building_data.get(building_type, {}).get("cost", {})
+        cost = self.get_building_cost(building_type)
         self.resource_manager.spend(cost)
 
         # Create building
@@ -126,10 +123,9 @@ class BuildSystem:
         tw, th = self.get_building_size(self.selected_building_type)
         can = self.can_place(tx, ty, self.selected_building_type)
 
-        # Create semi-transparent surface
-        ghost_surf = pygame.Surface((tw * TILE_SIZE, th * TILE_SIZE), pygame.SRCALPHA)
+        # Semi-transparent footprint
         color = (*Color.BUILDING_VALID[:3], 100) if can else (*Color.BUILDING_INVALID[:3], 100)
-        ghost_surf.fill(color)
+        ghost_surf = layers.fill((tw * TILE_SIZE, th * TILE_SIZE), color)
 
         sx, sy = camera.world_to_screen(tx * TILE_SIZE, ty * TILE_SIZE)
         surface.blit(ghost_surf, (int(sx), int(sy)))
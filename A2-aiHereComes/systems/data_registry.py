@@ -0,0 +1,210 @@
+import json
+import os
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+from constants import DATA_HOT_RELOAD
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
+
+
+class ZombieArchetype(NamedTuple):
+    zombie_type: str
+    hp: int
+    speed: float
+    damage: int
+    attack_rate: float
+    color: Tuple[int, int, int]
+    size: int
+
+
+class BuildingArchetype(NamedTuple):
+    key: str
+    name: str
+    tile_size: Tuple[int, int]
+    cost: Mapping[str, int]
+    hp: int
+    build_time: float
+    color: Tuple[int, int, int]
+    extra: Mapping[str, Any]  # Type-specific fields (range, production, ...)
+
+
+class WaveTable(NamedTuple):
+    waves: Tuple[Mapping[str, Any], ...]  # {"number", "prep_time", "zombies"}
+    scaling: Mapping[str, float]
+    spawn_interval: float
+    max_waves: int
+
+
+def _require(cond: bool, filename: str, message: str):
+    if not cond:
+        raise ValueError(f"{filename}: {message}")
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _color(value, filename: str, key: str) -> Tuple[int, int, int]:
+    _require(isinstance(value, list) and len(value) == 3
+             and all(isinstance(c, int) and 0 <= c <= 255 for c in value),
+             filename, f"'{key}' color must be three ints in 0-255")
+    return tuple(value)
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def parse_zombies(raw: Dict) -> Dict[str, ZombieArchetype]:
+    _require("basic" in raw, "zombies.json", "a 'basic' zombie is required as fallback")
+    records = {}
+    for key, data in raw.items():
+        for field in ("hp", "speed", "damage", "attack_rate"):
+            _require(_is_number(data.get(field)) and data[field] > 0,
+                     "zombies.json", f"'{key}.{field}' must be a positive number")
+        records[key] = ZombieArchetype(
+            zombie_type=key,
+            hp=int(data["hp"]),
+            speed=data["speed"],
+            damage=int(data["damage"]),
+            attack_rate=data["attack_rate"],
+            color=_color(data.get("color"), "zombies.json", key),
+            size=int(data.get("size", 24)),
+        )
+    return records
+
+
+def parse_buildings(raw: Dict) -> Dict[str, BuildingArchetype]:
+    base_fields = ("name", "tile_size", "cost", "hp", "build_time", "color")
+    records = {}
+    for key, data in raw.items():
+        size = data.get("tile_size")
+        _require(isinstance(size, list) and len(size) == 2
+                 and all(isinstance(s, int) and s > 0 for s in size),
+                 "buildings.json", f"'{key}.tile_size' must be two positive ints")
+        cost = data.get("cost", {})
+        _require(isinstance(cost, dict) and all(_is_number(v) and v >= 0 for v in cost.values()),
+                 "buildings.json", f"'{key}.cost' must map resources to amounts")
+        _require(_is_number(data.get("hp")) and data["hp"] > 0,
+                 "buildings.json", f"'{key}.hp' must be a positive number")
+        _require(_is_number(data.get("build_time", 0)) and data.get("build_time", 0) >= 0,
+                 "buildings.json", f"'{key}.build_time' must not be negative")
+        upgrades = data.get("upgrades", [])
+        _require(isinstance(upgrades, list)
+                 and all(isinstance(u, dict) and isinstance(u.get("cost"), dict)
+                         and all(_is_number(v) for k, v in u.items() if k != "cost")
+                         for u in upgrades),
+                 "buildings.json", f"'{key}.upgrades' must be a list of steps with a 'cost'")
+        records[key] = BuildingArchetype(
+            key=key,
+            name=data.get("name", key),
+            tile_size=(size[0], size[1]),
+            cost=_freeze(cost),
+            hp=int(data["hp"]),
+            build_time=data.get("build_time", 0),
+            color=_color(data.get("color"), "buildings.json", key),
+            extra=_freeze({k: v for k, v in data.items() if k not in base_fields}),
+        )
+    return records
+
+
+def parse_waves(raw: Dict) -> WaveTable:
+    waves = raw.get("waves")
+    _require(isinstance(waves, list) and waves, "waves.json", "'waves' must be a non-empty list")
+    numbers = [w.get("number") for w in waves]
+    _require(all(isinstance(n, int) for n in numbers) and numbers == sorted(set(numbers)),
+             "waves.json", "wave numbers must be unique ints in ascending order")
+    for wave in waves:
+        _require(_is_number(wave.get("prep_time")) and isinstance(wave.get("zombies"), dict),
+                 "waves.json", f"wave {wave['number']} needs 'prep_time' and 'zombies'")
+    scaling = raw.get("scaling", {})
+    for field in ("hp_multiplier_per_wave", "damage_multiplier_per_wave"):
+        _require(_is_number(scaling.get(field)), "waves.json", f"'scaling.{field}' is required")
+    _require(_is_number(raw.get("spawn_interval")) and raw["spawn_interval"] > 0,
+             "waves.json", "'spawn_interval' must be a positive number")
+    _require(isinstance(raw.get("max_waves"), int), "waves.json", "'max_waves' must be an int")
+    return WaveTable(
+        waves=_freeze(waves),
+        scaling=_freeze(scaling),
+        spawn_interval=raw["spawn_interval"],
+        max_waves=raw["max_waves"],
+    )
+
+
+class DataRegistry:
+    """Loads the data/*.json files once and hands out frozen, validated records.
+
+    With ``hot_reload`` on, file mtimes are checked at most every
+    ``RELOAD_CHECK_INTERVAL`` seconds and changed files are re-read. A file
+    that fails to parse during a reload keeps its previous records."""
+
+    RELOAD_CHECK_INTERVAL = 1.0
+
+    FILES = {
+        "zombies": ("zombies.json", parse_zombies),
+        "buildings": ("buildings.json", parse_buildings),
+        "waves": ("waves.json", parse_waves),
+    }
+
+    def __init__(self, data_dir: str = DATA_DIR, hot_reload: bool = False):
+        self.data_dir = data_dir
+        self.hot_reload = hot_reload
+        self._records: Dict[str, Any] = {}
+        self._mtimes: Dict[str, float] = {}
+        self._next_check = 0.0
+
+    def _load(self, name: str):
+        filename, parser = self.FILES[name]
+        path = os.path.join(self.data_dir, filename)
+        mtime = os.path.getmtime(path)
+        with open(path, 'r') as f:
+            self._records[name] = parser(json.load(f))
+        self._mtimes[name] = mtime
+
+    def _get(self, name: str):
+        if self.hot_reload:
+            now = time.monotonic()
+            if now >= self._next_check:
+                self._next_check = now + self.RELOAD_CHECK_INTERVAL
+                self.reload_changed()
+        if name not in self._records:
+            self._load(name)
+        return self._records[name]
+
+    def reload_changed(self) -> bool:
+        """Re-read any loaded file whose mtime changed. Returns True if any did."""
+        changed = False
+        for name in list(self._records):
+            filename, _ = self.FILES[name]
+            path = os.path.join(self.data_dir, filename)
+            try:
+                if os.path.getmtime(path) == self._mtimes.get(name):
+                    continue
+                self._load(name)
+                changed = True
+            except (OSError, ValueError):  # json.JSONDecodeError is a ValueError
+                pass  # Keep the old values; retried on the next check until the file parses
+        return changed
+
+    def zombie(self, zombie_type: str) -> ZombieArchetype:
+        """Archetype for a zombie type; unknown types fall back to 'basic'."""
+        zombies = self._get("zombies")
+        return zombies.get(zombie_type) or zombies["basic"]
+
+    def building(self, key: str) -> Optional[BuildingArchetype]:
+        return self._get("buildings").get(key)
+
+    def buildings(self) -> Mapping[str, BuildingArchetype]:
+        return MappingProxyType(self._get("buildings"))
+
+    def waves(self) -> WaveTable:
+        return self._get("waves")
+
+
+# Shared process-wide registry
+registry = DataRegistry(hot_reload=DATA_HOT_RELOAD)
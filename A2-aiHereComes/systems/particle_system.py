@@ -1,7 +1,16 @@
 import math
 import random
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 import pygame
+from constants import PARTICLE_BUDGET, SCREEN_WIDTH, SCREEN_HEIGHT
+
+try:
+    import numpy as np
+except ImportError:  # Optional backend; Simulation falls back to ParticleSystem
+    np = None
+
+# Fade levels pre-rendered per color and size by ParticleBatch
+FADE_STEPS = 16
 
 
 class Particle:
@@ -20,8 +29,16 @@ class Particle:
 
 
 class ParticleSystem:
-    def __init__(self):
+    """Particles as a list of objects. At most ``budget`` are kept; emitting
+    past that drops the oldest."""
+
+    def __init__(self, rng: Optional[random.Random] = None, budget: int = PARTICLE_BUDGET):
         self.particles: List[Particle] = []
+        self.rng = rng or random.Random()
+        self.budget = budget
+
+    def __len__(self) -> int:
+        return len(self.particles)
 
     def emit(self, x: float, y: float, count: int = 5,
              color: Tuple[int, int, int] = (200, 0, 0),
@@ -29,12 +46,15 @@ class ParticleSystem:
              lifetime_range: Tuple[float, float] = (0.2, 0.5),
              size: float = 2.0):
         for _ in range(count):
-            angle = random.uniform(0, 6.283)
-            speed = random.uniform(*speed_range)
+            angle = self.rng.uniform(0, 6.283)
+            speed = self.rng.uniform(*speed_range)
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
-            lifetime = random.uniform(*lifetime_range)
+            lifetime = self.rng.uniform(*lifetime_range)
             self.particles.append(Particle(x, y, vx, vy, lifetime, color, size))
+        overflow = len(self.particles) - self.budget
+        if overflow > 0:
+            del self.particles[:overflow]
 
     def update(self, dt: float):
         alive = []
@@ -53,3 +73,137 @@ class ParticleSystem:
             size = max(1, int(p.size * alpha))
             color = tuple(int(c * alpha) for c in p.color)
             pygame.draw.circle(surface, color, (int(sx), int(sy)), size)
+
+
+class ParticleBatch:
+    """Struct-of-arrays particle store (requires numpy), a drop-in for ParticleSystem.
+
+    Particles live in a ring of ``budget`` slots: emitting writes at the
+    head, so past the budget the oldest particles are recycled and a mass
+    kill can never grow the work per frame. ``update`` is one vectorized
+    step over the ring. ``draw`` culls and fades in NumPy, then blits
+    pre-rendered stamps (one per color, size and fade level) in one
+    ``Surface.blits`` call.
+
+    Emission draws from ``rng`` exactly like ParticleSystem, so either
+    store leaves a seeded simulation on the same random sequence."""
+
+    def __init__(self, rng: Optional[random.Random] = None, budget: int = PARTICLE_BUDGET):
+        self.rng = rng or random.Random()
+        self.budget = budget
+        self.x = np.zeros(budget)
+        self.y = np.zeros(budget)
+        self.vx = np.zeros(budget)
+        self.vy = np.zeros(budget)
+        self.lifetime = np.zeros(budget)
+        self.max_lifetime = np.ones(budget)
+        self.size = np.zeros(budget)
+        self.color_index = np.zeros(budget, dtype=np.int32)
+        self.head = 0  # Next slot to write
+        self.used = 0  # Slots written at least once
+        self.remaining = 0.0  # Time until the longest-lived particle expires
+        self.palette: List[Tuple[int, int, int]] = []
+        self._palette_index: Dict[Tuple[int, int, int], int] = {}
+        self._stamps: Dict[int, pygame.Surface] = {}
+
+    @staticmethod
+    def available() -> bool:
+        return np is not None
+
+    def __len__(self) -> int:
+        if self.remaining <= 0:
+            return 0
+        return int(np.count_nonzero(self.lifetime[:self.used] > 0))
+
+    def emit(self, x: float, y: float, count: int = 5,
+             color: Tuple[int, int, int] = (200, 0, 0),
+             speed_range: Tuple[float, float] = (20, 60),
+             lifetime_range: Tuple[float, float] = (0.2, 0.5),
+             size: float = 2.0):
+        rng = self.rng
+        velocities = []
+        lifetimes = []
+        for _ in range(count):
+            angle = rng.uniform(0, 6.283)
+            speed = rng.uniform(*speed_range)
+            velocities.append((math.cos(angle) * speed, math.sin(angle) * speed))
+            lifetimes.append(rng.uniform(*lifetime_range))
+        if count > self.budget:
+            velocities = velocities[-self.budget:]
+            lifetimes = lifetimes[-self.budget:]
+            count = self.budget
+        if count <= 0:
+            return
+
+        color = tuple(color)
+        index = self._palette_index.get(color)
+        if index is None:
+            index = self._palette_index[color] = len(self.palette)
+            self.palette.append(color)
+
+        slots = (self.head + np.arange(count)) % self.budget
+        v = np.array(velocities)
+        self.x[slots] = x
+        self.y[slots] = y
+        self.vx[slots] = v[:, 0]
+        self.vy[slots] = v[:, 1]
+        self.lifetime[slots] = lifetimes
+        self.max_lifetime[slots] = lifetimes
+        self.size[slots] = size
+        self.color_index[slots] = index
+        self.head = (self.head + count) % self.budget
+        self.used = min(self.budget, self.used + count)
+        self.remaining = max(self.remaining, max(lifetimes))
+
+    def clear(self):
+        self.lifetime[:] = 0.0
+        self.remaining = 0.0
+
+    def update(self, dt: float):
+        if self.remaining <= 0:
+            return
+        self.remaining -= dt
+        n = self.used
+        self.lifetime[:n] -= dt
+        # Expired particles keep drifting; nothing reads them until reused
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+
+    def _stamp(self, code: int) -> pygame.Surface:
+        """Pre-rendered particle for a packed (color, radius, fade step) code."""
+        stamp = self._stamps.get(code)
+        if stamp is None:
+            rest, step = divmod(code, FADE_STEPS + 1)
+            color_index, radius = divmod(rest, 64)
+            alpha = step / FADE_STEPS
+            color = tuple(int(c * alpha) for c in self.palette[color_index])
+            stamp = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(stamp, color, (radius, radius), radius)
+            if pygame.display.get_surface() is not None:
+                stamp = stamp.convert_alpha()
+            self._stamps[code] = stamp
+        return stamp
+
+    def draw(self, surface: pygame.Surface, camera):
+        if self.remaining <= 0:
+            return
+        n = self.used
+        slots = np.flatnonzero(self.lifetime[:n] > 0)
+        sx = self.x[slots] - camera.view_x
+        sy = self.y[slots] - camera.view_y
+        visible = (sx > -8) & (sx < SCREEN_WIDTH + 8) & (sy > -8) & (sy < SCREEN_HEIGHT + 8)
+        slots = slots[visible]
+        if slots.size == 0:
+            return
+
+        alpha = self.lifetime[slots] / self.max_lifetime[slots]
+        radius = np.clip((self.size[slots] * alpha).astype(np.int32), 1, 63)
+        step = np.ceil(alpha * FADE_STEPS).astype(np.int32)
+        codes = (self.color_index[slots] * 64 + radius) * (FADE_STEPS + 1) + step
+        xs = (sx[visible].astype(np.int32) - radius).tolist()
+        ys = (sy[visible].astype(np.int32) - radius).tolist()
+
+        stamps = self._stamps
+        stamp = self._stamp
+        surface.blits([(stamps.get(code) or stamp(code), (x, y))
+                       for code, x, y in zip(codes.tolist(), xs, ys)], doreturn=False)
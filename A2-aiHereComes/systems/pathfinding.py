@@ -1,78 +1,640 @@
-from typing import Dict, List, Tuple, Optional
-from collections import deque
-from constants import MAP_WIDTH, MAP_HEIGHT
+import heapq
+from array import array
+from collections import OrderedDict, deque
+from typing import FrozenSet, Iterable, List, Optional, Set, Tuple
+from constants import (FLOW_FIELD_CACHE, USE_COST_FIELD, PATH_BREAK_COST,
+                       TERRAIN_PATH_COST, TERRAIN_WALKABLE)
+from world.map import TERRAIN_TYPES
 
+# Neighbour offsets; the index into this list is the direction code stored per tile.
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1),
+              (-1, -1), (-1, 1), (1, -1), (1, 1)]  # 8-directional
+OPPOSITE = [DIRECTIONS.index((-dx, -dy)) for dx, dy in DIRECTIONS]
 
-class Pathfinder:
-    """Flow field pathfinding. Computes BFS from a goal tile.
-    Each tile stores the direction toward the goal.
-    Zombies read the direction from their current tile to move."""
+DIR_NONE = -1  # Unreachable tile
+DIR_GOAL = 8   # A goal tile itself
+UNREACHABLE = 0x7FFFFFFF
 
-    def __init__(self, game_map):
-        self.game_map = game_map
-        self.flow_field: Dict[Tuple[int, int], Tuple[float, float]] = {}
-        self.flow_field_dirty = True
-        self.goal: Optional[Tuple[int, int]] = None
+# Unit movement vector for every direction code (DIR_GOAL means "stay")
+DIRECTION_VECTORS = [(dx / (dx * dx + dy * dy) ** 0.5, dy / (dx * dx + dy * dy) ** 0.5)
+                     for dx, dy in DIRECTIONS] + [(0.0, 0.0)]
+
+# Terrain id -> cost of a straight step onto it (0: impassable), for bytes.translate
+_PATH_COST_BY_ID = bytes(TERRAIN_PATH_COST.get(t, 10) if TERRAIN_WALKABLE.get(t, True) else 0
+                         for t in TERRAIN_TYPES).ljust(256, b'\0')
+
+
+def goal_key(width: int, height: int, goals: Iterable[Tuple[int, int]]) -> FrozenSet[int]:
+    """The in-bounds goal tiles as a set of tile indices (the cache key)."""
+    return frozenset(y * width + x for x, y in goals if 0 <= x < width and 0 <= y < height)
 
-    def set_goal(self, tile_x: int, tile_y: int):
-        self.goal = (tile_x, tile_y)
-        self.flow_field_dirty = True
 
-    def invalidate(self):
+class FlowField:
+    """Flow field toward a set of goal tiles. A multi-source BFS starts
+    from every goal at once, so each tile stores the direction toward its
+    nearest goal. Zombies read the direction from their current tile to move.
+
+    The field lives in flat arrays indexed by ``y * width + x``: ``distance``
+    holds the BFS step count and ``direction`` a code into DIRECTIONS.
+    Goals may be unwalkable (a building's footprint); the search expands
+    from them into the walkable tiles around. Tiles passed to ``invalidate``
+    are repaired incrementally on the next query instead of rebuilding the
+    whole map."""
+
+    # Repairs that touch more than this fraction of the map do a full rebuild
+    REPAIR_LIMIT = 0.25
+
+    def __init__(self, game_map, goals: FrozenSet[int] = frozenset()):
+        self.game_map = game_map
+        self.width = game_map.width
+        self.height = game_map.height
+        size = self.width * self.height
+        self.distance = array('i', [UNREACHABLE]) * size
+        self.direction = array('b', [DIR_NONE]) * size
+        self.walkable = bytearray(size)  # Walkability the field was computed with
         self.flow_field_dirty = True
+        self.goals = goals  # Tile indices
+        self._pending: List[int] = []
+
+    def invalidate(self, tiles: Optional[Iterable[Tuple[int, int]]] = None):
+        """Mark the field stale. With ``tiles`` only those tiles changed
+        walkability and the field is repaired locally; without, it is rebuilt."""
+        if tiles is None:
+            self.flow_field_dirty = True
+            self._pending.clear()
+            return
+        if self.flow_field_dirty:
+            return
+        for tx, ty in tiles:
+            if 0 <= tx < self.width and 0 <= ty < self.height:
+                self._pending.append(ty * self.width + tx)
 
     def get_direction(self, tile_x: int, tile_y: int) -> Optional[Tuple[float, float]]:
+        self._refresh()
+        if not (0 <= tile_x < self.width and 0 <= tile_y < self.height):
+            return None
+        code = self.direction[tile_y * self.width + tile_x]
+        if code == DIR_NONE:
+            return None
+        return DIRECTION_VECTORS[code]
+
+    def get_distance(self, tile_x: int, tile_y: int) -> Optional[int]:
+        """BFS step count from a tile to the nearest goal, or None if unreachable."""
+        self._refresh()
+        if not (0 <= tile_x < self.width and 0 <= tile_y < self.height):
+            return None
+        dist = self.distance[tile_y * self.width + tile_x]
+        return None if dist == UNREACHABLE else dist
+
+    def direction_codes(self) -> array:
+        """Per-tile direction codes (index y * width + x), brought up to date.
+        Lets callers gather directions for many tiles at once."""
+        self._refresh()
+        return self.direction
+
+    def _refresh(self):
         if self.flow_field_dirty:
             self._compute_flow_field()
-        return self.flow_field.get((tile_x, tile_y))
+        elif self._pending:
+            self._repair()
+
+    # --- Full rebuild ---
+
+    def _snapshot_walkable(self):
+        self.walkable[:] = self.game_map.walkable
 
     def _compute_flow_field(self):
-        if self.goal is None:
+        if not self.goals:
             return
 
-        self.flow_field.clear()
+        self._pending.clear()
+        self._snapshot_walkable()
+        size = self.width * self.height
+        self.distance = array('i', [UNREACHABLE]) * size
+        self.direction = array('b', [DIR_NONE]) * size
 
-        # BFS from goal outward
-        visited = set()
-        queue = deque()
-
-        gx, gy = self.goal
-        if not (0 <= gx < self.game_map.width and 0 <= gy < self.game_map.height):
-            return
+        w, h = self.width, self.height
+        dist, dirn, walk = self.distance, self.direction, self.walkable
 
-        visited.add((gx, gy))
-        self.flow_field[(gx, gy)] = (0.0, 0.0)  # At goal, no movement needed
-        queue.append((gx, gy))
+        # BFS from every goal outward (sorted, so ties break the same way each run)
+        queue = deque(sorted(self.goals))
+        for goal in queue:
+            dist[goal] = 0
+            dirn[goal] = DIR_GOAL  # At goal, no movement needed
 
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1),
-                      (-1, -1), (-1, 1), (1, -1), (1, 1)]  # 8-directional
+        steps = [(k, dx, dy, dy * w + dx) for k, (dx, dy) in enumerate(DIRECTIONS)]
 
         while queue:
-            cx, cy = queue.popleft()
+            c = queue.popleft()
+            cy, cx = divmod(c, w)
+            nd = dist[c] + 1
 
-            for dx, dy in directions:
+            for k, dx, dy, offset in steps:
                 nx, ny = cx + dx, cy + dy
-
-                if (nx, ny) in visited:
-                    continue
-
-                tile = self.game_map.get_tile(nx, ny)
-                if tile is None:
+                if nx < 0 or ny < 0 or nx >= w or ny >= h:
                     continue
-                if not tile.walkable:
+                n = c + offset
+                if dist[n] != UNREACHABLE or not walk[n]:
                     continue
 
                 # For diagonal movement, check that both adjacent tiles are walkable
                 if dx != 0 and dy != 0:
-                    t1 = self.game_map.get_tile(cx + dx, cy)
-                    t2 = self.game_map.get_tile(cx, cy + dy)
-                    if t1 is None or not t1.walkable or t2 is None or not t2.walkable:
+                    if not walk[c + dx] or not walk[c + dy * w]:
                         continue
 
-                visited.add((nx, ny))
+                dist[n] = nd
                 # Direction from this tile toward the current tile (closer to goal)
-                length = (dx * dx + dy * dy) ** 0.5
-                self.flow_field[(nx, ny)] = (-dx / length, -dy / length)
-                queue.append((nx, ny))
+                dirn[n] = OPPOSITE[k]
+                queue.append(n)
 
         self.flow_field_dirty = False
+
+    # --- Incremental repair ---
+
+    def _neighbors(self, i: int):
+        """Yield (direction code, index) for the in-bounds neighbours of tile i."""
+        w = self.width
+        y, x = divmod(i, w)
+        for k, (dx, dy) in enumerate(DIRECTIONS):
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < w and 0 <= ny < self.height:
+                yield k, i + dy * w + dx
+
+    def _can_step(self, i: int, k: int) -> bool:
+        """Whether a zombie on walkable tile i may move one step in direction k."""
+        if not self.walkable[i]:
+            return False
+        dx, dy = DIRECTIONS[k]
+        if dx != 0 and dy != 0:
+            return bool(self.walkable[i + dx] and self.walkable[i + dy * self.width])
+        return True
+
+    def _repair(self):
+        changed = set(self._pending)
+        self._pending.clear()
+
+        if not changed.isdisjoint(self.goals):
+            self._compute_flow_field()
+            return
+
+        blocked, opened = [], []
+        walkable = self.game_map.walkable
+        for i in changed:
+            now = walkable[i]
+            if now == self.walkable[i]:
+                continue
+            self.walkable[i] = now
+            (opened if now else blocked).append(i)
+
+        if blocked and not self._repair_blocked(blocked):
+            self._compute_flow_field()
+            return
+        if opened:
+            self._repair_opened(opened)
+
+    def _repair_blocked(self, blocked: List[int]) -> bool:
+        """Re-relax the tiles whose route ran through a newly blocked tile.
+        Returns False when the affected region is too large to be worth it."""
+        dist, dirn = self.distance, self.direction
+        w = self.width
+
+        # Roots: the blocked tiles, plus neighbours whose diagonal step cut its corner
+        roots: Set[int] = set()
+        for b in blocked:
+            if dist[b] != UNREACHABLE:
+                roots.add(b)
+            for _, n in self._neighbors(b):
+                code = dirn[n]
+                if 4 <= code < DIR_GOAL:
+                    dx, dy = DIRECTIONS[code]
+                    if b == n + dx or b == n + dy * w:
+                        roots.add(n)
+
+        # Walk downstream of the roots in distance order. A tile that still has an
+        # intact neighbour one step closer keeps its distance and is re-pointed;
+        # the rest lost their route. Distance order guarantees every lost tile one
+        # step closer is known before a tile is checked.
+        limit = int(self.width * self.height * self.REPAIR_LIMIT)
+        affected: Set[int] = set()
+        seen = set(roots)
+        heap = [(dist[r], r) for r in roots]
+        heapq.heapify(heap)
+        while heap:
+            d, c = heapq.heappop(heap)
+            if self.walkable[c] and self._reparent(c, d, affected):
+                continue
+            affected.add(c)
+            if len(affected) > limit:
+                return False
+            for k, n in self._neighbors(c):
+                if n not in seen and dirn[n] == OPPOSITE[k]:
+                    seen.add(n)
+                    heapq.heappush(heap, (d + 1, n))
+
+        for a in affected:
+            dist[a] = UNREACHABLE
+            dirn[a] = DIR_NONE
+
+        # Seed the region from its intact border, then relax inward
+        heap = []
+        for a in affected:
+            if not self.walkable[a]:
+                continue
+            for k, n in self._neighbors(a):
+                if n in affected or dist[n] == UNREACHABLE:
+                    continue
+                if dist[n] + 1 < dist[a] and self._can_step(a, k):
+                    dist[a] = dist[n] + 1
+                    dirn[a] = k
+            if dist[a] != UNREACHABLE:
+                heap.append((dist[a], a))
+        heapq.heapify(heap)
+        self._relax(heap, affected)
+        return True
+
+    def _reparent(self, i: int, d: int, lost: Set[int]) -> bool:
+        """Point tile i at another neighbour at distance d - 1 whose route is intact."""
+        dist = self.distance
+        for k, n in self._neighbors(i):
+            if dist[n] == d - 1 and n not in lost and self._can_step(i, k):
+                self.direction[i] = k
+                return True
+        return False
+
+    def _repair_opened(self, opened: List[int]):
+        """Propagate shorter routes through newly walkable tiles."""
+        dist, dirn = self.distance, self.direction
+        heap = []
+        for o in opened:
+            for k, n in self._neighbors(o):
+                if dist[n] != UNREACHABLE and dist[n] + 1 < dist[o] and self._can_step(o, k):
+                    dist[o] = dist[n] + 1
+                    dirn[o] = k
+            if dist[o] != UNREACHABLE:
+                heap.append((dist[o], o))
+            # Neighbours may also gain diagonal steps across the opened corner
+            for _, n in self._neighbors(o):
+                if dist[n] != UNREACHABLE:
+                    heap.append((dist[n], n))
+        heapq.heapify(heap)
+        self._relax(heap, None)
+
+    def _relax(self, heap: list, region: Optional[Set[int]]):
+        """Dijkstra-style relaxation limited to ``region`` (None = whole map)."""
+        dist, dirn, walk = self.distance, self.direction, self.walkable
+        while heap:
+            d, c = heapq.heappop(heap)
+            if d > dist[c]:
+                continue
+            nd = d + 1
+            for k, n in self._neighbors(c):
+                if region is not None and n not in region:
+                    continue
+                if not walk[n] or nd >= dist[n]:
+                    continue
+                back = OPPOSITE[k]
+                if not self._can_step(n, back):
+                    continue
+                dist[n] = nd
+                dirn[n] = back
+                heapq.heappush(heap, (nd, n))
+
+
+class CostField(FlowField):
+    """Flow field over weighted steps (Dijkstra from the goals).
+
+    A straight step onto a tile costs ``cost`` (TERRAIN_PATH_COST, 10 for
+    grass) and a diagonal one ``dcost`` (1.4x). Building tiles stay passable
+    for an extra PATH_BREAK_COST per building HP, so the field can lead
+    through a wall when going around costs more; zombies then stop at the
+    wall and chew. Diagonal steps still may not cut past a building's or
+    obstacle's corner. ``distance`` is in cost units. Break costs use the
+    building's HP when its tiles were last computed; damage alone does not
+    invalidate the field."""
+
+    def __init__(self, game_map, goals: FrozenSet[int] = frozenset()):
+        super().__init__(game_map, goals)
+        size = self.width * self.height
+        self.cost = array('i', [0]) * size
+        self.dcost = array('i', [0]) * size
+
+    def _tile_cost(self, i: int) -> int:
+        """Cost of a straight step onto tile i (0 if it cannot be entered)."""
+        game_map = self.game_map
+        cost = _PATH_COST_BY_ID[game_map.terrain[i]]
+        building_id = game_map.building_ids[i]
+        if cost and building_id and i not in self.goals:
+            cost += int(game_map.buildings[building_id].hp * PATH_BREAK_COST)
+        return cost
+
+    def _snapshot_walkable(self):
+        super()._snapshot_walkable()
+        game_map = self.game_map
+        cost = array('i', list(game_map.terrain.translate(_PATH_COST_BY_ID)))
+        w = self.width
+        for building in game_map.buildings:
+            if building is None:
+                continue
+            extra = int(building.hp * PATH_BREAK_COST)
+            for y in range(building.tile_y, building.tile_y + building.tile_height):
+                for i in range(y * w + building.tile_x, y * w + building.tile_x + building.tile_width):
+                    if cost[i] and i not in self.goals:
+                        cost[i] += extra
+        self.cost = cost
+        self.dcost = array('i', [c * 14 // 10 for c in cost])
+
+    def _step(self, i: int, k: int) -> int:
+        """Cost of moving from tile i one step in direction k."""
+        dx, dy = DIRECTIONS[k]
+        return (self.dcost if k >= 4 else self.cost)[i + dy * self.width + dx]
+
+    def _can_step(self, i: int, k: int) -> bool:
+        if not self.cost[i]:
+            return False
+        dx, dy = DIRECTIONS[k]
+        if dx != 0 and dy != 0:
+            return bool(self.walkable[i + dx] and self.walkable[i + dy * self.width])
+        return True
+
+    # --- Full rebuild ---
+
+    def _compute_flow_field(self):
+        if not self.goals:
+            return
+
+        self._pending.clear()
+        self._snapshot_walkable()
+        size = self.width * self.height
+        self.distance = array('i', [UNREACHABLE]) * size
+        self.direction = array('b', [DIR_NONE]) * size
+
+        w, h = self.width, self.height
+        dist, dirn, walk = self.distance, self.direction, self.walkable
+        cost, dcost = self.cost, self.dcost
+
+        heap = []
+        for goal in sorted(self.goals):
+            dist[goal] = 0
+            dirn[goal] = DIR_GOAL
+            heap.append((0, goal))
+
+        steps = [(dx, dy, dy * w + dx, OPPOSITE[k]) for k, (dx, dy) in enumerate(DIRECTIONS)]
+        heappop, heappush = heapq.heappop, heapq.heappush
+
+        while heap:
+            d, c = heappop(heap)
+            if d > dist[c]:
+                continue
+            cy, cx = divmod(c, w)
+            # Every step from a neighbour onto c costs the same
+            straight = d + cost[c]
+            diagonal = d + dcost[c]
+
+            for dx, dy, offset, back in steps:
+                nx, ny = cx + dx, cy + dy
+                if nx < 0 or ny < 0 or nx >= w or ny >= h:
+                    continue
+                n = c + offset
+                if not cost[n]:
+                    continue
+                if dx != 0 and dy != 0:
+                    nd = diagonal
+                    if nd >= dist[n] or not walk[c + dx] or not walk[c + dy * w]:
+                        continue
+                else:
+                    nd = straight
+                    if nd >= dist[n]:
+                        continue
+                dist[n] = nd
+                dirn[n] = back
+                heappush(heap, (nd, n))
+
+        self.flow_field_dirty = False
+
+    # --- Incremental repair ---
+
+    def _repair(self):
+        changed = set(self._pending)
+        self._pending.clear()
+
+        if not changed.isdisjoint(self.goals):
+            self._compute_flow_field()
+            return
+
+        # A tile got dearer to cross (or lost its corners), cheaper, or both
+        dearer, cheaper = [], []
+        walkable = self.game_map.walkable
+        for i in changed:
+            old_cost, old_open = self.cost[i], self.walkable[i]
+            new_cost, new_open = self._tile_cost(i), walkable[i]
+            if new_cost == old_cost and new_open == old_open:
+                continue
+            self.cost[i] = new_cost
+            self.dcost[i] = new_cost * 14 // 10
+            self.walkable[i] = new_open
+            if (old_cost and (not new_cost or new_cost > old_cost)) or (old_open and not new_open):
+                dearer.append(i)
+            if (new_cost and (not old_cost or new_cost < old_cost)) or (new_open and not old_open):
+                cheaper.append(i)
+
+        if dearer and not self._repair_blocked(dearer):
+            self._compute_flow_field()
+            return
+        if cheaper:
+            self._repair_opened(cheaper)
+
+    def _repair_blocked(self, blocked: List[int]) -> bool:
+        """Re-relax the tiles whose route stepped onto a tile that got dearer,
+        or cut the corner of one that closed. Returns False when the affected
+        region is too large to be worth it."""
+        dist, dirn, cost = self.distance, self.direction, self.cost
+        w = self.width
+
+        # Roots: the tiles that stepped onto or past a changed tile (and the
+        # changed tile itself if it can no longer be stood on)
+        roots: Set[int] = set()
+        for b in blocked:
+            if not cost[b] and dist[b] != UNREACHABLE:
+                roots.add(b)
+            for _, n in self._neighbors(b):
+                code = dirn[n]
+                if not 0 <= code < DIR_GOAL:
+                    continue
+                dx, dy = DIRECTIONS[code]
+                if b == n + dy * w + dx:
+                    roots.add(n)
+                elif code >= 4 and not self.walkable[b] and (b == n + dx or b == n + dy * w):
+                    roots.add(n)
+
+        # Walk downstream in distance order, as in FlowField: a tile with an
+        # intact neighbour still giving its old distance keeps it
+        limit = int(self.width * self.height * self.REPAIR_LIMIT)
+        affected: Set[int] = set()
+        seen = set(roots)
+        heap = [(dist[r], r) for r in roots]
+        heapq.heapify(heap)
+        while heap:
+            d, c = heapq.heappop(heap)
+            if cost[c] and self._reparent(c, d, affected):
+                continue
+            affected.add(c)
+            if len(affected) > limit:
+                return False
+            for k, n in self._neighbors(c):
+                if n not in seen and dirn[n] == OPPOSITE[k]:
+                    seen.add(n)
+                    heapq.heappush(heap, (dist[n], n))
+
+        for a in affected:
+            dist[a] = UNREACHABLE
+            dirn[a] = DIR_NONE
+
+        # Seed the region from its intact border, then relax inward
+        heap = []
+        for a in affected:
+            if not cost[a]:
+                continue
+            for k, n in self._neighbors(a):
+                if n in affected or dist[n] == UNREACHABLE:
+                    continue
+                nd = dist[n] + self._step(a, k)
+                if nd < dist[a] and self._can_step(a, k):
+                    dist[a] = nd
+                    dirn[a] = k
+            if dist[a] != UNREACHABLE:
+                heap.append((dist[a], a))
+        heapq.heapify(heap)
+        self._relax(heap, affected)
+        return True
+
+    def _reparent(self, i: int, d: int, lost: Set[int]) -> bool:
+        """Point tile i at another neighbour that still gives distance d."""
+        dist = self.distance
+        for k, n in self._neighbors(i):
+            if (n not in lost and dist[n] < d and self._can_step(i, k)
+                    and dist[n] + self._step(i, k) == d):
+                self.direction[i] = k
+                return True
+        return False
+
+    def _repair_opened(self, opened: List[int]):
+        """Propagate cheaper routes from tiles that got cheaper or opened."""
+        dist, dirn = self.distance, self.direction
+        heap = []
+        for o in opened:
+            for k, n in self._neighbors(o):
+                if dist[n] != UNREACHABLE and self._can_step(o, k):
+                    nd = dist[n] + self._step(o, k)
+                    if nd < dist[o]:
+                        dist[o] = nd
+                        dirn[o] = k
+            if dist[o] != UNREACHABLE:
+                heap.append((dist[o], o))
+            # Neighbours may also gain diagonal steps across the opened corner
+            for _, n in self._neighbors(o):
+                if dist[n] != UNREACHABLE:
+                    heap.append((dist[n], n))
+        heapq.heapify(heap)
+        self._relax(heap, None)
+
+    def _relax(self, heap: list, region: Optional[Set[int]]):
+        """Dijkstra relaxation limited to ``region`` (None = whole map)."""
+        dist, dirn, cost, dcost = self.distance, self.direction, self.cost, self.dcost
+        while heap:
+            d, c = heapq.heappop(heap)
+            if d > dist[c]:
+                continue
+            for k, n in self._neighbors(c):
+                if region is not None and n not in region:
+                    continue
+                if not cost[n]:
+                    continue
+                nd = d + (dcost[c] if k >= 4 else cost[c])
+                if nd >= dist[n]:
+                    continue
+                back = OPPOSITE[k]
+                if not self._can_step(n, back):
+                    continue
+                dist[n] = nd
+                dirn[n] = back
+                heapq.heappush(heap, (nd, n))
+
+
+class Pathfinder:
+    """The flow fields for one map: a primary field (the Town Center, which
+    every zombie heads for) plus an LRU cache of fields toward other goal
+    sets, such as any tower or another town center.
+
+    Fields are keyed on their goal set and stay current with the map: every
+    ``invalidate`` reaches each cached field, which repairs itself
+    incrementally the next time it is read, so asking for a cached goal
+    again after walls went up does not cost a full BFS. The primary field's
+    queries are also available on the Pathfinder itself. With ``weighted``
+    the fields are CostFields, otherwise plain BFS FlowFields."""
+
+    def __init__(self, game_map, cache_size: int = FLOW_FIELD_CACHE,
+                 weighted: bool = USE_COST_FIELD):
+        self.game_map = game_map
+        self.width = game_map.width
+        self.height = game_map.height
+        self.cache_size = cache_size
+        self.field_class = CostField if weighted else FlowField
+        self.primary = self.field_class(game_map)
+        self.fields: "OrderedDict[FrozenSet[int], FlowField]" = OrderedDict()
+
+    def set_goal(self, tile_x: int, tile_y: int):
+        self.set_goals([(tile_x, tile_y)])
+
+    def set_goals(self, goals: Iterable[Tuple[int, int]]):
+        """Make the primary field lead to the nearest of ``goals``."""
+        key = goal_key(self.width, self.height, goals)
+        if key == self.primary.goals:
+            return
+        old = self.primary
+        self.primary = self.fields.pop(key, None) or self.field_class(self.game_map, key)
+        if old.goals:
+            self._cache(old)
+
+    def field(self, goals: Iterable[Tuple[int, int]]) -> FlowField:
+        """The flow field toward the nearest of ``goals``, from the cache when
+        it holds one. The result answers the same queries as the Pathfinder."""
+        key = goal_key(self.width, self.height, goals)
+        if key == self.primary.goals:
+            return self.primary
+        field = self.fields.get(key)
+        if field is not None:
+            self.fields.move_to_end(key)
+            return field
+        field = self.field_class(self.game_map, key)
+        self._cache(field)
+        return field
+
+    def field_to(self, buildings: Iterable) -> FlowField:
+        """The flow field toward the nearest tile of any of ``buildings``."""
+        return self.field(tile for building in buildings if building.alive
+                          for tile in building.get_occupied_tiles())
+
+    def _cache(self, field: FlowField):
+        self.fields[field.goals] = field
+        self.fields.move_to_end(field.goals)
+        while len(self.fields) > self.cache_size:
+            self.fields.popitem(last=False)
+
+    def invalidate(self, tiles: Optional[Iterable[Tuple[int, int]]] = None):
+        """Mark every field stale; see FlowField.invalidate."""
+        if tiles is not None:
+            tiles = list(tiles)
+        self.primary.invalidate(tiles)
+        for field in self.fields.values():
+            field.invalidate(tiles)
+
+    # --- Primary field ---
+
+    def get_direction(self, tile_x: int, tile_y: int) -> Optional[Tuple[float, float]]:
+        return self.primary.get_direction(tile_x, tile_y)
+
+    def get_distance(self, tile_x: int, tile_y: int) -> Optional[int]:
+        return self.primary.get_distance(tile_x, tile_y)
+
+    def direction_codes(self) -> array:
+        return self.primary.direction_codes()
@@ -0,0 +1,234 @@
+import heapq
+import math
+from typing import Callable, Dict, List, Optional, Tuple
+import pygame
+from constants import PROJECTILE_POOL_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Projectile hits a zombie whose center is within this distance (~14px)
+HIT_RADIUS = math.sqrt(200)
+# A projectile is spent once it is this close to where it was aimed (10px)
+ARRIVE_DIST_SQ = 100.0
+
+PROJECTILE_COLOR = (255, 255, 100)
+SHELL_COLOR = (80, 75, 70)  # Splash projectiles
+
+
+class ProjectilePool:
+    """Projectiles kept in parallel preallocated lists, indexed by slot.
+
+    Firing takes a slot from the free list and landing gives it back, so
+    a fight creates no objects. Live slots are packed in ``active``
+    (swap-removed on release) so a tick only visits projectiles in flight.
+
+    Two ways to resolve hits:
+    - collision: every tick each projectile moves and hits the first zombie
+      within HIT_RADIUS, or fizzles when it reaches the point it was aimed at
+    - analytic: the flight time to the target is worked out when firing and
+      the damage lands on that target when it is up; in between the
+      projectile is only drawn, at the position its flight time implies
+
+    A projectile with a splash radius damages every zombie within it of the
+    hit, found with one radius query on the zombie grid, and also bursts
+    where it was aimed if it reaches that point without hitting anything."""
+
+    def __init__(self, capacity: int = PROJECTILE_POOL_SIZE, analytic: bool = False):
+        self.analytic = analytic
+        self.time = 0.0
+        self.capacity = 0
+        # Per slot: position (the launch point in analytic mode), velocity,
+        # aim point, damage, splash radius in px, launch time and target
+        # (analytic mode only)
+        self.x: List[float] = []
+        self.y: List[float] = []
+        self.vx: List[float] = []
+        self.vy: List[float] = []
+        self.aim_x: List[float] = []
+        self.aim_y: List[float] = []
+        self.damage: List[int] = []
+        self.splash: List[float] = []
+        self.fired_at: List[float] = []
+        self.target: List[Optional[object]] = []
+        self.active: List[int] = []
+        self._where: List[int] = []  # slot -> index in active
+        self._free: List[int] = []
+        self._impacts: List[Tuple[float, int, int]] = []  # (time, sequence, slot) heap
+        self._sequence = 0
+        # Called with the position and radius of every splash hit
+        self.on_splash: Optional[Callable[[float, float, float], None]] = None
+        self._grow(capacity)
+
+    def __len__(self) -> int:
+        return len(self.active)
+
+    def _grow(self, capacity: int):
+        extra = capacity - self.capacity
+        for values in (self.x, self.y, self.vx, self.vy, self.aim_x, self.aim_y,
+                       self.splash, self.fired_at):
+            values.extend([0.0] * extra)
+        self.damage.extend([0] * extra)
+        self.target.extend([None] * extra)
+        self._where.extend([-1] * extra)
+        # Lowest slots are handed out first
+        self._free.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def clear(self):
+        for slot in self.active:
+            self.target[slot] = None
+            self._where[slot] = -1
+        self._free.extend(reversed(self.active))
+        self.active.clear()
+        self._impacts.clear()
+
+    # --- Firing and landing ---
+
+    def fire(self, x: float, y: float, target, speed: float, damage: int,
+             splash: float = 0.0) -> int:
+        """Launch a projectile from x, y at the target's current center. Returns the slot."""
+        if not self._free:
+            self._grow(self.capacity * 2)
+        slot = self._free.pop()
+        tx, ty = target.center
+        dx = tx - x
+        dy = ty - y
+        dist = math.sqrt(dx * dx + dy * dy)
+
+        self.x[slot] = x
+        self.y[slot] = y
+        self.aim_x[slot] = tx
+        self.aim_y[slot] = ty
+        self.vx[slot] = dx / dist * speed if dist > 0 else 0.0
+        self.vy[slot] = dy / dist * speed if dist > 0 else 0.0
+        self.damage[slot] = damage
+        self.splash[slot] = splash
+        self.fired_at[slot] = self.time
+        self._where[slot] = len(self.active)
+        self.active.append(slot)
+
+        if self.analytic:
+            self.target[slot] = target
+            self._sequence += 1
+            heapq.heappush(self._impacts, (self.time + dist / speed, self._sequence, slot))
+        elif dist == 0:
+            self.release(slot)
+        return slot
+
+    def insert(self, x: float, y: float, vx: float, vy: float, aim_x: float, aim_y: float,
+               damage: int, splash: float, fired_at: float, target=None,
+               impact_at: Optional[float] = None, sequence: int = 0) -> int:
+        """Put back a projectile exactly as ``scheduled`` and the slot lists described it."""
+        if not self._free:
+            self._grow(self.capacity * 2)
+        slot = self._free.pop()
+        self.x[slot] = x
+        self.y[slot] = y
+        self.vx[slot] = vx
+        self.vy[slot] = vy
+        self.aim_x[slot] = aim_x
+        self.aim_y[slot] = aim_y
+        self.damage[slot] = damage
+        self.splash[slot] = splash
+        self.fired_at[slot] = fired_at
+        self.target[slot] = target
+        self._where[slot] = len(self.active)
+        self.active.append(slot)
+        if impact_at is not None:
+            self._sequence = max(self._sequence, sequence)
+            heapq.heappush(self._impacts, (impact_at, sequence, slot))
+        return slot
+
+    def scheduled(self) -> Dict[int, Tuple[float, int]]:
+        """Slot -> (impact time, sequence) for every scheduled (analytic) impact."""
+        return {slot: (when, sequence) for when, sequence, slot in self._impacts}
+
+    def _hit(self, slot: int, x: float, y: float, zombie, zombie_grid):
+        """Apply a projectile's damage at (x, y), where it struck ``zombie`` (or nothing)."""
+        damage = self.damage[slot]
+        radius = self.splash[slot]
+        if radius > 0 and zombie_grid is not None:
+            for other in zombie_grid.query_radius(x, y, radius):
+                other.take_damage(damage)
+            if self.on_splash:
+                self.on_splash(x, y, radius)
+        elif zombie is not None and zombie.alive:
+            zombie.take_damage(damage)
+
+    def release(self, slot: int):
+        active = self.active
+        index = self._where[slot]
+        last = active.pop()
+        if last != slot:
+            active[index] = last
+            self._where[last] = index
+        self._where[slot] = -1
+        self.target[slot] = None
+        self._free.append(slot)
+
+    # --- Update ---
+
+    def update(self, dt: float, zombie_grid=None):
+        self.time += dt
+        if self.analytic:
+            self._land_due(zombie_grid)
+        else:
+            self._move_and_collide(dt, zombie_grid)
+
+    def _land_due(self, zombie_grid):
+        impacts = self._impacts
+        now = self.time
+        while impacts and impacts[0][0] <= now:
+            _, _, slot = heapq.heappop(impacts)
+            target = self.target[slot]
+            if target is not None and target.alive:
+                tx, ty = target.center
+                self._hit(slot, tx, ty, target, zombie_grid)
+            elif self.splash[slot] > 0:
+                self._hit(slot, self.aim_x[slot], self.aim_y[slot], None, zombie_grid)
+            self.release(slot)
+
+    def _move_and_collide(self, dt: float, zombie_grid):
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        aim_x, aim_y = self.aim_x, self.aim_y
+        first_within = zombie_grid.first_within if zombie_grid is not None else None
+        active = self.active
+        # Backwards, so a swap-remove only moves already visited slots
+        for i in range(len(active) - 1, -1, -1):
+            slot = active[i]
+            px = x[slot] + vx[slot] * dt
+            py = y[slot] + vy[slot] * dt
+            x[slot] = px
+            y[slot] = py
+
+            dx = aim_x[slot] - px
+            dy = aim_y[slot] - py
+            if dx * dx + dy * dy < ARRIVE_DIST_SQ:
+                if self.splash[slot] > 0:
+                    self._hit(slot, aim_x[slot], aim_y[slot], None, zombie_grid)
+                self.release(slot)
+                continue
+
+            if first_within is not None:
+                zombie = first_within(px, py, HIT_RADIUS)
+                if zombie:
+                    self._hit(slot, px, py, zombie, zombie_grid)
+                    self.release(slot)
+
+    # --- Drawing ---
+
+    def position(self, slot: int) -> Tuple[float, float]:
+        if self.analytic:
+            age = self.time - self.fired_at[slot]
+            return self.x[slot] + self.vx[slot] * age, self.y[slot] + self.vy[slot] * age
+        return self.x[slot], self.y[slot]
+
+    def draw(self, surface: pygame.Surface, camera):
+        position = self.position
+        splash = self.splash
+        for slot in self.active:
+            px, py = position(slot)
+            sx, sy = camera.world_to_screen(px, py)
+            if -5 <= sx < SCREEN_WIDTH + 5 and -5 <= sy < SCREEN_HEIGHT + 5:
+                if splash[slot] > 0:
+                    pygame.draw.circle(surface, SHELL_COLOR, (int(sx), int(sy)), 5)
+                else:
+                    pygame.draw.circle(surface, PROJECTILE_COLOR, (int(sx), int(sy)), 3)
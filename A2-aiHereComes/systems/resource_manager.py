@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 
 class ResourceManager:
@@ -50,3 +50,9 @@ class ResourceManager:
 
     def add_population_cap(self, bonus: int):
         self.max_population += bonus
+
+    def values(self) -> Tuple:
+        """Every amount, cap and population count as one tuple, which
+        compares equal for as long as none of them changes."""
+        return (tuple(self.resources.items()), tuple(self.resource_caps.items()),
+                self.population, self.max_population)
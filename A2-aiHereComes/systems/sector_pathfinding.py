@@ -0,0 +1,400 @@
+import heapq
+from array import array
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from constants import PATH_BREAK_COST, PATH_SECTOR_SIZE, USE_COST_FIELD
+from systems.pathfinding import (DIRECTIONS, OPPOSITE, DIR_NONE, DIR_GOAL, UNREACHABLE,
+                                 DIRECTION_VECTORS, _PATH_COST_BY_ID, goal_key)
+
+# Direction codes of the straight steps across a sector border
+_EAST, _WEST, _SOUTH, _NORTH = (DIRECTIONS.index(d) for d in [(1, 0), (-1, 0), (0, 1), (0, -1)])
+
+Region = Tuple[int, int]  # (sector index, region number within the sector)
+
+
+class Sector:
+    """One square of the map: step costs and connected regions (both
+    snapshotted when it was last labelled), and the seeds its fine flow
+    field was last built from (None: not built)."""
+
+    __slots__ = ("index", "x0", "y0", "width", "height", "cost", "labels",
+                 "regions", "seeds", "version")
+
+    def __init__(self, index: int, x0: int, y0: int, width: int, height: int):
+        self.index = index
+        self.x0 = x0
+        self.y0 = y0
+        self.width = width
+        self.height = height
+        self.cost: Optional[array] = None  # Local step costs (0: impassable), row-major
+        self.labels: Optional[array] = None  # Local region numbers (-1: impassable)
+        self.regions: List[Tuple[float, float, float]] = []  # Centroid x, y and mean cost
+        self.seeds: Optional[tuple] = None
+        self.version = -1  # Coarse version the seeds were checked against
+
+
+class SectorPathfinder:
+    """Hierarchical flow fields for large maps.
+
+    The map is cut into ``sector_size`` squares. Each sector is split into
+    regions (its 4-connected passable tiles), and regions touching across a
+    sector border are linked with a cost estimated from their centroids
+    and mean step cost. A Dijkstra over that coarse graph from the goal
+    regions gives every region a coarse distance. A sector's fine flow
+    field is built only when a zombie stands in it (``prepare`` or
+    ``get_direction``): a Dijkstra inside the sector, seeded at the goal
+    tiles and at border crossings into regions with a lower coarse
+    distance, so zombies always move downhill at the coarse level.
+
+    ``invalidate`` relabels just the sectors holding the changed tiles and
+    reruns the small coarse search. A fine field is rebuilt only when its
+    seeds changed relative to its own regions, so a wall placed far away
+    does not touch it. Step costs follow CostField when ``weighted`` (as
+    Pathfinder does), else every walkable tile costs the same. Answers
+    ``get_direction`` and ``direction_codes`` like Pathfinder; directions of
+    sectors without a fine field read as DIR_NONE."""
+
+    def __init__(self, game_map, sector_size: int = PATH_SECTOR_SIZE,
+                 weighted: bool = USE_COST_FIELD):
+        self.game_map = game_map
+        self.width = game_map.width
+        self.height = game_map.height
+        self.sector_size = sector_size
+        self.weighted = weighted
+        self.cols = (self.width + sector_size - 1) // sector_size
+        self.rows = (self.height + sector_size - 1) // sector_size
+        self.sectors: List[Sector] = []
+        for sy in range(self.rows):
+            for sx in range(self.cols):
+                x0, y0 = sx * sector_size, sy * sector_size
+                self.sectors.append(Sector(len(self.sectors), x0, y0,
+                                           min(sector_size, self.width - x0),
+                                           min(sector_size, self.height - y0)))
+        self.direction = array('b', [DIR_NONE]) * (self.width * self.height)
+        self.goals: FrozenSet[int] = frozenset()
+
+        # Coarse level
+        self.graph: Dict[Region, Dict[Region, int]] = {}
+        self.coarse: Dict[Region, int] = {}
+        self.coarse_version = 0
+        self._dirty: Set[int] = set(range(len(self.sectors)))  # Sectors to relabel
+        self._coarse_dirty = True
+
+    def set_goal(self, tile_x: int, tile_y: int):
+        self.set_goals([(tile_x, tile_y)])
+
+    def set_goals(self, goals: Iterable[Tuple[int, int]]):
+        key = goal_key(self.width, self.height, goals)
+        if key == self.goals:
+            return
+        # Goal tiles are costed differently (no break cost), so their sectors change too
+        self._dirty.update(self._sector_of(i) for i in self.goals | key)
+        self.goals = key
+
+    def invalidate(self, tiles: Optional[Iterable[Tuple[int, int]]] = None):
+        """Mark the sectors holding ``tiles`` (or every sector) stale."""
+        if tiles is None:
+            self._dirty.update(range(len(self.sectors)))
+            return
+        for tx, ty in tiles:
+            if 0 <= tx < self.width and 0 <= ty < self.height:
+                self._dirty.add(self._sector_of(ty * self.width + tx))
+
+    def _sector_of(self, i: int) -> int:
+        y, x = divmod(i, self.width)
+        return (y // self.sector_size) * self.cols + x // self.sector_size
+
+    # --- Queries ---
+
+    def prepare(self, tiles: Iterable[Tuple[int, int]]):
+        """Bring the fine fields of the sectors holding ``tiles`` up to date."""
+        self._refresh()
+        size = self.sector_size
+        needed = {(ty // size) * self.cols + tx // size for tx, ty in tiles
+                  if 0 <= tx < self.width and 0 <= ty < self.height}
+        for s in sorted(needed):
+            self._ensure_field(self.sectors[s])
+
+    def get_direction(self, tile_x: int, tile_y: int) -> Optional[Tuple[float, float]]:
+        if not (0 <= tile_x < self.width and 0 <= tile_y < self.height):
+            return None
+        self._refresh()
+        i = tile_y * self.width + tile_x
+        self._ensure_field(self.sectors[self._sector_of(i)])
+        code = self.direction[i]
+        if code == DIR_NONE:
+            return None
+        return DIRECTION_VECTORS[code]
+
+    def direction_codes(self) -> array:
+        """Per-tile direction codes; only sectors passed to ``prepare`` (or
+        queried) since the last change are filled in."""
+        self._refresh()
+        return self.direction
+
+    # --- Coarse level ---
+
+    def _refresh(self):
+        if self._dirty:
+            dirty = sorted(self._dirty)
+            self._dirty.clear()
+            for s in dirty:
+                self._unlink(self.sectors[s])
+            for s in dirty:
+                self._label(self.sectors[s])
+            linked = set()
+            for s in dirty:
+                for nb in self._neighbor_sectors(self.sectors[s]):
+                    nb.version = -1  # Its crossings into s may have changed
+                    pair = (min(s, nb.index), max(s, nb.index))
+                    if pair not in linked:
+                        linked.add(pair)
+                        self._link(self.sectors[pair[0]], self.sectors[pair[1]])
+            self._coarse_dirty = True
+        if self._coarse_dirty:
+            self._coarse_dirty = False
+            self._compute_coarse()
+
+    def _tile_costs(self, sector: Sector) -> array:
+        game_map = self.game_map
+        w = self.width
+        cost = array('i')
+        for y in range(sector.y0, sector.y0 + sector.height):
+            start = y * w + sector.x0
+            end = start + sector.width
+            row = list(game_map.terrain[start:end].translate(_PATH_COST_BY_ID))
+            ids = game_map.building_ids[start:end]
+            if any(ids):
+                for j, building_id in enumerate(ids):
+                    if not building_id or not row[j] or start + j in self.goals:
+                        continue
+                    if self.weighted:
+                        row[j] += int(game_map.buildings[building_id].hp * PATH_BREAK_COST)
+                    else:
+                        row[j] = 0
+            if not self.weighted:
+                row = [10 if c else 0 for c in row]
+            cost.extend(row)
+        return cost
+
+    def _label(self, sector: Sector):
+        """Snapshot the sector's costs and flood-fill its regions."""
+        cost = self._tile_costs(sector)
+        sw, sh = sector.width, sector.height
+        labels = array('i', [-1]) * (sw * sh)
+        regions = []
+        for start in range(sw * sh):
+            if labels[start] != -1 or not cost[start]:
+                continue
+            number = len(regions)
+            labels[start] = number
+            stack = [start]
+            count = total = sum_x = sum_y = 0
+            while stack:
+                c = stack.pop()
+                cy, cx = divmod(c, sw)
+                count += 1
+                total += cost[c]
+                sum_x += cx
+                sum_y += cy
+                for n, ok in ((c - 1, cx > 0), (c + 1, cx < sw - 1),
+                              (c - sw, cy > 0), (c + sw, cy < sh - 1)):
+                    if ok and labels[n] == -1 and cost[n]:
+                        labels[n] = number
+                        stack.append(n)
+            regions.append((sector.x0 + sum_x / count, sector.y0 + sum_y / count,
+                            total / count))
+        sector.cost = cost
+        sector.labels = labels
+        sector.regions = regions
+        sector.seeds = None
+        # Until its fine field is rebuilt, the sector has no directions
+        w = self.width
+        for y in range(sector.y0, sector.y0 + sector.height):
+            start = y * w + sector.x0
+            self.direction[start:start + sector.width] = array('b', [DIR_NONE]) * sector.width
+        for number in range(len(regions)):
+            self.graph[(sector.index, number)] = {}
+
+    def _unlink(self, sector: Sector):
+        """Drop the sector's regions and their coarse edges."""
+        for number in range(len(sector.regions)):
+            region = (sector.index, number)
+            for nb in self.graph.pop(region, {}):
+                self.graph.get(nb, {}).pop(region, None)
+        sector.regions = []
+        sector.seeds = None
+
+    def _neighbor_sectors(self, sector: Sector) -> List[Sector]:
+        sx, sy = sector.index % self.cols, sector.index // self.cols
+        result = []
+        for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            nx, ny = sx + dx, sy + dy
+            if 0 <= nx < self.cols and 0 <= ny < self.rows:
+                result.append(self.sectors[ny * self.cols + nx])
+        return result
+
+    def _crossings(self, a: Sector, b: Sector):
+        """Yield (local tile in a, local tile in b, direction code a -> b) for
+        each straight step across the border between two adjacent sectors."""
+        if b.x0 == a.x0 + a.width:
+            for y in range(max(a.y0, b.y0), min(a.y0 + a.height, b.y0 + b.height)):
+                yield (y - a.y0) * a.width + a.width - 1, (y - b.y0) * b.width, _EAST
+        elif a.x0 == b.x0 + b.width:
+            for y in range(max(a.y0, b.y0), min(a.y0 + a.height, b.y0 + b.height)):
+                yield (y - a.y0) * a.width, (y - b.y0) * b.width + b.width - 1, _WEST
+        elif b.y0 == a.y0 + a.height:
+            for x in range(max(a.x0, b.x0), min(a.x0 + a.width, b.x0 + b.width)):
+                yield (a.height - 1) * a.width + x - a.x0, x - b.x0, _SOUTH
+        else:
+            for x in range(max(a.x0, b.x0), min(a.x0 + a.width, b.x0 + b.width)):
+                yield x - a.x0, (b.height - 1) * b.width + x - b.x0, _NORTH
+
+    def _link(self, a: Sector, b: Sector):
+        """Add coarse edges between the regions of a and b that touch."""
+        pairs = set()
+        for la, lb, _ in self._crossings(a, b):
+            ra, rb = a.labels[la], b.labels[lb]
+            if ra != -1 and rb != -1:
+                pairs.add((ra, rb))
+        for ra, rb in pairs:
+            ax, ay, a_cost = a.regions[ra]
+            bx, by, b_cost = b.regions[rb]
+            dx, dy = abs(ax - bx), abs(ay - by)
+            steps = max(dx, dy) + 0.4 * min(dx, dy)  # Octile distance in tiles
+            weight = max(1, int(steps * (a_cost + b_cost) / 2))
+            self.graph[(a.index, ra)][(b.index, rb)] = weight
+            self.graph[(b.index, rb)][(a.index, ra)] = weight
+
+    def _compute_coarse(self):
+        """Dijkstra over the region graph from the regions holding a goal."""
+        coarse: Dict[Region, int] = {}
+        heap = []
+        for i in self.goals:
+            sector = self.sectors[self._sector_of(i)]
+            y, x = divmod(i, self.width)
+            number = sector.labels[(y - sector.y0) * sector.width + x - sector.x0]
+            if number != -1:
+                heap.append((0, (sector.index, number)))
+        heapq.heapify(heap)
+        while heap:
+            d, region = heapq.heappop(heap)
+            if region in coarse:
+                continue
+            coarse[region] = d
+            for nb, weight in self.graph[region].items():
+                if nb not in coarse:
+                    heapq.heappush(heap, (d + weight, nb))
+        previous = self.coarse
+        self.coarse = coarse
+        self.coarse_version += 1
+
+        # A built field whose regions, and its neighbours' regions, all moved
+        # by the same amount keeps its seeds, so it need not be rechecked
+        for sector in self.sectors:
+            if sector.seeds is None or sector.version == -1:
+                continue
+            shifts = set()
+            for other in [sector] + self._neighbor_sectors(sector):
+                for number in range(len(other.regions)):
+                    before = previous.get((other.index, number))
+                    after = coarse.get((other.index, number))
+                    if before is None and after is None:
+                        continue
+                    if before is None or after is None:
+                        shifts.add(None)
+                        shifts.add(0)
+                    else:
+                        shifts.add(after - before)
+            if len(shifts) <= 1:
+                sector.version = self.coarse_version
+
+    # --- Fine level ---
+
+    def _seeds(self, sector: Sector) -> tuple:
+        """The fine field's seeds: (local tile, direction code, value relative
+        to the tile's own region). Relative values only change when the
+        routes out of this sector change, not when everything beyond
+        shifts by the same amount."""
+        coarse = self.coarse
+        seeds = []
+        w = self.width
+        for i in sorted(self.goals):
+            y, x = divmod(i, w)
+            if sector.x0 <= x < sector.x0 + sector.width and sector.y0 <= y < sector.y0 + sector.height:
+                seeds.append(((y - sector.y0) * sector.width + x - sector.x0, DIR_GOAL, 0))
+        for nb in self._neighbor_sectors(sector):
+            for la, lb, code in self._crossings(sector, nb):
+                ra, rb = sector.labels[la], nb.labels[lb]
+                if ra == -1 or rb == -1:
+                    continue
+                own = coarse.get((sector.index, ra))
+                beyond = coarse.get((nb.index, rb))
+                if own is None or beyond is None or beyond >= own:
+                    continue
+                seeds.append((la, code, beyond + nb.cost[lb] - own))
+        return tuple(seeds)
+
+    def _ensure_field(self, sector: Sector):
+        if sector.version == self.coarse_version and sector.seeds is not None:
+            return
+        sector.version = self.coarse_version
+        seeds = self._seeds(sector)
+        if seeds != sector.seeds:
+            sector.seeds = seeds
+            self._build_field(sector, seeds)
+
+    def _build_field(self, sector: Sector, seeds: tuple):
+        """Dijkstra inside the sector from its seeds; writes ``direction``."""
+        sw, sh = sector.width, sector.height
+        cost, labels = sector.cost, sector.labels
+        walk = self.game_map.walkable
+        w = self.width
+        base = sector.y0 * w + sector.x0
+        size = sw * sh
+        dist = array('i', [UNREACHABLE]) * size
+        dirn = array('b', [DIR_NONE]) * size
+
+        # Seed values are relative to their region, so lift them back to a
+        # common scale with the region's coarse distance
+        heap = []
+        for local, code, value in seeds:
+            if code != DIR_GOAL:
+                value += self.coarse[(sector.index, labels[local])]
+            if value < dist[local]:
+                dist[local] = value
+                dirn[local] = code
+                heap.append((value, local))
+        heapq.heapify(heap)
+
+        steps = [(dx, dy, dy * sw + dx, OPPOSITE[k]) for k, (dx, dy) in enumerate(DIRECTIONS)]
+        while heap:
+            d, c = heapq.heappop(heap)
+            if d > dist[c]:
+                continue
+            cy, cx = divmod(c, sw)
+            straight = d + cost[c]
+            diagonal = d + cost[c] * 14 // 10
+            g = base + cy * w + cx  # Global index of c
+            for dx, dy, offset, back in steps:
+                nx, ny = cx + dx, cy + dy
+                if nx < 0 or ny < 0 or nx >= sw or ny >= sh:
+                    continue
+                n = c + offset
+                if not cost[n]:
+                    continue
+                if dx != 0 and dy != 0:
+                    nd = diagonal
+                    if nd >= dist[n] or not walk[g + dx] or not walk[g + dy * w]:
+                        continue
+                else:
+                    nd = straight
+                    if nd >= dist[n]:
+                        continue
+                dist[n] = nd
+                dirn[n] = back
+                heapq.heappush(heap, (nd, n))
+
+        direction = self.direction
+        for row in range(sh):
+            start = base + row * w
+            direction[start:start + sw] = dirn[row * sw:(row + 1) * sw]
@@ -0,0 +1,109 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from constants import TILE_SIZE
+
+
+class SpatialGrid:
+    """Uniform grid that buckets entities by the cell their center falls in.
+    Rebuilt once per tick, then answers radius and point queries by visiting
+    only the cells that overlap the query area."""
+
+    def __init__(self, cell_size: int = TILE_SIZE):
+        self.cell_size = cell_size
+        # (cell_x, cell_y) -> [(entity, center_x, center_y), ...]
+        self.cells: Dict[Tuple[int, int], List[Tuple[object, float, float]]] = {}
+        self.max_half_size = 0.0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def rebuild(self, entities: Iterable):
+        """Re-bucket all live entities at their current positions."""
+        cells: Dict[Tuple[int, int], List[Tuple[object, float, float]]] = {}
+        cs = self.cell_size
+        max_size = 0
+        count = 0
+        for e in entities:
+            if not e.alive:
+                continue
+            cx = e.x + e.width / 2
+            cy = e.y + e.height / 2
+            key = (int(cx // cs), int(cy // cs))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [(e, cx, cy)]
+            else:
+                bucket.append((e, cx, cy))
+            if e.width > max_size:
+                max_size = e.width
+            if e.height > max_size:
+                max_size = e.height
+            count += 1
+        self.cells = cells
+        self.max_half_size = max_size / 2
+        self.count = count
+
+    def _buckets(self, x: float, y: float, reach: float):
+        """Yield the buckets of every cell overlapping the square x/y +- reach."""
+        cells = self.cells
+        if not cells:
+            return
+        cs = self.cell_size
+        x0, x1 = int((x - reach) // cs), int((x + reach) // cs)
+        y0, y1 = int((y - reach) // cs), int((y + reach) // cs)
+        if len(cells) < (x1 - x0 + 1) * (y1 - y0 + 1):
+            # Sparse grid: scanning the occupied cells is cheaper than probing
+            for (cx, cy), bucket in cells.items():
+                if x0 <= cx <= x1 and y0 <= cy <= y1:
+                    yield bucket
+            return
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield bucket
+
+    def query_radius(self, x: float, y: float, radius: float) -> List:
+        """All live entities whose center is strictly within radius of (x, y)."""
+        r2 = radius * radius
+        found = []
+        for bucket in self._buckets(x, y, radius):
+            for e, ex, ey in bucket:
+                dx = ex - x
+                dy = ey - y
+                if dx * dx + dy * dy < r2 and e.alive:
+                    found.append(e)
+        return found
+
+    def first_within(self, x: float, y: float, radius: float):
+        """Any one live entity whose center is within radius of (x, y), or None."""
+        r2 = radius * radius
+        for bucket in self._buckets(x, y, radius):
+            for e, ex, ey in bucket:
+                dx = ex - x
+                dy = ey - y
+                if dx * dx + dy * dy < r2 and e.alive:
+                    return e
+        return None
+
+    def nearest(self, x: float, y: float, radius: float):
+        """The live entity with the closest center within radius, or None."""
+        best = None
+        best_d2 = radius * radius
+        for bucket in self._buckets(x, y, radius):
+            for e, ex, ey in bucket:
+                dx = ex - x
+                dy = ey - y
+                d2 = dx * dx + dy * dy
+                if d2 < best_d2 and e.alive:
+                    best = e
+                    best_d2 = d2
+        return best
+
+    def query_point(self, x: float, y: float) -> Optional[object]:
+        """A live entity whose rect contains the point, or None."""
+        for bucket in self._buckets(x, y, self.max_half_size):
+            for e, _, _ in bucket:
+                if e.alive and e.rect.collidepoint(x, y):
+                    return e
+        return None
@@ -1,9 +1,8 @@
-import json
-import os
 import random
 from enum import Enum, auto
 from typing import Dict, List, Tuple, Optional
 from constants import MAP_WIDTH, MAP_HEIGHT, TILE_SIZE
+from systems.data_registry import registry
 
 
 class WaveState(Enum):
@@ -13,7 +12,8 @@ class WaveState(Enum):
 
 
 class WaveManager:
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng or random.Random()
         self.current_wave = 0
         self.state = WaveState.PREP
         self.prep_timer = 120.0
@@ -22,15 +22,22 @@ class WaveManager:
         self.zombies_alive = 0
         self.total_zombies_killed = 0
 
-        # Load wave data
-        data_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'waves.json')
-        with open(data_path, 'r') as f:
-            self.data = json.load(f)
+    # Wave data is read through the registry so hot-reloaded tables apply mid-game
+    @property
+    def wave_definitions(self):
+        return registry.waves().waves
 
-        self.wave_definitions = self.data["waves"]
-        self.scaling = self.data["scaling"]
-        self.spawn_interval = self.data["spawn_interval"]
-        self.max_waves = self.data["max_waves"]
+    @property
+    def scaling(self):
+        return registry.waves().scaling
+
+    @property
+    def spawn_interval(self) -> float:
+        return registry.waves().spawn_interval
+
+    @property
+    def max_waves(self) -> int:
+        return registry.waves().max_waves
 
     def start_next_wave(self):
         self.current_wave += 1
@@ -42,7 +49,7 @@ class WaveManager:
         for zombie_type, count in wave_def["zombies"].items():
             for _ in range(count):
                 self.spawn_queue.append(zombie_type)
-        random.shuffle(self.spawn_queue)
+        self.rng.shuffle(self.spawn_queue)
 
         self.spawn_timer = 0.0
         self.zombies_alive = len(self.spawn_queue)
@@ -90,17 +97,18 @@ class WaveManager:
         dmg_mult = 1.0 + self.scaling["damage_multiplier_per_wave"] * (self.current_wave - 1)
         return hp_mult, dmg_mult
 
-    def get_spawn_point(self) -> Tuple[float, float]:
-        """Get a random spawn point on the map edge."""
-        side = random.choice(["top", "bottom", "left", "right"])
+    def get_spawn_point(self, rng: Optional[random.Random] = None) -> Tuple[float, float]:
+        """Get a random spawn point on the map edge (drawn from ``rng``, default the wave stream)."""
+        rng = rng or self.rng
+        side = rng.choice(["top", "bottom", "left", "right"])
         if side == "top":
-            return random.uniform(0, MAP_WIDTH * TILE_SIZE), 0
+            return rng.uniform(0, MAP_WIDTH * TILE_SIZE), 0
         elif side == "bottom":
-            return random.uniform(0, MAP_WIDTH * TILE_SIZE), (MAP_HEIGHT - 1) * TILE_SIZE
+            return rng.uniform(0, MAP_WIDTH * TILE_SIZE), (MAP_HEIGHT - 1) * TILE_SIZE
         elif side == "left":
-            return 0, random.uniform(0, MAP_HEIGHT * TILE_SIZE)
+            return 0, rng.uniform(0, MAP_HEIGHT * TILE_SIZE)
         else:
-            return (MAP_WIDTH - 1) * TILE_SIZE, random.uniform(0, MAP_HEIGHT * TILE_SIZE)
+            return (MAP_WIDTH - 1) * TILE_SIZE, rng.uniform(0, MAP_HEIGHT * TILE_SIZE)
 
     def update(self, dt: float) -> List[Tuple[str, float, float]]:
         """Update wave state. Returns list of (zombie_type, x, y) for zombies to spawn."""
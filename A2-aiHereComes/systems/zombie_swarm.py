@@ -0,0 +1,276 @@
+from typing import Dict, List, Optional, Tuple
+from constants import TILE_SIZE
+from entities.zombie import Zombie
+from systems.pathfinding import DIR_GOAL, DIRECTION_VECTORS
+
+try:
+    import numpy as np
+except ImportError:  # Optional backend; Game keeps plain Zombie objects without it
+    np = None
+
+
+def _slot_property(name: str, cast):
+    """Property that reads/writes one element of a ZombieSwarm array."""
+    def fget(self):
+        return cast(getattr(self.swarm, name)[self.slot])
+
+    def fset(self, value):
+        getattr(self.swarm, name)[self.slot] = value
+
+    return property(fget, fset)
+
+
+class SwarmZombie(Zombie):
+    """Zombie-compatible view of one ZombieSwarm slot.
+    Lets UI, picking, combat and drawing code treat swarm zombies like
+    regular ones; all state is read from and written to the swarm arrays."""
+
+    def __init__(self, swarm: "ZombieSwarm", slot: int):
+        # Zombie.__init__ is skipped on purpose: the swarm owns the state
+        self.swarm = swarm
+        self.slot = slot
+        self.generation = int(swarm.generation[slot])
+        self.zombie_type = swarm.types[swarm.type_index[slot]]
+        self.color = swarm.type_colors[self.zombie_type]
+        self.target_building = None
+
+    x = _slot_property('x', float)
+    y = _slot_property('y', float)
+    width = _slot_property('size', int)
+    height = _slot_property('size', int)
+    hp = _slot_property('hp', int)
+    max_hp = _slot_property('max_hp', int)
+    speed = _slot_property('speed', float)
+    damage = _slot_property('damage', int)
+    attack_rate = _slot_property('attack_rate', float)
+    attack_timer = _slot_property('attack_timer', float)
+    goal_x = _slot_property('goal_x', float)
+    goal_y = _slot_property('goal_y', float)
+
+    @property
+    def alive(self) -> bool:
+        # A recycled slot belongs to another zombie; this one is gone
+        if self.swarm.generation[self.slot] != self.generation:
+            return False
+        return bool(self.swarm.alive[self.slot])
+
+    @alive.setter
+    def alive(self, value: bool):
+        if self.swarm.generation[self.slot] == self.generation:
+            self.swarm.alive[self.slot] = value
+
+
+class ZombieSwarm:
+    """Struct-of-arrays zombie store (requires numpy).
+
+    Positions, velocities, hp, speed, damage and attack timers live in
+    NumPy arrays indexed by slot, and ``update`` advances the whole horde
+    in one vectorized step. Iterating yields SwarmZombie views, so the
+    swarm can stand in for the ``Game.zombies`` list."""
+
+    FLOAT_FIELDS = ('x', 'y', 'vx', 'vy', 'size', 'hp', 'max_hp', 'speed', 'damage',
+                    'attack_rate', 'attack_timer', 'goal_x', 'goal_y')
+
+    def __init__(self, game_map, capacity: int = 256, seed: Optional[int] = None):
+        self.game_map = game_map
+        self.rng = np.random.default_rng(seed)
+        self.capacity = 0
+        self.count = 0
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.zeros(0))
+        self.alive = np.zeros(0, dtype=bool)
+        self.occupied = np.zeros(0, dtype=bool)
+        self.type_index = np.zeros(0, dtype=np.int8)
+        self.generation = np.zeros(0, dtype=np.int32)
+        self.types: List[str] = []
+        self.type_colors: Dict[str, tuple] = {}
+        self._free: List[int] = []
+        self._views: List[Optional[SwarmZombie]] = []
+
+        # Direction code -> unit vector; row 0 is DIR_NONE so codes index at +1
+        self._vectors = np.array([(0.0, 0.0)] + DIRECTION_VECTORS)
+        self._grow(capacity)
+
+    @staticmethod
+    def available() -> bool:
+        return np is not None
+
+    def _grow(self, capacity: int):
+        old = self.capacity
+        extra = capacity - old
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.concatenate([getattr(self, name), np.zeros(extra)]))
+        self.alive = np.concatenate([self.alive, np.zeros(extra, dtype=bool)])
+        self.occupied = np.concatenate([self.occupied, np.zeros(extra, dtype=bool)])
+        self.type_index = np.concatenate([self.type_index, np.zeros(extra, dtype=np.int8)])
+        self.generation = np.concatenate([self.generation, np.zeros(extra, dtype=np.int32)])
+        self._views.extend([None] * extra)
+        # Lowest slots are handed out first
+        self._free.extend(range(capacity - 1, old - 1, -1))
+        self.capacity = capacity
+
+    # --- List-like interface used by Game ---
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        for slot in np.flatnonzero(self.occupied):
+            yield self.view(int(slot))
+
+    def append(self, zombie: Zombie) -> SwarmZombie:
+        """Copy a freshly created Zombie into a free slot."""
+        if not self._free:
+            self._grow(max(256, self.capacity * 2))
+        slot = self._free.pop()
+
+        if zombie.zombie_type not in self.type_colors:
+            self.types.append(zombie.zombie_type)
+            self.type_colors[zombie.zombie_type] = zombie.color
+        self.type_index[slot] = self.types.index(zombie.zombie_type)
+
+        self.x[slot] = zombie.x
+        self.y[slot] = zombie.y
+        self.vx[slot] = 0.0
+        self.vy[slot] = 0.0
+        self.size[slot] = zombie.width
+        self.hp[slot] = zombie.hp
+        self.max_hp[slot] = zombie.max_hp
+        self.speed[slot] = zombie.speed
+        self.damage[slot] = zombie.damage
+        self.attack_rate[slot] = zombie.attack_rate
+        self.attack_timer[slot] = zombie.attack_timer
+        self.goal_x[slot] = zombie.goal_x
+        self.goal_y[slot] = zombie.goal_y
+        self.alive[slot] = zombie.alive
+        self.occupied[slot] = True
+        self.generation[slot] += 1
+        self._views[slot] = None
+        self.count += 1
+        return self.view(slot)
+
+    def view(self, slot: int) -> SwarmZombie:
+        view = self._views[slot]
+        if view is None:
+            view = SwarmZombie(self, slot)
+            self._views[slot] = view
+        return view
+
+    def tiles(self) -> List[Tuple[int, int]]:
+        """The tile under the center of every live zombie."""
+        idx = np.flatnonzero(self.occupied & self.alive)
+        half = self.size[idx] / 2
+        tx = ((self.x[idx] + half) // TILE_SIZE).astype(np.int64)
+        ty = ((self.y[idx] + half) // TILE_SIZE).astype(np.int64)
+        return list(zip(tx.tolist(), ty.tolist()))
+
+    def table(self, names) -> Tuple[List[str], "np.ndarray"]:
+        """Type names and a copy of the named arrays, one row per occupied
+        slot in iteration order (the snapshot's zombie table)."""
+        slots = np.flatnonzero(self.occupied)
+        types = [self.types[i] for i in self.type_index[slots].tolist()]
+        return types, np.column_stack([getattr(self, name)[slots] for name in names])
+
+    def row(self, zombie: SwarmZombie) -> int:
+        """Position of a view in iteration order, -1 once it left the swarm."""
+        slot = zombie.slot
+        if not self.occupied[slot] or self._views[slot] is not zombie:
+            return -1
+        return int(np.count_nonzero(self.occupied[:slot]))
+
+    def remove_dead(self):
+        """Free the slots of dead zombies (the list-comprehension filter)."""
+        dead = np.flatnonzero(self.occupied & ~self.alive)
+        if dead.size == 0:
+            return
+        self.occupied[dead] = False
+        for slot in dead.tolist():
+            self._views[slot] = None
+            self._free.append(slot)
+        self.count -= dead.size
+
+    # --- Simulation ---
+
+    def update(self, dt: float, pathfinder=None, game_map=None, buildings=None):
+        """Vectorized equivalent of Zombie.update for every live zombie."""
+        active = np.flatnonzero(self.occupied & self.alive)
+        if active.size == 0:
+            return
+        self.attack_timer[active] -= dt
+
+        game_map = game_map or self.game_map
+        if buildings:
+            attacking = self._attack(active, game_map, buildings)
+            active = active[~attacking]
+        self._move(active, dt, pathfinder)
+
+    def _attack(self, idx, game_map, buildings):
+        """Let zombies next to a building hit it. Returns the attacking mask."""
+        # Only zombies within 2 tiles of some building footprint can be in reach
+        near = np.zeros((game_map.height, game_map.width), dtype=bool)
+        for b in buildings:
+            if b.alive:
+                near[max(0, b.tile_y - 2):b.tile_y + b.tile_height + 2,
+                     max(0, b.tile_x - 2):b.tile_x + b.tile_width + 2] = True
+
+        half = self.size[idx] / 2
+        cx = self.x[idx] + half
+        cy = self.y[idx] + half
+        tx = np.clip((cx // TILE_SIZE).astype(np.int64), 0, game_map.width - 1)
+        ty = np.clip((cy // TILE_SIZE).astype(np.int64), 0, game_map.height - 1)
+
+        attacking = np.zeros(idx.size, dtype=bool)
+        for i in np.flatnonzero(near[ty, tx]).tolist():
+            building = game_map.nearest_building(cx[i], cy[i], TILE_SIZE * 1.2)
+            if building is None:
+                continue
+            attacking[i] = True
+            slot = idx[i]
+            if self.attack_timer[slot] <= 0:
+                building.take_damage(int(self.damage[slot]))
+                self.attack_timer[slot] = 1.0 / self.attack_rate[slot]
+        return attacking
+
+    def _move(self, idx, dt: float, pathfinder):
+        if idx.size == 0:
+            return
+        size = self.size[idx]
+        x = self.x[idx]
+        y = self.y[idx]
+        cx = x + size / 2
+        cy = y + size / 2
+        speed = self.speed[idx]
+
+        # Flow field gather by tile index
+        codes = np.full(idx.size, -1, dtype=np.int64)
+        if pathfinder is not None:
+            field = np.frombuffer(pathfinder.direction_codes(), dtype=np.int8)
+            w, h = pathfinder.width, pathfinder.height
+            tx = np.floor(cx / TILE_SIZE).astype(np.int64)
+            ty = np.floor(cy / TILE_SIZE).astype(np.int64)
+            inside = (tx >= 0) & (tx < w) & (ty >= 0) & (ty < h)
+            codes[inside] = field[ty[inside] * w + tx[inside]]
+        flowing = (codes >= 0) & (codes < DIR_GOAL)
+        vec = self._vectors[codes + 1]
+        vx = vec[:, 0] * speed
+        vy = vec[:, 1] * speed
+
+        # Fallback: move directly toward the goal
+        direct = ~flowing
+        if direct.any():
+            gx = self.goal_x[idx[direct]] - cx[direct]
+            gy = self.goal_y[idx[direct]] - cy[direct]
+            dist = np.hypot(gx, gy)
+            scale = np.where(dist > 5, speed[direct] / np.maximum(dist, 1e-9), 0.0)
+            vx[direct] = gx * scale
+            vy[direct] = gy * scale
+
+        self.vx[idx] = vx
+        self.vy[idx] = vy
+
+        # Small random jitter to avoid stacking, then keep the horde on the map
+        jitter = self.rng.uniform(-3, 3, (2, idx.size)) * dt
+        max_x = self.game_map.width * TILE_SIZE - size
+        max_y = self.game_map.height * TILE_SIZE - size
+        self.x[idx] = np.clip(x + vx * dt + jitter[0], 0, max_x)
+        self.y[idx] = np.clip(y + vy * dt + jitter[1], 0, max_y)
@@ -1,6 +1,7 @@
 from typing import Dict, List, Callable, Optional
 import pygame
-from constants import Color, SCREEN_WIDTH, TILE_SIZE, get_font
+from constants import Color, SCREEN_WIDTH, TILE_SIZE
+from rendering.text import get_font, render_text
 from ui.button import Button
 
 
@@ -35,6 +36,8 @@ class BuildPanel:
         # Category tab state
         self.tab_font = get_font(14)
         self.repair_font = get_font(14)
+        self.info_font = get_font(18)
+        self.desc_font = get_font(16)
 
         # Create building buttons (all, show/hide by category)
         self.buttons: Dict[str, Button] = {}
@@ -75,7 +78,7 @@ class BuildPanel:
             tab_y = self._panel_y + 3
             tab_x = 10
             for i, (cat_name, _) in enumerate(self.CATEGORIES):
-                tab_w = self.tab_font.render(cat_name, True, Color.UI_TEXT).get_width() + 16
+                tab_w = render_text(self.tab_font, cat_name, Color.UI_TEXT).get_width() + 16
                 tab_rect = pygame.Rect(tab_x, tab_y, tab_w, 18)
                 if tab_rect.collidepoint(mx, my):
                     self.active_category = i
@@ -113,7 +116,7 @@ class BuildPanel:
         tab_y = panel_y + 3
         tab_x = 10
         for i, (cat_name, _) in enumerate(self.CATEGORIES):
-            tab_text = self.tab_font.render(cat_name, True, Color.UI_TEXT)
+            tab_text = render_text(self.tab_font, cat_name, Color.UI_TEXT)
             tab_w = tab_text.get_width() + 16
             tab_rect = pygame.Rect(tab_x, tab_y, tab_w, 18)
 
@@ -131,7 +134,7 @@ class BuildPanel:
         repair_rect = pygame.Rect(repair_x, tab_y, 88, 18)
         pygame.draw.rect(surface, (80, 130, 80), repair_rect)
         pygame.draw.rect(surface, (100, 160, 100), repair_rect, 1)
-        repair_text = self.repair_font.render("修复全部", True, Color.UI_TEXT)
+        repair_text = render_text(self.repair_font, "修复全部", Color.UI_TEXT)
         surface.blit(repair_text,
                      (repair_x + repair_rect.width // 2 - repair_text.get_width() // 2,
                       tab_y + 2))
@@ -152,8 +155,8 @@ class BuildPanel:
         # === Selected building info (right side) ===
         if self.selected and self.selected in self.BUILDING_INFO:
             info = self.BUILDING_INFO[self.selected]
-            font = get_font(18)
-            desc_font = get_font(16)
+            font = self.info_font
+            desc_font = self.desc_font
 
             preview_x = SCREEN_WIDTH - 200
             preview_y = panel_y + 24
@@ -162,13 +165,13 @@ class BuildPanel:
             pygame.draw.rect(surface, info[2], (preview_x, preview_y, 16, 16))
             pygame.draw.rect(surface, Color.UI_BORDER, (preview_x, preview_y, 16, 16), 1)
 
-            name_surf = font.render(info[0], True, Color.UI_TEXT)
+            name_surf = render_text(font, info[0], Color.UI_TEXT)
             surface.blit(name_surf, (preview_x + 22, preview_y))
 
             # Cost
-            cost_surf = font.render(f"费用: {info[1]}", True, (200, 200, 150))
+            cost_surf = render_text(font, f"费用: {info[1]}", (200, 200, 150))
             surface.blit(cost_surf, (preview_x, preview_y + 20))
 
             # Description
-            desc_surf = desc_font.render(info[3], True, Color.GRAY)
+            desc_surf = render_text(desc_font, info[3], Color.GRAY)
             surface.blit(desc_surf, (preview_x, preview_y + 38))
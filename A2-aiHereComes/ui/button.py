@@ -1,6 +1,7 @@
 import pygame
 from typing import Optional, Callable
-from constants import Color, get_font
+from constants import Color
+from rendering.text import get_font, render_text
 
 
 class Button:
@@ -41,6 +42,6 @@ class Button:
         pygame.draw.rect(surface, Color.UI_BORDER, self.rect, 1)
 
         text_color = Color.UI_TEXT if self.enabled else Color.GRAY
-        text_surf = self.font.render(self.text, True, text_color)
+        text_surf = render_text(self.font, self.text, text_color)
         text_rect = text_surf.get_rect(center=self.rect.center)
         surface.blit(text_surf, text_rect)
@@ -1,9 +1,11 @@
 from typing import Optional, Callable
 import pygame
-from constants import Color, TILE_SIZE, get_font
+from constants import Color, TILE_SIZE
 from entities.building import Building
 from entities.zombie import Zombie
 from entities.buildings.tower import Tower
+from rendering.layers import layers
+from rendering.text import get_font, render_text
 
 RESOURCE_CN = {
     "wood": "木材", "stone": "石头", "gold": "金币", "food": "食物",
@@ -14,6 +16,13 @@ ZOMBIE_CN = {
 }
 
 
+def _range_painter(r: int):
+    def paint(surf: pygame.Surface):
+        pygame.draw.circle(surf, (100, 150, 255, 40), (r, r), r)
+        pygame.draw.circle(surf, (100, 150, 255, 100), (r, r), r, 1)
+    return paint
+
+
 class InfoPanel:
     def __init__(self):
         self.visible = False
@@ -74,16 +83,15 @@ class InfoPanel:
                 lines.append((f"攻击: {entity.attack_damage}", self.font, Color.UI_TEXT))
                 lines.append((f"射程: {entity.attack_range} 格", self.font, Color.UI_TEXT))
                 lines.append((f"攻速: {entity.attack_speed}/秒", self.font, Color.UI_TEXT))
+                if entity.splash_radius > 0:
+                    lines.append((f"溅射: {entity.splash_radius} 格", self.font, Color.UI_TEXT))
 
                 # Draw range circle on map
                 range_px = entity.attack_range * TILE_SIZE
                 cx, cy = entity.center
                 sx, sy = camera.world_to_screen(cx, cy)
-                range_surf = pygame.Surface((int(range_px * 2), int(range_px * 2)), pygame.SRCALPHA)
-                pygame.draw.circle(range_surf, (100, 150, 255, 40),
-                                   (int(range_px), int(range_px)), int(range_px))
-                pygame.draw.circle(range_surf, (100, 150, 255, 100),
-                                   (int(range_px), int(range_px)), int(range_px), 1)
+                r = int(range_px)
+                range_surf = layers.get(("range", r), (r * 2, r * 2), _range_painter(r))
                 surface.blit(range_surf, (int(sx - range_px), int(sy - range_px)))
 
             if hasattr(entity, 'production'):
@@ -121,14 +129,12 @@ class InfoPanel:
 
         # Draw panel
         panel_rect = pygame.Rect(x, y, w, h)
-        bg = pygame.Surface((w, h), pygame.SRCALPHA)
-        bg.fill((*Color.UI_BG, 220))
-        surface.blit(bg, (x, y))
+        surface.blit(layers.fill((w, h), (*Color.UI_BG, 220)), (x, y))
         pygame.draw.rect(surface, Color.UI_BORDER, panel_rect, 1)
 
         # Draw lines
         for i, (text, font, color) in enumerate(lines):
-            text_surf = font.render(text, True, color)
+            text_surf = render_text(font, text, color)
             surface.blit(text_surf, (x + 8, y + 8 + i * 22))
 
         # Draw upgrade button
@@ -141,7 +147,7 @@ class InfoPanel:
             pygame.draw.rect(surface, (60, 120, 60), btn_rect)
             pygame.draw.rect(surface, (80, 160, 80), btn_rect, 1)
 
-            btn_text = self.btn_font.render(f"↑ 升级 ({cost_str})", True, Color.UI_TEXT)
+            btn_text = render_text(self.btn_font, f"↑ 升级 ({cost_str})", Color.UI_TEXT)
             surface.blit(btn_text,
                          (btn_rect.x + btn_rect.width // 2 - btn_text.get_width() // 2,
                           btn_rect.y + 4))
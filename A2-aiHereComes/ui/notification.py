@@ -1,6 +1,8 @@
 from typing import List, Tuple
 import pygame
-from constants import Color, get_font
+from constants import Color
+from rendering.layers import layers
+from rendering.text import get_font, render_text
 
 
 class Notification:
@@ -29,14 +31,12 @@ class NotificationManager:
         y = 50
         for n in self.notifications:
             alpha = min(1.0, n.duration / (n.max_duration * 0.3))
-            text_surf = self.font.render(n.text, True, n.color)
+            text_surf = render_text(self.font, n.text, n.color)
 
             # Background
             bg_rect = text_surf.get_rect(centerx=screen_width // 2, y=y)
             bg_rect.inflate_ip(20, 10)
-            bg = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-            bg.fill((*Color.UI_BG, int(200 * alpha)))
-            surface.blit(bg, bg_rect)
+            surface.blit(layers.fill(bg_rect.size, (*Color.UI_BG, 200), int(255 * alpha)), bg_rect)
 
             # Text
             text_rect = text_surf.get_rect(centerx=screen_width // 2, y=y + 5)
@@ -0,0 +1,101 @@
+import pygame
+from constants import Color, FPS, SCREEN_WIDTH
+from rendering.layers import layers
+from rendering.text import get_font
+from core.profiler import FrameProfiler
+
+STAGE_COLORS = [
+    (230, 80, 80), (240, 160, 60), (230, 220, 80), (120, 210, 90),
+    (70, 190, 190), (80, 140, 240), (160, 110, 240), (230, 110, 200),
+    (200, 200, 200), (150, 100, 60), (90, 150, 90), (110, 110, 170),
+    (250, 200, 160), (160, 220, 250),
+]
+
+
+class ProfilerOverlay:
+    """Stacked frame-time graph plus per-stage averages for a FrameProfiler.
+
+    The graph scrolls by one column per recorded frame, so only the newest
+    column is drawn each frame; the legend, which also lists the average of
+    each tracked counter per frame, is repainted a few times a second."""
+
+    GRAPH_HEIGHT = 120
+    GRAPH_MS = 2000.0 / FPS  # Full graph height: two frame budgets
+    LEGEND_INTERVAL = 500  # ms
+
+    def __init__(self, profiler: FrameProfiler):
+        self.profiler = profiler
+        self.font = get_font(14)
+        self.width = profiler.capacity
+        self.graph = pygame.Surface((self.width, self.GRAPH_HEIGHT))
+        self.graph.fill(Color.UI_BG)
+        self.legend = None
+        self._drawn = 0  # profiler.recorded at the last draw
+        self._next_legend = 0
+
+    def _stage_color(self, stage: str):
+        return STAGE_COLORS[self.profiler.stages.index(stage) % len(STAGE_COLORS)]
+
+    def _draw_column(self, frame):
+        scale = self.GRAPH_HEIGHT / self.GRAPH_MS
+        x = self.width - 1
+        y = self.GRAPH_HEIGHT
+        self.graph.fill(Color.UI_BG, (x, 0, 1, self.GRAPH_HEIGHT))
+        for stage in self.profiler.stages:
+            ms = frame.get(stage, 0.0)
+            h = ms * scale
+            if h <= 0:
+                continue
+            top = max(0, int(y - h))
+            self.graph.fill(self._stage_color(stage), (x, top, 1, max(1, int(y) - top)))
+            y -= h
+            if y <= 0:
+                break
+
+    def _build_legend(self) -> pygame.Surface:
+        averages = self.profiler.averages()
+        total = sum(averages.values())
+        lines = [(f"total {total:.2f}ms", Color.WHITE)]
+        lines += [(f"{s} {ms:.2f}ms", self._stage_color(s)) for s, ms in averages.items()]
+        lines += [(f"{name} {n:.1f}/frame", Color.GRAY)
+                  for name, n in self.profiler.count_averages().items()]
+        line_h = self.font.get_linesize()
+
+        def paint(legend: pygame.Surface):
+            legend.fill((*Color.UI_BG, 200))
+            for i, (label, color) in enumerate(lines):
+                y = 2 + i * line_h
+                pygame.draw.rect(legend, color, (4, y + line_h // 2 - 4, 8, 8))
+                text = self.font.render(label, True, Color.UI_TEXT)
+                legend.blit(text, (16, y))
+
+        # Repainted in place, so the overlay does not add to the allocations it shows
+        return layers.get("profiler legend", (150, line_h * len(lines) + 4), paint,
+                          self._next_legend)
+
+    def draw(self, surface: pygame.Surface):
+        profiler = self.profiler
+        if not profiler.enabled:
+            return
+
+        # Scroll in every frame recorded since the last draw
+        new = min(profiler.recorded - self._drawn, profiler.count)
+        if new > 0:
+            frames = profiler.recent()
+            for frame in frames[len(frames) - new:]:
+                self.graph.scroll(-1, 0)
+                self._draw_column(frame)
+        self._drawn = profiler.recorded
+
+        x = SCREEN_WIDTH - self.width - 160
+        y = 40
+        surface.blit(self.graph, (x, y))
+        budget_y = y + self.GRAPH_HEIGHT - int(self.GRAPH_HEIGHT * (1000.0 / FPS) / self.GRAPH_MS)
+        pygame.draw.line(surface, (255, 255, 255), (x, budget_y), (x + self.width - 1, budget_y))
+        pygame.draw.rect(surface, Color.UI_BORDER, (x - 1, y - 1, self.width + 2, self.GRAPH_HEIGHT + 2), 1)
+
+        now = pygame.time.get_ticks()
+        if self.legend is None or now >= self._next_legend:
+            self._next_legend = now + self.LEGEND_INTERVAL
+            self.legend = self._build_legend()
+        surface.blit(self.legend, (x + self.width + 6, y))
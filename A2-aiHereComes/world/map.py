@@ -1,29 +1,134 @@
-from typing import List, Optional, Tuple
-from constants import MAP_WIDTH, MAP_HEIGHT
+from array import array
+from typing import Dict, List, Optional, Tuple
+from constants import (MAP_WIDTH, MAP_HEIGHT, TILE_SIZE, TerrainType,
+                       TERRAIN_WALKABLE, TERRAIN_BUILDABLE)
 from world.tile import Tile
-from constants import TerrainType
+
+# Terrain id (the byte stored per tile) -> TerrainType
+TERRAIN_TYPES: List[TerrainType] = list(TerrainType)
+TERRAIN_IDS: Dict[TerrainType, int] = {t: i for i, t in enumerate(TERRAIN_TYPES)}
+
+# Terrain id -> 1/0, padded to 256 entries for bytes.translate
+_WALKABLE_BY_ID = bytes(1 if TERRAIN_WALKABLE.get(t, True) else 0
+                        for t in TERRAIN_TYPES).ljust(256, b'\0')
+_BUILDABLE_BY_ID = bytes(1 if TERRAIN_BUILDABLE.get(t, False) else 0
+                         for t in TERRAIN_TYPES).ljust(256, b'\0')
 
 
 class GameMap:
+    """The tile grid, stored as flat arrays indexed ``y * width + x``.
+
+    ``terrain`` holds a terrain id per tile (see TERRAIN_TYPES) and
+    ``building_ids`` the id of the building on it (0 for none; ``buildings``
+    maps ids back to objects). ``walkable`` and ``buildable`` are derived
+    from both and kept up to date by ``set_terrain``, ``place_building``
+    and ``remove_building``, so bulk readers can copy or scan them
+    directly. ``get_tile`` returns a Tile view for code that wants one
+    cell at a time."""
+
     def __init__(self, width: int = MAP_WIDTH, height: int = MAP_HEIGHT):
         self.width = width
         self.height = height
-        self.tiles: List[List[Tile]] = []
-        for y in range(height):
-            row = []
-            for x in range(width):
-                row.append(Tile(x, y, TerrainType.GRASS))
-            self.tiles.append(row)
+        size = width * height
+        grass = TERRAIN_IDS[TerrainType.GRASS]
+        self.terrain = bytearray([grass]) * size
+        self.walkable = bytearray([_WALKABLE_BY_ID[grass]]) * size
+        self.buildable = bytearray([_BUILDABLE_BY_ID[grass]]) * size
+        self.building_ids = array('i', [0]) * size
+        self.buildings: List[object] = [None]  # Building id -> building; id 0 is "none"
+        self._building_id: Dict[object, int] = {}
+        self._free_ids: List[int] = []
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
 
     def get_tile(self, x: int, y: int) -> Optional[Tile]:
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.tiles[y][x]
+            return Tile(self, x, y)
+        return None
+
+    # --- Terrain ---
+
+    def terrain_at_index(self, index: int) -> TerrainType:
+        return TERRAIN_TYPES[self.terrain[index]]
+
+    def get_terrain(self, x: int, y: int) -> Optional[TerrainType]:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return TERRAIN_TYPES[self.terrain[y * self.width + x]]
         return None
 
     def set_terrain(self, x: int, y: int, terrain: TerrainType):
-        tile = self.get_tile(x, y)
-        if tile:
-            tile.terrain = terrain
+        if 0 <= x < self.width and 0 <= y < self.height:
+            i = y * self.width + x
+            tid = TERRAIN_IDS[terrain]
+            self.terrain[i] = tid
+            if not self.building_ids[i]:
+                self.walkable[i] = _WALKABLE_BY_ID[tid]
+                self.buildable[i] = _BUILDABLE_BY_ID[tid]
+
+    def load_terrain(self, terrain: bytes):
+        """Replace the whole terrain with one id per tile, row by row."""
+        if len(terrain) != len(self.terrain):
+            raise ValueError(f"terrain has {len(terrain)} tiles, the map {len(self.terrain)}")
+        self.terrain[:] = terrain
+        self._rebuild_masks()
+
+    def _rebuild_masks(self):
+        self.walkable[:] = self.terrain.translate(_WALKABLE_BY_ID)
+        self.buildable[:] = self.terrain.translate(_BUILDABLE_BY_ID)
+        for building in self._building_id:
+            self.place_building(building)
+
+    # --- Buildings ---
+
+    def building_at_index(self, index: int):
+        return self.buildings[self.building_ids[index]]
+
+    def building_at(self, x: int, y: int):
+        """The building on a tile, or None (also off the map)."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.buildings[self.building_ids[y * self.width + x]]
+        return None
+
+    def is_buildable(self, x: int, y: int) -> bool:
+        """Terrain allows building and no building is there yet."""
+        return 0 <= x < self.width and 0 <= y < self.height \
+            and bool(self.buildable[y * self.width + x])
+
+    def place_building(self, building):
+        """Mark the building's footprint (the on-map part of it) as occupied."""
+        bid = self._building_id.get(building)
+        if bid is None:
+            if self._free_ids:
+                bid = self._free_ids.pop()
+                self.buildings[bid] = building
+            else:
+                bid = len(self.buildings)
+                self.buildings.append(building)
+            self._building_id[building] = bid
+        for tx, ty in building.get_occupied_tiles():
+            if 0 <= tx < self.width and 0 <= ty < self.height:
+                i = ty * self.width + tx
+                self.building_ids[i] = bid
+                self.walkable[i] = 0
+                self.buildable[i] = 0
+
+    def remove_building(self, building):
+        bid = self._building_id.pop(building, None)
+        if bid is None:
+            return
+        for tx, ty in building.get_occupied_tiles():
+            if 0 <= tx < self.width and 0 <= ty < self.height:
+                i = ty * self.width + tx
+                if self.building_ids[i] == bid:
+                    self.building_ids[i] = 0
+                    tid = self.terrain[i]
+                    self.walkable[i] = _WALKABLE_BY_ID[tid]
+                    self.buildable[i] = _BUILDABLE_BY_ID[tid]
+        self.buildings[bid] = None
+        self._free_ids.append(bid)
+
+    # --- Queries ---
 
     def get_neighbors(self, x: int, y: int) -> List[Tuple[int, int]]:
         neighbors = []
@@ -32,3 +137,32 @@ class GameMap:
             if 0 <= nx < self.width and 0 <= ny < self.height:
                 neighbors.append((nx, ny))
         return neighbors
+
+    def nearest_building(self, wx: float, wy: float, radius: float):
+        """Nearest live building whose center is within radius (world pixels).
+        Only probes the tiles under the search circle's bounding box, so the
+        cost does not depend on how many buildings exist."""
+        x0 = max(0, int((wx - radius) // TILE_SIZE))
+        y0 = max(0, int((wy - radius) // TILE_SIZE))
+        x1 = min(self.width - 1, int((wx + radius) // TILE_SIZE))
+        y1 = min(self.height - 1, int((wy + radius) // TILE_SIZE))
+
+        ids = self.building_ids
+        buildings = self.buildings
+        best = None
+        best_d2 = radius * radius
+        for y in range(y0, y1 + 1):
+            base = y * self.width
+            for bid in ids[base + x0:base + x1 + 1]:
+                if not bid:
+                    continue
+                building = buildings[bid]
+                if not building.alive:
+                    continue
+                dx = building.x + building.width / 2 - wx
+                dy = building.y + building.height / 2 - wy
+                d2 = dx * dx + dy * dy
+                if d2 < best_d2:
+                    best = building
+                    best_d2 = d2
+        return best
@@ -1,35 +1,68 @@
 import random
-import math
-from typing import Optional, Tuple
-from constants import MAP_WIDTH, MAP_HEIGHT, TerrainType
-from world.map import GameMap
+from typing import List, Optional, Tuple
+from constants import MAP_WIDTH, MAP_HEIGHT, TerrainType, USE_NUMPY_MAP_GENERATOR
+from world.map import GameMap, TERRAIN_IDS
+
+try:
+    import numpy as np
+except ImportError:  # Optional backend; the random-walk generator needs nothing
+    np = None
 
 
 class MapGenerator:
-    """Procedural map generator using simple noise-like clustering."""
+    """Procedural map generator using simple noise-like clustering.
+
+    Terrain patches are random walks that also paint some of the tiles
+    around each step. Cluster counts are per 200x200 tiles and scale with
+    the map area, so larger maps keep the same look. With ``vectorized``
+    (needs numpy) all walks of a terrain type are generated and painted at
+    once with array operations; the patches look the same, but the map
+    for a given seed differs from the tile-by-tile generator's."""
+
+    # (terrain, clusters per CLUSTER_AREA tiles, (min, max) walk length), painted in order
+    CLUSTERS: List[Tuple[TerrainType, int, Tuple[int, int]]] = [
+        (TerrainType.GRASS_DARK, 25, (15, 40)),
+        (TerrainType.FOREST, 20, (8, 25)),
+        (TerrainType.DIRT, 15, (10, 30)),
+        (TerrainType.STONE, 12, (6, 20)),
+        (TerrainType.WATER, 8, (5, 15)),
+    ]
+    CLUSTER_AREA = 200 * 200
+    FILL_CHANCE = 0.4  # Chance to paint each tile around a walk step
+    START_AREA_RADIUS = 7  # Cleared (2r+1)x(2r+1) square at the center
 
-    def __init__(self, seed: Optional[int] = None):
+    def __init__(self, seed: Optional[int] = None, vectorized: Optional[bool] = None):
+        self.seed = seed
         self.rng = random.Random(seed)
+        if vectorized is None:
+            vectorized = USE_NUMPY_MAP_GENERATOR
+        self.vectorized = vectorized and self.available()
+
+    @staticmethod
+    def available() -> bool:
+        """True if the vectorized generator can run."""
+        return np is not None
+
+    def _cluster_count(self, count: int, width: int, height: int) -> int:
+        return max(1, round(count * width * height / self.CLUSTER_AREA))
 
     def generate(self, width: int = MAP_WIDTH, height: int = MAP_HEIGHT) -> GameMap:
-        game_map = GameMap(width, height)
+        if self.vectorized:
+            return self._generate_vectorized(width, height)
 
-        # Step 1: Fill with grass
-        for y in range(height):
-            for x in range(width):
-                game_map.set_terrain(x, y, TerrainType.GRASS)
+        # The map starts as grass
+        game_map = GameMap(width, height)
 
-        # Step 2: Scatter terrain patches using random walk clusters
-        self._place_clusters(game_map, TerrainType.GRASS_DARK, 25, (15, 40))
-        self._place_clusters(game_map, TerrainType.FOREST, 20, (8, 25))
-        self._place_clusters(game_map, TerrainType.DIRT, 15, (10, 30))
-        self._place_clusters(game_map, TerrainType.STONE, 12, (6, 20))
-        self._place_clusters(game_map, TerrainType.WATER, 8, (5, 15))
+        # Scatter terrain patches using random walk clusters
+        for terrain, count, size_range in self.CLUSTERS:
+            self._place_clusters(game_map, terrain, self._cluster_count(count, width, height),
+                                 size_range)
 
-        # Step 3: Clear starting area (center, 15x15 tiles)
+        # Clear starting area
         cx, cy = width // 2, height // 2
-        for dy in range(-7, 8):
-            for dx in range(-7, 8):
+        r = self.START_AREA_RADIUS
+        for dy in range(-r, r + 1):
+            for dx in range(-r, r + 1):
                 game_map.set_terrain(cx + dx, cy + dy, TerrainType.GRASS)
 
         return game_map
@@ -56,5 +89,49 @@ class MapGenerator:
                     for dx in range(-1, 2):
                         nx, ny = x + dx, y + dy
                         if (0 <= nx < game_map.width and 0 <= ny < game_map.height
-                                and self.rng.random() < 0.4):
+                                and self.rng.random() < self.FILL_CHANCE):
                             game_map.set_terrain(nx, ny, terrain)
+
+    # --- Vectorized ---
+
+    def _generate_vectorized(self, width: int, height: int) -> GameMap:
+        rng = np.random.default_rng(self.seed)
+        terrain = np.full((height, width), TERRAIN_IDS[TerrainType.GRASS], dtype=np.uint8)
+
+        for kind, count, (min_size, max_size) in self.CLUSTERS:
+            n = self._cluster_count(count, width, height)
+            sizes = rng.integers(min_size, max_size + 1, n)
+
+            # Every walk as a row of steps; steps past a walk's length are masked out.
+            # Positions are clamped after summing rather than per step, which
+            # only makes the rare walk that hits the edge slide along it.
+            start_x = rng.integers(0, width, n)
+            start_y = rng.integers(0, height, n)
+            moves = rng.integers(-1, 2, (2, n, max_size))
+            xs = np.clip(start_x[:, None] + np.cumsum(moves[0], axis=1), 0, width - 1)
+            ys = np.clip(start_y[:, None] + np.cumsum(moves[1], axis=1), 0, height - 1)
+            steps = np.arange(max_size)[None, :] < sizes[:, None]
+
+            # A step paints the tile it leaves (the start, then each position
+            # but the last) and some of the 3x3 tiles around where it lands
+            prev_x = np.concatenate([start_x[:, None], xs[:, :-1]], axis=1)[steps]
+            prev_y = np.concatenate([start_y[:, None], ys[:, :-1]], axis=1)[steps]
+            xs, ys = xs[steps], ys[steps]
+            paint_x, paint_y = [prev_x], [prev_y]
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    keep = rng.random(xs.size) < self.FILL_CHANCE
+                    px, py = xs[keep] + dx, ys[keep] + dy
+                    inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+                    paint_x.append(px[inside])
+                    paint_y.append(py[inside])
+            terrain[np.concatenate(paint_y), np.concatenate(paint_x)] = TERRAIN_IDS[kind]
+
+        cx, cy = width // 2, height // 2
+        r = self.START_AREA_RADIUS
+        terrain[max(0, cy - r):cy + r + 1, max(0, cx - r):cx + r + 1] = \
+            TERRAIN_IDS[TerrainType.GRASS]
+
+        game_map = GameMap(width, height)
+        game_map.load_terrain(terrain.tobytes())
+        return game_map
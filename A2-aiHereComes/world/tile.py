@@ -1,24 +1,36 @@
-from constants import TerrainType, TERRAIN_WALKABLE, TERRAIN_BUILDABLE
+from constants import TerrainType
 
 
 class Tile:
-    __slots__ = ('x', 'y', 'terrain', 'building', 'resource_node')
+    """View of one GameMap cell (see ``GameMap.get_tile``).
 
-    def __init__(self, x: int, y: int, terrain: TerrainType = TerrainType.GRASS):
+    The map keeps its state in flat arrays; a Tile reads them on access,
+    so it always reflects the current map. Change the map through the
+    GameMap methods."""
+    __slots__ = ('game_map', 'x', 'y', 'index')
+
+    def __init__(self, game_map, x: int, y: int):
+        self.game_map = game_map
         self.x = x
         self.y = y
-        self.terrain = terrain
-        self.building = None
-        self.resource_node = None
+        self.index = y * game_map.width + x
+
+    @property
+    def terrain(self) -> TerrainType:
+        return self.game_map.terrain_at_index(self.index)
+
+    @terrain.setter
+    def terrain(self, terrain: TerrainType):
+        self.game_map.set_terrain(self.x, self.y, terrain)
+
+    @property
+    def building(self):
+        return self.game_map.building_at_index(self.index)
 
     @property
     def walkable(self) -> bool:
-        if self.building is not None:
-            return False
-        return TERRAIN_WALKABLE.get(self.terrain, True)
+        return bool(self.game_map.walkable[self.index])
 
     @property
     def buildable(self) -> bool:
-        if self.building is not None:
-            return False
-        return TERRAIN_BUILDABLE.get(self.terrain, False)
+        return bool(self.game_map.buildable[self.index])